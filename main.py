@@ -8,6 +8,14 @@
 4. Запуск основного игрового цикла
 5. Обработку ошибок и корректное завершение работы
 
+Переменная окружения AI_PLAYER (white или black) включает игру против компьютера
+за указанный цвет.
+
+Переменная окружения FRAME_PROFILE включает замер времени этапов кадра и
+оверлей со статистикой (клавиша F3). Если ее значение - путь к файлу .csv
+или .json, при выходе туда сохраняется трасса кадров; любое другое непустое
+значение (например, 1) включает только оверлей.
+
 Зависимости:
     - pygame: графическая библиотека
     - python-dotenv: загрузка переменных окружения
@@ -63,6 +71,10 @@ print("=" * 50)
 
 from src.graphics import CheckersGUI
 from src.database import db_manager
+from src.result_writer import AsyncResultWriter
+from src.ai import AIPlayer
+from src.enums import Player
+from src.profiler import FrameProfiler
 
 
 def main():
@@ -78,6 +90,8 @@ def main():
         Использует конструкцию try-except-finally для гарантированного
         закрытия соединений с БД и PyGame.
     """
+    # результаты партий сохраняются в фоновом потоке, чтобы не тормозить отрисовку
+    result_writer = AsyncResultWriter(db_manager)
     try:
         # Пытаемся подключиться к базе данных
         try:
@@ -86,15 +100,33 @@ def main():
             print(f"Не удалось подключиться к базе данных: {db_error}")
             print("Игра будет работать без сохранения статистики")
 
+        # Компьютерный соперник, если он задан в окружении
+        ai_player = None
+        ai_color = (os.getenv('AI_PLAYER') or '').lower()
+        if ai_color in ('white', 'black'):
+            ai_player = AIPlayer(Player.WHITE if ai_color == 'white' else Player.BLACK)
+            print(f"Компьютер играет за: {ai_color}")
+
+        # Профилировщик кадров, если он включен в окружении
+        profiler = None
+        frame_profile = os.getenv('FRAME_PROFILE') or ''
+        if frame_profile:
+            trace_path = frame_profile if frame_profile.lower().endswith(('.csv', '.json')) else None
+            profiler = FrameProfiler(trace_path=trace_path)
+            print(f"Профилировщик кадров включен, трасса: {trace_path or 'не сохраняется'}")
+
         pygame.init()
         pygame.font.init()
-        gui = CheckersGUI()
+        gui = CheckersGUI(ai_player, result_sink=result_writer, profiler=profiler)
         gui.run()
     except Exception as e:
         print(f"Ошибка при запуске игры: {e}")
         import traceback
         traceback.print_exc()
     finally:
+        # дописываем результаты, ожидающие сохранения, до закрытия соединения
+        if not result_writer.close(timeout=10):
+            print("Не все результаты игр успели сохраниться")
         db_manager.close()
         pygame.quit()
         sys.exit()
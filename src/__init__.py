@@ -5,13 +5,29 @@
 логикой игры, базой данных и утилитами.
 
 Модули:
+- ai.py: Компьютерный соперник (альфа-бета поиск)
+- bitboard.py: Битбордовое представление позиции и быстрый генератор ходов
+- connection_pool.py: Потокобезопасный пул соединений с базой данных
 - constants.py: Константы и настройки игры
 - database.py: Работа с базой данных для сохранения статистики
+- dirty_rects.py: Отслеживание изменившихся областей экрана
 - enums.py: Перечисления (цвета, типы фигур)
+- frame_pacing.py: Адаптивный темп кадров и ожидание событий
 - game_logic.py: Основная логика игры и правил
 - graphics.py: Графический интерфейс на PyGame
 - models.py: Классы данных (фигуры, доска, игроки)
+- move_record.py: Компактная двоичная запись партии и ее воспроизведение
+- pdn.py: Импорт и экспорт партий в формате PDN
+- perft.py: Подсчет позиций дерева ходов (проверка и замер генераторов)
+- profiler.py: Замер времени этапов кадра и трасса кадров
+- position.py: Строковая запись позиции (FEN) и ее разбор
+- renderer.py: Отрисовка шашек на PyGame
+- result_writer.py: Фоновое сохранение результатов игр
+- surface_cache.py: Кэш заранее отрисованных поверхностей
+- text_cache.py: Кэш шрифтов и отрисованных надписей
+- transposition.py: Таблица транспозиций для поиска
 - utils.py: Вспомогательные функции
+- zobrist.py: Хеширование позиций по Зобристу
 
 
 Авторы: Матвеев, Мисюченко, Жданова, Овчинникова, Бубнов
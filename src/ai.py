@@ -0,0 +1,328 @@
+"""
+Модуль компьютерного соперника.
+
+Реализует игрока-компьютер для русских шашек. Поиск ведется по битбордовым
+позициям (BitboardPosition), правила которых совпадают с CheckersGame.
+
+Основные возможности:
+    1. Поиск negamax с альфа-бета отсечением
+    2. Итеративное углубление с ограничением по времени
+    3. Упорядочивание ходов: лучший ход прошлой итерации, взятия,
+       ходы-убийцы (killer moves) и эвристика истории
+    4. Продолжение поиска по взятиям на нулевой глубине (взятие обязательно)
+    5. Бюджет времени на ход из оставшегося времени игрока (white_time/black_time)
+    6. Таблица транспозиций с ограниченным объемом памяти
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple, List
+from .enums import Player
+from .bitboard import BitboardPosition, BitMove, coords_to_bit
+from .zobrist import position_key
+from .transposition import TranspositionTable, pack_move, EXACT, LOWER, UPPER
+
+# оценки материала
+MAN_VALUE = 100
+KING_VALUE = 300
+ADVANCE_BONUS = 3  # бонус простой шашке за каждый пройденный ряд
+MATE_SCORE = 100000  # оценка выигрыша (уменьшается на глубину до мата)
+
+MAX_PLY = 128  # наибольшая глубина от корня (с учетом продолжений взятия)
+TIME_CHECK_INTERVAL = 1024  # как часто (в узлах) проверять время
+NO_KILLERS = (None, None)  # убийцы для глубин от MAX_PLY и дальше
+
+# маски рядов доски для оценки продвижения простых шашек
+ROW_MASKS = tuple(
+    sum(1 << coords_to_bit(row, col) for col in range(8) if (row + col) % 2 == 1)
+    for row in range(8)
+)
+
+
+class SearchTimeout(Exception):
+    """Исключение, прерывающее поиск по истечении отведенного времени."""
+
+
+@dataclass
+class SearchResult:
+    """Класс, представляющий результат поиска хода.
+
+    Attributes:
+        move (Optional[BitMove]): Лучший найденный ход или None, если ходов нет
+        score (int): Оценка позиции с точки зрения ходящего игрока
+        depth (int): Глубина последней полностью завершенной итерации
+        nodes (int): Количество просмотренных позиций
+        elapsed (float): Затраченное время в секундах
+    """
+    move: Optional[BitMove]
+    score: int
+    depth: int
+    nodes: int
+    elapsed: float
+
+
+def evaluate(position: BitboardPosition) -> int:
+    """Статическая оценка позиции с точки зрения ходящего игрока.
+
+    Учитывает материал (простые шашки и дамки) и продвижение простых шашек.
+
+    Args:
+        position (BitboardPosition): Позиция
+
+    Returns:
+        int: Оценка (больше - лучше для ходящего)
+    """
+    kings = position.kings
+    white_men = position.white & ~kings
+    black_men = position.black & ~kings
+
+    score = (MAN_VALUE * (white_men.bit_count() - black_men.bit_count()) +
+             KING_VALUE * ((position.white & kings).bit_count() - (position.black & kings).bit_count()))
+
+    for row in range(1, 7):
+        mask = ROW_MASKS[row]
+        # белые идут к ряду 0, черные - к ряду 7
+        score += ADVANCE_BONUS * ((7 - row) * (white_men & mask).bit_count() -
+                                  row * (black_men & mask).bit_count())
+
+    return score if position.current_player == Player.WHITE else -score
+
+
+def score_to_tt(score: int, ply: int) -> int:
+    """Переводит оценку выигрыша из "от корня" в "от текущей позиции" для хранения."""
+    if score >= MATE_SCORE - MAX_PLY:
+        return score + ply
+    if score <= -MATE_SCORE + MAX_PLY:
+        return score - ply
+    return score
+
+
+def score_from_tt(score: int, ply: int) -> int:
+    """Переводит сохраненную оценку выигрыша обратно в "от корня"."""
+    if score >= MATE_SCORE - MAX_PLY:
+        return score - ply
+    if score <= -MATE_SCORE + MAX_PLY:
+        return score + ply
+    return score
+
+
+class AIPlayer:
+    """Компьютерный игрок на основе альфа-бета поиска.
+
+    Attributes:
+        player (Player): Цвет, за который играет компьютер
+        max_depth (int): Наибольшая глубина итеративного углубления
+        max_time (float): Наибольшее время на один ход в секундах
+        moves_to_go (int): На сколько ходов делится оставшееся время
+        nodes (int): Количество позиций, просмотренных последним поиском
+        killers (List[List[Optional[BitMove]]]): Ходы-убийцы по глубинам
+        history (dict): Эвристика истории (откуда, куда) -> вес
+        tt (TranspositionTable): Таблица транспозиций
+    """
+
+    def __init__(self, player: Player = Player.BLACK, max_depth: int = 32,
+                 max_time: float = 0.5, moves_to_go: int = 30, tt_size_mb: float = 16):
+        """Создает компьютерного игрока.
+
+        Args:
+            player (Player): Цвет компьютера, по умолчанию черные
+            max_depth (int): Наибольшая глубина поиска
+            max_time (float): Наибольшее время на ход в секундах
+            moves_to_go (int): Ожидаемое число оставшихся ходов для распределения времени
+            tt_size_mb (float): Объем таблицы транспозиций в мегабайтах
+        """
+        self.player = player
+        self.max_depth = max_depth
+        self.max_time = max_time
+        self.moves_to_go = moves_to_go
+        self.nodes = 0
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = {}
+        self.tt = TranspositionTable(tt_size_mb)
+        self._deadline = 0.0
+
+    def time_budget(self, game) -> float:
+        """Вычисляет время на ход из оставшегося времени игрока.
+
+        Args:
+            game (CheckersGame): Текущая игра
+
+        Returns:
+            float: Время на поиск в секундах
+        """
+        remaining = game.white_time if self.player == Player.WHITE else game.black_time
+        return max(0.01, min(self.max_time, remaining / self.moves_to_go))
+
+    def search(self, position: BitboardPosition, time_limit: float) -> SearchResult:
+        """Ищет лучший ход итеративным углублением.
+
+        Args:
+            position (BitboardPosition): Позиция, в которой нужно сделать ход
+            time_limit (float): Время на поиск в секундах
+
+        Returns:
+            SearchResult: Лучший ход последней завершенной итерации
+        """
+        start = time.perf_counter()
+        self._deadline = start + time_limit
+        self.nodes = 0
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.tt.new_search()
+
+        moves = position.generate_moves()
+        if not moves:
+            return SearchResult(None, -MATE_SCORE, 0, 0, 0.0)
+        if len(moves) == 1:
+            # единственный ход (часто - обязательное взятие) не требует поиска
+            return SearchResult(moves[0], 0, 0, 1, time.perf_counter() - start)
+
+        best_move, best_score, completed = moves[0], 0, 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, move = self._search_root(position, moves, depth, best_move)
+            except SearchTimeout:
+                break
+            best_move, best_score, completed = move, score, depth
+            if abs(score) >= MATE_SCORE - MAX_PLY:
+                break  # найден форсированный выигрыш или проигрыш
+            if time.perf_counter() >= self._deadline:
+                break
+
+        return SearchResult(best_move, best_score, completed, self.nodes, time.perf_counter() - start)
+
+    def choose_move(self, game) -> Optional[Tuple[int, int, int, int, List[Tuple[int, int]]]]:
+        """Выбирает ход для текущей позиции игры.
+
+        Args:
+            game (CheckersGame): Игра, в которой ходит компьютер
+
+        Returns:
+            Optional[Tuple]: Ход (from_row, from_col, to_row, to_col, captured) или None
+        """
+        position = BitboardPosition.from_game(game)
+        result = self.search(position, self.time_budget(game))
+        if result.move is None:
+            return None
+        return position.to_game_move(result.move)
+
+    def play(self, game) -> bool:
+        """Делает в игре ход, найденный поиском.
+
+        Ход выполняется через CheckersGame.play_move вместе со взятыми
+        шашками: если в одну клетку ведут разные взятия, выполняется именно
+        найденное.
+
+        Args:
+            game (CheckersGame): Игра, в которой ходит компьютер
+
+        Returns:
+            bool: True если ход сделан, False если ходить нельзя
+        """
+        if game.game_over or game.current_player != self.player:
+            return False
+
+        move = self.choose_move(game)
+        if move is None:
+            return False
+
+        from_row, from_col, to_row, to_col, captured = move
+        return game.play_move(from_row, from_col, to_row, to_col, captured)
+
+    def _search_root(self, position, moves, depth, pv_move):
+        """Перебирает ходы в корне и возвращает (оценка, лучший ход)."""
+        alpha, beta = -MATE_SCORE - 1, MATE_SCORE + 1
+        best_move = None
+        for move in self._order_moves(moves, 0, pv_move):
+            child = position.apply_move(move)
+            if child.current_player == position.current_player:
+                score = self._negamax(child, depth, alpha, beta, 1)
+            else:
+                score = -self._negamax(child, depth - 1, -beta, -alpha, 1)
+            if best_move is None or score > alpha:
+                alpha, best_move = score, move
+        return alpha, best_move
+
+    def _negamax(self, position, depth, alpha, beta, ply):
+        """Альфа-бета поиск; возвращает оценку с точки зрения ходящего."""
+        self.nodes += 1
+        if self.nodes % TIME_CHECK_INTERVAL == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        key = tt_move = None
+        if depth <= 0 or ply >= MAX_PLY - 1:
+            # на нулевой глубине досчитываем только взятия: они обязательны
+            moves = position.generate_captures()
+            if not moves:
+                if position.pending < 0 and not position.generate_simple_moves():
+                    return -MATE_SCORE + ply
+                return evaluate(position)
+            depth = 0
+        else:
+            key = position_key(position)
+            entry = self.tt.probe(key)
+            if entry is not None:
+                entry_depth, flag, score, tt_move = entry
+                if entry_depth >= depth:
+                    score = score_from_tt(score, ply)
+                    if (flag == EXACT or (flag == LOWER and score >= beta) or
+                            (flag == UPPER and score <= alpha)):
+                        return score
+            moves = position.generate_moves()
+            if not moves:
+                return -MATE_SCORE + ply
+
+        alpha_orig = alpha
+        best_score, best_move = -MATE_SCORE - 1, None
+        for move in self._order_moves(moves, ply, tt_move=tt_move):
+            child = position.apply_move(move)
+            if child.current_player == position.current_player:
+                # продолжение взятия новой дамкой - ход той же стороны
+                score = self._negamax(child, depth, alpha, beta, ply + 1)
+            else:
+                score = -self._negamax(child, depth - 1, -beta, -alpha, ply + 1)
+
+            if score > best_score:
+                best_score, best_move = score, move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if not move[2]:
+                    self._record_cutoff(move, depth, ply)
+                break
+
+        if key is not None:
+            if best_score <= alpha_orig:
+                flag = UPPER
+            elif best_score >= beta:
+                flag = LOWER
+            else:
+                flag = EXACT
+            self.tt.store(key, depth, flag, score_to_tt(best_score, ply), pack_move(best_move))
+        return best_score
+
+    def _order_moves(self, moves, ply, first_move=None, tt_move=None):
+        """Упорядочивает ходы: лучший известный, взятия, убийцы, история."""
+        # досчет взятий может уйти глубже MAX_PLY - там убийц не храним
+        killers = self.killers[ply] if ply < MAX_PLY else NO_KILLERS
+        history = self.history
+
+        def priority(move):
+            if move == first_move or (tt_move and pack_move(move) == tt_move):
+                return 1 << 30
+            if move[2]:
+                return (1 << 20) + len(move[2])
+            if move == killers[0] or move == killers[1]:
+                return 1 << 19
+            return history.get((move[0], move[1]), 0)
+
+        return sorted(moves, key=priority, reverse=True)
+
+    def _record_cutoff(self, move, depth, ply):
+        """Запоминает тихий ход, вызвавший отсечение."""
+        if ply < MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        key = (move[0], move[1])
+        self.history[key] = self.history.get(key, 0) + depth * depth
@@ -0,0 +1,449 @@
+"""
+Модуль битбордового представления позиции.
+
+Содержит компактное представление позиции русских шашек в виде целочисленных
+масок (битбордов) и генератор ходов на масочной арифметике. Используется там,
+где важна скорость перебора позиций: анализ партий, поиск, тесты генератора.
+
+Раскладка битов:
+    Игровые (темные) клетки доски нумеруются по рядам по 4 клетки в ряду.
+    После каждой пары рядов вставляется "призрачный" бит (8, 17, 26), поэтому
+    соседние по диагонали клетки всегда отличаются на постоянный сдвиг:
+    -5 (вверх-влево), -4 (вверх-вправо), +4 (вниз-влево), +5 (вниз-вправо).
+    Выход за край доски попадает либо в призрачный бит, либо за пределы маски.
+
+Правила генератора повторяют CheckersGame:
+    1. Простая шашка ходит вперед, бьет вперед и назад
+    2. Дамка ходит и бьет на любое расстояние
+    3. Взятые шашки снимаются с доски сразу во время поиска взятий
+    4. Из взятий каждой шашки разрешены только самые длинные
+    5. Превращение в дамку происходит по конечной клетке хода; если новая
+       дамка может бить дальше, ход не переходит к сопернику
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple, Optional
+from .constants import BOARD_SIZE
+from .enums import PieceType, Player
+from .models import Piece
+
+# количество игровых клеток
+SQUARE_COUNT = 32
+
+# сдвиги по диагоналям в порядке обхода CheckersGame:
+# вверх-влево, вверх-вправо, вниз-влево, вниз-вправо
+DIRECTIONS = (-5, -4, 4, 5)
+WHITE_FORWARD = (-5, -4)  # белые простые ходят вверх
+BLACK_FORWARD = (4, 5)  # черные простые ходят вниз
+
+
+def coords_to_bit(row: int, col: int) -> int:
+    """Возвращает номер бита для темной клетки доски.
+
+    Args:
+        row (int): Номер ряда (0-7)
+        col (int): Номер столбца (0-7)
+
+    Returns:
+        int: Номер бита в маске позиции
+    """
+    return row * 4 + row // 2 + col // 2
+
+
+def coords_to_square(row: int, col: int) -> int:
+    """Возвращает номер игровой клетки (0-31) для темной клетки доски.
+
+    Args:
+        row (int): Номер ряда (0-7)
+        col (int): Номер столбца (0-7)
+
+    Returns:
+        int: Номер клетки, считая слева направо сверху вниз
+    """
+    return row * 4 + col // 2
+
+
+def square_to_coords(square: int) -> Tuple[int, int]:
+    """Возвращает координаты (ряд, столбец) игровой клетки (0-31).
+
+    Args:
+        square (int): Номер игровой клетки
+
+    Returns:
+        Tuple[int, int]: Координаты клетки на доске
+    """
+    row = square // 4
+    col = (square % 4) * 2 + (1 - row % 2)
+    return row, col
+
+
+# таблицы соответствия клеток и битов
+SQUARE_TO_BIT = tuple(coords_to_bit(*square_to_coords(sq)) for sq in range(SQUARE_COUNT))
+BIT_TO_COORDS = {SQUARE_TO_BIT[sq]: square_to_coords(sq) for sq in range(SQUARE_COUNT)}
+BIT_TO_SQUARE = {bit: sq for sq, bit in enumerate(SQUARE_TO_BIT)}
+
+BOARD_MASK = 0  # все игровые клетки
+for _bit in SQUARE_TO_BIT:
+    BOARD_MASK |= 1 << _bit
+del _bit
+
+# ряды превращения: белые - верхний ряд, черные - нижний
+WHITE_PROMOTION = sum(1 << coords_to_bit(0, col) for col in range(1, BOARD_SIZE, 2))
+BLACK_PROMOTION = sum(1 << coords_to_bit(BOARD_SIZE - 1, col) for col in range(0, BOARD_SIZE, 2))
+
+# ход в битовом представлении: (бит откуда, бит куда, взятые биты по порядку)
+BitMove = Tuple[int, int, Tuple[int, ...]]
+
+
+def shift(mask: int, direction: int) -> int:
+    """Сдвигает маску на одну клетку по диагонали.
+
+    Args:
+        mask (int): Исходная маска
+        direction (int): Сдвиг из DIRECTIONS
+
+    Returns:
+        int: Сдвинутая маска без призрачных битов
+    """
+    if direction > 0:
+        return (mask << direction) & BOARD_MASK
+    return (mask >> -direction) & BOARD_MASK
+
+
+def iter_bits(mask: int):
+    """Перебирает номера установленных битов маски по возрастанию.
+
+    Args:
+        mask (int): Маска
+
+    Yields:
+        int: Номер очередного установленного бита
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass
+class BitboardPosition:
+    """Позиция русских шашек в виде битовых масок.
+
+    Attributes:
+        white (int): Маска белых шашек (простых и дамок)
+        black (int): Маска черных шашек (простых и дамок)
+        kings (int): Маска дамок обоих цветов
+        current_player (Player): Игрок, который делает ход
+        pending (int): Бит дамки, обязанной продолжить взятие после
+                       превращения, или -1 если такой нет
+    """
+    white: int = 0
+    black: int = 0
+    kings: int = 0
+    current_player: Player = Player.WHITE
+    pending: int = -1
+
+    @classmethod
+    def initial(cls) -> 'BitboardPosition':
+        """Создает начальную позицию (черные в рядах 0-2, белые в рядах 5-7).
+
+        Returns:
+            BitboardPosition: Начальная позиция, ход белых
+        """
+        black = sum(1 << SQUARE_TO_BIT[sq] for sq in range(12))
+        white = sum(1 << SQUARE_TO_BIT[sq] for sq in range(20, SQUARE_COUNT))
+        return cls(white=white, black=black)
+
+    @classmethod
+    def from_board(cls, board, current_player: Player = Player.WHITE,
+                   pending: Optional[Tuple[int, int]] = None) -> 'BitboardPosition':
+        """Строит битбордовую позицию по доске CheckersGame.
+
+        Args:
+            board (List[List[Optional[Piece]]]): Доска 8x8
+            current_player (Player): Игрок, который делает ход
+            pending (Optional[Tuple[int, int]]): Клетка шашки, продолжающей взятие
+
+        Returns:
+            BitboardPosition: Эквивалентная позиция
+        """
+        white = black = kings = 0
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                piece = board[row][col]
+                if not piece:
+                    continue
+                bit = 1 << coords_to_bit(row, col)
+                if piece.player == Player.WHITE:
+                    white |= bit
+                else:
+                    black |= bit
+                if piece.type == PieceType.KING:
+                    kings |= bit
+        pending_bit = coords_to_bit(*pending) if pending else -1
+        return cls(white, black, kings, current_player, pending_bit)
+
+    @classmethod
+    def from_game(cls, game) -> 'BitboardPosition':
+        """Строит битбордовую позицию по текущему состоянию CheckersGame.
+
+        Args:
+            game (CheckersGame): Игра
+
+        Returns:
+            BitboardPosition: Эквивалентная позиция
+        """
+        pending = game.selected_piece if game.multiple_capture else None
+        return cls.from_board(game.board, game.current_player, pending)
+
+    def to_board(self) -> List[List[Optional[Piece]]]:
+        """Восстанавливает доску 8x8 из масок.
+
+        Returns:
+            List[List[Optional[Piece]]]: Доска с новыми объектами Piece
+        """
+        board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        for bit in iter_bits(self.white | self.black):
+            row, col = BIT_TO_COORDS[bit]
+            player = Player.WHITE if self.white >> bit & 1 else Player.BLACK
+            piece_type = PieceType.KING if self.kings >> bit & 1 else PieceType.MAN
+            board[row][col] = Piece(player, piece_type)
+        return board
+
+    def own_and_enemy(self) -> Tuple[int, int]:
+        """Возвращает маски шашек текущего игрока и соперника.
+
+        Returns:
+            Tuple[int, int]: (свои шашки, шашки соперника)
+        """
+        if self.current_player == Player.WHITE:
+            return self.white, self.black
+        return self.black, self.white
+
+    def piece_captures(self, bit: int) -> List[Tuple[int, Tuple[int, ...]]]:
+        """Находит все цепочки взятий для шашки на указанном бите.
+
+        Повторяет обход CheckersGame.get_captures_for_piece, включая
+        отсечение повторных состояний (клетка, множество взятых).
+
+        Args:
+            bit (int): Бит шашки
+
+        Returns:
+            List[Tuple[int, Tuple[int, ...]]]: Список (бит назначения, взятые биты)
+        """
+        if self.white >> bit & 1:
+            enemy = self.black
+        else:
+            enemy = self.white
+        empty = BOARD_MASK & ~(self.white | self.black)
+        visited = set()
+        if self.kings >> bit & 1:
+            return self._king_captures(bit, enemy, empty, (), 0, visited)
+        return self._man_captures(bit, enemy, empty, (), 0, visited)
+
+    def _man_captures(self, sq, enemy, empty, captured, captured_mask, visited):
+        """Рекурсивный поиск взятий простой шашкой."""
+        captures = []
+        key = (sq, captured_mask)
+        if key in visited:
+            return captures
+        visited.add(key)
+
+        for d in DIRECTIONS:
+            mid = sq + d
+            land = mid + d
+            if land < 0 or mid < 0:
+                continue
+            if enemy >> mid & 1 and empty >> land & 1:
+                # делаем прыжок: старая клетка и взятая освобождаются
+                mid_bit = 1 << mid
+                new_empty = (empty | (1 << sq) | mid_bit) & ~(1 << land)
+                new_captured = captured + (mid,)
+                further = self._man_captures(land, enemy & ~mid_bit, new_empty,
+                                             new_captured, captured_mask | mid_bit, visited)
+                if further:
+                    captures.extend(further)
+                else:
+                    captures.append((land, new_captured))
+        return captures
+
+    def _king_captures(self, sq, enemy, empty, captured, captured_mask, visited):
+        """Рекурсивный поиск взятий дамкой."""
+        captures = []
+        key = (sq, captured_mask)
+        if key in visited:
+            return captures
+        visited.add(key)
+
+        for d in DIRECTIONS:
+            # скользим по пустым клеткам до первой шашки
+            cur = sq + d
+            while cur >= 0 and empty >> cur & 1:
+                cur += d
+            if cur < 0 or not enemy >> cur & 1:
+                continue
+
+            mid_bit = 1 << cur
+            new_captured = captured + (cur,)
+            land = cur + d
+            while land >= 0 and empty >> land & 1:
+                new_empty = (empty | (1 << sq) | mid_bit) & ~(1 << land)
+                further = self._king_captures(land, enemy & ~mid_bit, new_empty,
+                                              new_captured, captured_mask | mid_bit, visited)
+                if further:
+                    captures.extend(further)
+                else:
+                    captures.append((land, new_captured))
+                land += d
+        return captures
+
+    def _best_captures(self, bit: int) -> List[BitMove]:
+        """Возвращает самые длинные взятия шашки на указанном бите."""
+        captures = self.piece_captures(bit)
+        if not captures:
+            return []
+        longest = max(len(captured) for _, captured in captures)
+        return [(bit, to, captured) for to, captured in captures if len(captured) == longest]
+
+    def capture_candidates(self) -> int:
+        """Возвращает маску шашек текущего игрока, которые могут бить.
+
+        Для простых шашек используется масочная арифметика, дамки
+        проверяются лучом по каждой диагонали.
+
+        Returns:
+            int: Маска шашек, у которых есть хотя бы одно взятие
+        """
+        own, enemy = self.own_and_enemy()
+        empty = BOARD_MASK & ~(self.white | self.black)
+        men = own & ~self.kings
+        candidates = 0
+        for d in DIRECTIONS:
+            targets = shift(shift(men, d) & enemy, d) & empty
+            candidates |= shift(shift(targets, -d), -d)
+
+        for bit in iter_bits(own & self.kings):
+            for d in DIRECTIONS:
+                ray = shift(1 << bit, d)
+                while ray & empty:
+                    ray = shift(ray, d)
+                if ray & enemy and shift(ray, d) & empty:
+                    candidates |= 1 << bit
+                    break
+        return candidates
+
+    def generate_captures(self) -> List[BitMove]:
+        """Генерирует обязательные взятия текущего игрока.
+
+        Returns:
+            List[BitMove]: Самые длинные взятия каждой шашки, которая может бить
+        """
+        if self.pending >= 0:
+            return self._best_captures(self.pending)
+        moves = []
+        for bit in iter_bits(self.capture_candidates()):
+            moves.extend(self._best_captures(bit))
+        return moves
+
+    def generate_simple_moves(self) -> List[BitMove]:
+        """Генерирует ходы без взятия для текущего игрока.
+
+        Returns:
+            List[BitMove]: Ходы в формате (откуда, куда, ())
+        """
+        own, _ = self.own_and_enemy()
+        empty = BOARD_MASK & ~(self.white | self.black)
+        men = own & ~self.kings
+        forward = WHITE_FORWARD if self.current_player == Player.WHITE else BLACK_FORWARD
+        moves = []
+
+        for d in forward:
+            for to in iter_bits(shift(men, d) & empty):
+                moves.append((to - d, to, ()))
+
+        for bit in iter_bits(own & self.kings):
+            for d in DIRECTIONS:
+                to = bit + d
+                while to >= 0 and empty >> to & 1:
+                    moves.append((bit, to, ()))
+                    to += d
+        return moves
+
+    def generate_moves(self) -> List[BitMove]:
+        """Генерирует все допустимые ходы текущего игрока.
+
+        Если есть взятия, возвращаются только они (обязательное взятие).
+
+        Returns:
+            List[BitMove]: Список ходов
+        """
+        captures = self.generate_captures()
+        if captures or self.pending >= 0:
+            return captures
+        return self.generate_simple_moves()
+
+    def apply_move(self, move: BitMove) -> 'BitboardPosition':
+        """Выполняет ход и возвращает новую позицию.
+
+        Args:
+            move (BitMove): Ход из generate_moves()
+
+        Returns:
+            BitboardPosition: Позиция после хода
+        """
+        from_bit, to_bit, captured = move
+        src = 1 << from_bit
+        dst = 1 << to_bit
+        removed = 0
+        for bit in captured:
+            removed |= 1 << bit
+
+        white, black, kings = self.white, self.black, self.kings
+        is_king = kings & src
+        if self.current_player == Player.WHITE:
+            white = (white & ~src) | dst
+            black &= ~removed
+            promotion = WHITE_PROMOTION
+        else:
+            black = (black & ~src) | dst
+            white &= ~removed
+            promotion = BLACK_PROMOTION
+        kings &= ~(src | removed)
+        promoted = not is_king and dst & promotion
+        if is_king or promoted:
+            kings |= dst
+
+        position = BitboardPosition(white, black, kings, self.current_player)
+        # новая дамка продолжает взятие, если может
+        if captured and promoted and position.piece_captures(to_bit):
+            position.pending = to_bit
+        else:
+            position.current_player = Player.BLACK if self.current_player == Player.WHITE else Player.WHITE
+        return position
+
+    def to_game_move(self, move: BitMove) -> Tuple[int, int, int, int, List[Tuple[int, int]]]:
+        """Преобразует ход в формат CheckersGame.
+
+        Args:
+            move (BitMove): Ход в битовом представлении
+
+        Returns:
+            Tuple: (from_row, from_col, to_row, to_col, captured)
+        """
+        from_bit, to_bit, captured = move
+        from_row, from_col = BIT_TO_COORDS[from_bit]
+        to_row, to_col = BIT_TO_COORDS[to_bit]
+        return from_row, from_col, to_row, to_col, [BIT_TO_COORDS[bit] for bit in captured]
+
+    def count(self, player: Player) -> int:
+        """Возвращает количество шашек игрока.
+
+        Args:
+            player (Player): Игрок
+
+        Returns:
+            int: Количество шашек (простых и дамок)
+        """
+        mask = self.white if player == Player.WHITE else self.black
+        return bin(mask).count("1")
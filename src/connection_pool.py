@@ -0,0 +1,236 @@
+"""
+Модуль пула соединений с базой данных.
+
+ConnectionPool хранит несколько открытых соединений и выдает их на время
+одной операции. Пул потокобезопасен: разные потоки получают разные
+соединения, а лишние соединения не создаются заново при каждом запросе.
+
+Особенности:
+    1. Минимальный и максимальный размер пула
+    2. Выдача соединения на одну операцию (контекстный менеджер connection())
+    3. Проверка соединения при выдаче: закрытые отбрасываются, давно
+       простаивавшие проверяются запросом SELECT 1
+    4. Закрытие соединений, простаивающих дольше max_idle_time (сверх минимума)
+
+Пул не зависит от драйвера: соединения создает переданная функция connect,
+поэтому модуль импортируется без psycopg2.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple
+
+
+class PoolExhaustedError(Exception):
+    """Исключение: за отведенное время не освободилось ни одного соединения."""
+
+
+class ConnectionPool:
+    """Потокобезопасный пул соединений.
+
+    Attributes:
+        min_size (int): Сколько соединений держать открытыми всегда
+        max_size (int): Наибольшее количество одновременно открытых соединений
+        max_idle_time (float): Через сколько секунд простоя лишнее соединение закрывается
+        ping_after (float): После скольких секунд простоя соединение проверяется запросом
+        timeout (float): Сколько секунд ждать свободное соединение
+    """
+
+    def __init__(self, connect: Callable, min_size: int = 1, max_size: int = 5,
+                 max_idle_time: float = 300.0, ping_after: float = 30.0,
+                 timeout: float = 10.0):
+        """Создает пул и сразу открывает min_size соединений.
+
+        Args:
+            connect (Callable): Функция без аргументов, открывающая новое соединение
+            min_size (int): Минимальный размер пула, по умолчанию 1
+            max_size (int): Максимальный размер пула, по умолчанию 5
+            max_idle_time (float): Время простоя до закрытия лишнего соединения
+            ping_after (float): Время простоя, после которого соединение проверяется
+            timeout (float): Время ожидания свободного соединения в секундах
+
+        Raises:
+            ValueError: Если размеры пула заданы неверно
+            Exception: Ошибка открытия начальных соединений
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Неверные размеры пула соединений")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self.ping_after = ping_after
+        self.timeout = timeout
+
+        self._idle: List[Tuple[object, float]] = []  # (соединение, когда освободилось)
+        self._size = 0  # открыто соединений (выданных и свободных)
+        self._closed = False
+        self._condition = threading.Condition()
+
+        for _ in range(min_size):
+            self._idle.append((self._connect(), time.monotonic()))
+            self._size += 1
+
+    @property
+    def size(self) -> int:
+        """Количество открытых соединений."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Количество свободных соединений."""
+        return len(self._idle)
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Выдает исправное соединение из пула.
+
+        Args:
+            timeout (Optional[float]): Время ожидания, по умолчанию self.timeout
+
+        Returns:
+            Соединение с базой данных
+
+        Raises:
+            PoolExhaustedError: Если свободное соединение не появилось вовремя
+            RuntimeError: Если пул закрыт
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Пул соединений закрыт")
+                    if self._idle:
+                        # берем последнее освобожденное: оно "теплое" и вряд ли оборвано
+                        connection, released_at = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        connection, released_at = None, None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolExhaustedError(
+                            f"Нет свободных соединений (максимум {self.max_size})")
+                    self._condition.wait(remaining)
+
+            # проверка и открытие соединения - вне блокировки
+            if connection is None:
+                try:
+                    return self._connect()
+                except Exception:
+                    self._forget()
+                    raise
+            if self._is_healthy(connection, time.monotonic() - released_at):
+                return connection
+            self._discard(connection)
+
+    def release(self, connection, broken: bool = False):
+        """Возвращает соединение в пул.
+
+        Args:
+            connection: Соединение, полученное через acquire()
+            broken (bool): Соединение неисправно и должно быть закрыто
+        """
+        if broken or self._closed or getattr(connection, 'closed', 0):
+            self._discard(connection)
+            return
+
+        with self._condition:
+            self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+        self.reap_idle()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Выдает соединение на время одной операции.
+
+        При исключении незавершенная транзакция откатывается, а соединение
+        возвращается в пул (или закрывается, если откат не удался).
+
+        Args:
+            timeout (Optional[float]): Время ожидания свободного соединения
+
+        Yields:
+            Соединение с базой данных
+        """
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        except Exception:
+            broken = False
+            try:
+                connection.rollback()
+            except Exception:
+                broken = True
+            self.release(connection, broken)
+            raise
+        else:
+            self.release(connection)
+
+    def reap_idle(self) -> int:
+        """Закрывает соединения, простаивающие дольше max_idle_time, сверх min_size.
+
+        Returns:
+            int: Количество закрытых соединений
+        """
+        expired = []
+        now = time.monotonic()
+        with self._condition:
+            # самые старые свободные соединения лежат в начале списка
+            while (self._idle and self._size > self.min_size and
+                   now - self._idle[0][1] > self.max_idle_time):
+                expired.append(self._idle.pop(0)[0])
+                self._size -= 1
+        for connection in expired:
+            self._close_quietly(connection)
+        return len(expired)
+
+    def close_all(self):
+        """Закрывает все свободные соединения; выданные закроются при возврате."""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle = []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for connection in idle:
+            self._close_quietly(connection)
+
+    def _is_healthy(self, connection, idle_for: float) -> bool:
+        """Проверяет соединение перед выдачей."""
+        if getattr(connection, 'closed', 0):
+            return False
+        if idle_for < self.ping_after:
+            return True
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+            connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, connection):
+        """Закрывает соединение и освобождает его место в пуле."""
+        self._close_quietly(connection)
+        self._forget()
+
+    def _forget(self):
+        """Уменьшает счетчик открытых соединений и будит ожидающих."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(connection):
+        """Закрывает соединение, не выбрасывая исключений."""
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -51,6 +51,13 @@ HIGHLIGHT_CAPTURE = (255, 100, 100, 180)  # полупрозрачный кра
 # цвет тени под шашкой
 PIECE_SHADOW = (20, 20, 30)  # темный цвет для тени
 
+# насколько свечение подсветки клетки выходит за ее границы
+HIGHLIGHT_GLOW_MARGIN = 24
+
+# оверлей профилировщика кадров (клавиша F3)
+PROFILER_OVERLAY_REFRESH = 250  # период обновления цифр, мс
+PROFILER_OVERLAY_BACKGROUND = (10, 10, 20, 200)  # полупрозрачный темный фон
+
 # настройки времени
 INITIAL_TIME_MINUTES = 7  # начальное время на партию (7 минут)
 INITIAL_TIME_SECONDS = INITIAL_TIME_MINUTES * 60  # время в секундах
\ No newline at end of file
@@ -10,17 +10,84 @@
     3. Сохранение результатов игры с детальной статистикой
     4. Получение статистики игр и побед
     5. Безопасное управление соединением (контекстный менеджер)
+    6. Пул соединений: каждая операция берет свое соединение, поэтому
+       менеджер можно использовать из нескольких потоков
+    7. Пакетное сохранение результатов одной транзакцией (save_game_results)
+    8. Накопительные таблицы winner_stats и player_stats, обновляемые при
+       каждой вставке: статистика читается без полного просмотра game_results
+    9. Постраничная история игр по ключу (game_date, id) с фильтрами
+    10. Хранение всей партии в компактном двоичном виде (столбец move_record)
+
+DatabaseManager используется как приемник результатов CheckersGame
+(параметр result_sink).
 
 Зависимости:
     - psycopg2: драйвер PostgreSQL для Python
     - python-dotenv: загрузка переменных окружения из .env файла
+
+Обе библиотеки загружаются только при подключении (connect), поэтому импорт
+модуля не требует libpq.
 """
 
-import psycopg2 # импорт драйвера для работы с бд
-from psycopg2.extras import RealDictCursor # возвращает словари вместо кортежей
-from typing import Optional, Dict
-from dotenv import load_dotenv # загрузка енв файлов
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple
 import os
+from .connection_pool import ConnectionPool
+
+BULK_PAGE_SIZE = 1000  # строк в одном многострочном INSERT при пакетной вставке
+PIECES_PER_PLAYER = 12  # шашек у каждого игрока в начальной расстановке
+
+# Накопительные итоги по победителю: обновляются в той же транзакции, что и
+# вставка результата, поэтому статистика побед читается без агрегации по game_results
+WINNER_STATS_UPSERT = """
+INSERT INTO winner_stats
+(winner, total_games, sum_white_pieces, sum_black_pieces, sum_white_time, sum_black_time)
+VALUES (%s, %s, %s, %s, %s, %s)
+ON CONFLICT (winner) DO UPDATE SET
+    total_games = winner_stats.total_games + EXCLUDED.total_games,
+    sum_white_pieces = winner_stats.sum_white_pieces + EXCLUDED.sum_white_pieces,
+    sum_black_pieces = winner_stats.sum_black_pieces + EXCLUDED.sum_black_pieces,
+    sum_white_time = winner_stats.sum_white_time + EXCLUDED.sum_white_time,
+    sum_black_time = winner_stats.sum_black_time + EXCLUDED.sum_black_time;
+"""
+
+# Итоги по игрокам (сторонам 'white' и 'black', пока в игре нет логинов)
+PLAYER_STATS_UPSERT = """
+INSERT INTO player_stats (player_name, total_games, wins, losses, total_pieces_taken)
+VALUES (%s, %s, %s, %s, %s)
+ON CONFLICT (player_name) DO UPDATE SET
+    total_games = player_stats.total_games + EXCLUDED.total_games,
+    wins = player_stats.wins + EXCLUDED.wins,
+    losses = player_stats.losses + EXCLUDED.losses,
+    total_pieces_taken = player_stats.total_pieces_taken + EXCLUDED.total_pieces_taken;
+"""
+
+
+def pieces_taken(result: Dict, player: str) -> int:
+    """Возвращает, сколько шашек соперника взял игрок в партии.
+
+    Число берется из additional_info["white_captures"] или
+    ["black_captures"] (подсчитано по истории ходов). Для результатов без
+    этих счетчиков оно восстанавливается по оставшимся шашкам соперника,
+    если партия начиналась с начальной расстановки, иначе считается нулем.
+
+    Args:
+        result (Dict): Результат с ключами white_pieces, black_pieces и
+            необязательным additional_info
+        player (str): 'white' или 'black'
+
+    Returns:
+        int: Количество взятых шашек
+    """
+    info = result.get('additional_info') or {}
+    captures = info.get(f'{player}_captures')
+    if captures is not None:
+        return captures
+    if 'start_position' in info:
+        return 0  # партия из позиции: сколько шашек было в начале, неизвестно
+    opponent_pieces = result['black_pieces'] if player == 'white' else result['white_pieces']
+    return max(0, PIECES_PER_PLAYER - opponent_pieces)
 
 
 class DatabaseManager:
@@ -30,24 +97,34 @@ class DatabaseManager:
     подключение, создание таблиц, сохранение и получение статистики.
 
     Attributes:
-        connection: Соединение с базой данных PostgreSQL
-        cursor: Курсор для выполнения SQL-запросов
+        pool (Optional[ConnectionPool]): Пул соединений или None до подключения
+        min_connections (int): Минимальный размер пула
+        max_connections (int): Максимальный размер пула
+        max_idle_time (float): Время простоя в секундах до закрытия лишнего соединения
     """
 
-    def __init__(self):
+    def __init__(self, min_connections: int = 1, max_connections: int = 5,
+                 max_idle_time: float = 300.0):
         """Инициализирует менеджер базы данных.
 
-        Создает пустые атрибуты для соединения и курсора.
         Фактическое подключение происходит при вызове метода connect().
+
+        Args:
+            min_connections (int): Минимальный размер пула, по умолчанию 1
+            max_connections (int): Максимальный размер пула, по умолчанию 5
+            max_idle_time (float): Время простоя до закрытия лишнего соединения
         """
-        self.connection = None # для хранения соединения с бд
-        self.cursor = None # для хранения курсора
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.max_idle_time = max_idle_time
+        self.pool = None # пул соединений с бд
+        self._cursor_factory = None # класс курсора, возвращающего словари
 
     def connect(self):
         """Устанавливает подключение к базе данных PostgreSQL.
 
-        Загружает настройки из .env файла и подключается к базе данных.
-        При успешном подключении автоматически создает необходимые таблицы.
+        Загружает настройки из .env файла и создает пул соединений с базой
+        данных. При успешном подключении автоматически создает необходимые таблицы.
 
         Raises:
             Exception: Если подключение к базе данных не удалось
@@ -59,6 +136,10 @@ class DatabaseManager:
             3. Текущая директория
         """
         try:
+            import psycopg2 # драйвер загружается только при подключении
+            from psycopg2.extras import RealDictCursor # возвращает словари вместо кортежей
+            from dotenv import load_dotenv # загрузка енв файлов
+
             # Загружаем .env из разных возможных мест
             env_paths = [
                 os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'),  # Корень проекта
@@ -78,14 +159,20 @@ class DatabaseManager:
             db_user = os.getenv('DB_USER', 'postgres')
             db_password = os.getenv('DB_PASSWORD', 'password')  # Убрали декодирование
 
-            self.connection = psycopg2.connect( # устанав соед
-                host=db_host, # передаем значения
-                port=db_port,
-                database=db_name,
-                user=db_user,
-                password=db_password
-            )
-            self.cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+            def open_connection(): # открывает одно соединение пула
+                return psycopg2.connect(
+                    host=db_host, # передаем значения
+                    port=db_port,
+                    database=db_name,
+                    user=db_user,
+                    password=db_password
+                )
+
+            self._cursor_factory = RealDictCursor
+            self.pool = ConnectionPool(open_connection,
+                                       min_size=self.min_connections,
+                                       max_size=self.max_connections,
+                                       max_idle_time=self.max_idle_time)
             print("Успешно подключено к базе данных")
 
             # Создаем таблицу если её нет
@@ -93,14 +180,36 @@ class DatabaseManager:
 
         except Exception as e:
             print(f"Ошибка подключения к базе данных: {e}")
-            self.connection = None
+            self.pool = None
+
+    @contextmanager
+    def _cursor(self):
+        """Берет соединение из пула на одну операцию и выдает курсор.
+
+        Транзакцию фиксирует вызывающий код; при исключении она откатывается
+        и соединение возвращается в пул.
+
+        Yields:
+            Tuple: (соединение, курсор RealDictCursor)
+        """
+        with self.pool.connection() as connection:
+            cursor = connection.cursor(cursor_factory=self._cursor_factory)
+            try:
+                yield connection, cursor
+            finally:
+                cursor.close()
 
     def create_tables(self):
         """Создает необходимые таблицы в базе данных.
 
-        Создает две таблицы:
+        Создает три таблицы:
         1. game_results - для сохранения результатов отдельных игр
-        2. player_stats - для статистики игроков (резерв на будущее)
+        2. player_stats - итоги по игрокам (сторонам 'white' и 'black')
+        3. winner_stats - накопительные итоги по победителю
+
+        Если накопительные таблицы пусты, а результаты уже есть, итоги
+        один раз пересчитываются по game_results. Также создаются индексы
+        game_results по дате, победителю и дополнительной информации (GIN).
 
         Raises:
             Exception: Если создание таблиц не удалось
@@ -118,9 +227,13 @@ class DatabaseManager:
                 black_time_remaining FLOAT NOT NULL,
                 total_moves INTEGER DEFAULT 0,
                 game_duration INTERVAL,
-                additional_info JSONB
+                additional_info JSONB,
+                move_record BYTEA
             );
 
+            -- Двоичная запись всей партии (для таблиц, созданных до ее появления)
+            ALTER TABLE game_results ADD COLUMN IF NOT EXISTS move_record BYTEA;
+
             -- Таблица для статистики игроков (если будете добавлять логины)
             CREATE TABLE IF NOT EXISTS player_stats (
                 id SERIAL PRIMARY KEY,
@@ -130,20 +243,63 @@ class DatabaseManager:
                 losses INTEGER DEFAULT 0,
                 total_pieces_taken INTEGER DEFAULT 0
             );
+
+            -- Накопительные итоги по победителю (суммы, средние считаются при чтении)
+            CREATE TABLE IF NOT EXISTS winner_stats (
+                winner VARCHAR(10) PRIMARY KEY,
+                total_games BIGINT NOT NULL DEFAULT 0,
+                sum_white_pieces BIGINT NOT NULL DEFAULT 0,
+                sum_black_pieces BIGINT NOT NULL DEFAULT 0,
+                sum_white_time DOUBLE PRECISION NOT NULL DEFAULT 0,
+                sum_black_time DOUBLE PRECISION NOT NULL DEFAULT 0
+            );
+
+            -- Первичное заполнение итогов по уже сохраненным играм
+            INSERT INTO winner_stats
+            SELECT winner, COUNT(*), SUM(white_pieces_remaining), SUM(black_pieces_remaining),
+                   SUM(white_time_remaining), SUM(black_time_remaining)
+            FROM game_results
+            WHERE NOT EXISTS (SELECT 1 FROM winner_stats)
+            GROUP BY winner;
+
+            INSERT INTO player_stats (player_name, total_games, wins, losses, total_pieces_taken)
+            SELECT side.name, COUNT(*),
+                   COUNT(*) FILTER (WHERE winner = side.name),
+                   COUNT(*) FILTER (WHERE winner <> side.name),
+                   SUM(COALESCE(
+                       (additional_info ->> (side.name || '_captures'))::INTEGER,
+                       CASE WHEN additional_info ? 'start_position' THEN 0
+                            ELSE GREATEST(0, %(pieces)s - CASE WHEN side.name = 'white'
+                                                             THEN black_pieces_remaining
+                                                             ELSE white_pieces_remaining END)
+                       END))
+            FROM game_results CROSS JOIN (VALUES ('white'), ('black')) AS side(name)
+            WHERE NOT EXISTS (SELECT 1 FROM player_stats)
+            GROUP BY side.name;
+
+            -- Индексы для истории игр: сортировка по дате, фильтр по победителю
+            -- и поиск по дополнительной информации (операторы @>, ?)
+            CREATE INDEX IF NOT EXISTS idx_game_results_date
+                ON game_results (game_date DESC, id DESC);
+            CREATE INDEX IF NOT EXISTS idx_game_results_winner_date
+                ON game_results (winner, game_date DESC, id DESC);
+            CREATE INDEX IF NOT EXISTS idx_game_results_additional_info
+                ON game_results USING GIN (additional_info);
             """
 
-            self.cursor.execute(create_table_query) # запрос создания таблиц
-            self.connection.commit()
+            with self._cursor() as (connection, cursor): # при ошибке изменения откатываются
+                cursor.execute(create_table_query, {'pieces': PIECES_PER_PLAYER}) # запрос создания таблиц
+                connection.commit()
             print("Таблицы успешно созданы")
 
         except Exception as e:
             print(f"Ошибка при создании таблиц: {e}")
-            self.connection.rollback() # отменяем изменения
 
     def save_game_result(self, winner: str, white_pieces: int, black_pieces: int,
                          white_time: float, black_time: float, total_moves: int = 0,
                          game_duration: Optional[str] = None,
-                         additional_info: Optional[Dict] = None) -> bool:
+                         additional_info: Optional[Dict] = None,
+                         move_record: Optional[bytes] = None) -> bool:
         """Сохраняет результат игры в базу данных.
 
         Args:
@@ -155,6 +311,7 @@ class DatabaseManager:
             total_moves (int): Общее количество ходов в игре, по умолчанию 0
             game_duration (Optional[str]): Продолжительность игры в формате MM:SS
             additional_info (Optional[Dict]): Дополнительная информация о игре
+            move_record (Optional[bytes]): Двоичная запись всех ходов (модуль move_record)
 
         Returns:
             bool: True если сохранение успешно, False в противном случае
@@ -162,42 +319,137 @@ class DatabaseManager:
         Raises:
             Exception: Если произошла ошибка при сохранении
         """
-        if not self.connection:
+        if not self.pool:
             print("Нет подключения к базе данных")
             return False
 
         try:
+            from psycopg2.extras import Json # драйвер уже загружен при подключении
+
             insert_query = """
             INSERT INTO game_results 
             (winner, white_pieces_remaining, black_pieces_remaining, 
              white_time_remaining, black_time_remaining, total_moves,
-             game_duration, additional_info)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+             game_duration, additional_info, move_record)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
             RETURNING id;
             """
 
-            self.cursor.execute(insert_query, ( # скл запрос с параметрами
-                winner,
-                white_pieces,
-                black_pieces,
-                white_time,
-                black_time,
-                total_moves,
-                game_duration,
-                psycopg2.extras.Json(additional_info) if additional_info else None
-            ))
-
-            game_id = self.cursor.fetchone()['id']
-            self.connection.commit()
+            with self._cursor() as (connection, cursor):
+                cursor.execute(insert_query, ( # скл запрос с параметрами
+                    winner,
+                    white_pieces,
+                    black_pieces,
+                    white_time,
+                    black_time,
+                    total_moves,
+                    game_duration,
+                    Json(additional_info) if additional_info else None,
+                    move_record
+                ))
+
+                game_id = cursor.fetchone()['id']
+                self._update_rollups(cursor, [dict(winner=winner, white_pieces=white_pieces,
+                                                   black_pieces=black_pieces, white_time=white_time,
+                                                   black_time=black_time,
+                                                   additional_info=additional_info)])
+                connection.commit()
 
             print(f"Результат игры сохранен с ID: {game_id}")
             return True
 
         except Exception as e:
             print(f"Ошибка при сохранении результата игры: {e}")
-            self.connection.rollback()
             return False
 
+    def save_game_results(self, results: List[Dict]) -> int:
+        """Сохраняет пачку результатов игр одной транзакцией.
+
+        Строки вставляются многострочными INSERT (execute_values), что
+        намного быстрее отдельного INSERT и COMMIT на каждую игру.
+
+        Args:
+            results (List[Dict]): Результаты игр - словари с теми же ключами,
+                что и аргументы save_game_result()
+
+        Returns:
+            int: Количество сохраненных результатов (0 при ошибке - вся пачка откатывается)
+        """
+        if not results:
+            return 0
+        if not self.pool:
+            print("Нет подключения к базе данных")
+            return 0
+
+        try:
+            from psycopg2.extras import Json, execute_values
+
+            rows = [(
+                result['winner'],
+                result['white_pieces'],
+                result['black_pieces'],
+                result['white_time'],
+                result['black_time'],
+                result.get('total_moves', 0),
+                result.get('game_duration'),
+                Json(result['additional_info']) if result.get('additional_info') else None,
+                result.get('move_record')
+            ) for result in results]
+
+            insert_query = """
+            INSERT INTO game_results
+            (winner, white_pieces_remaining, black_pieces_remaining,
+             white_time_remaining, black_time_remaining, total_moves,
+             game_duration, additional_info, move_record)
+            VALUES %s;
+            """
+
+            with self._cursor() as (connection, cursor):
+                execute_values(cursor, insert_query, rows, page_size=BULK_PAGE_SIZE)
+                self._update_rollups(cursor, results)
+                connection.commit()
+
+            return len(rows)
+
+        except Exception as e:
+            print(f"Ошибка при пакетном сохранении результатов: {e}")
+            return 0
+
+    def _update_rollups(self, cursor, results: List[Dict]):
+        """Добавляет результаты к накопительным итогам в текущей транзакции.
+
+        Результаты сначала суммируются по победителю и по игроку, поэтому
+        на пачку любого размера приходится не больше четырех обновлений.
+
+        Args:
+            cursor: Курсор транзакции, в которой вставлены результаты
+            results (List[Dict]): Результаты с ключами winner, white_pieces,
+                black_pieces, white_time, black_time и необязательным
+                additional_info (взятые шашки, см. pieces_taken)
+        """
+        winners = {}  # победитель -> [игр, сумма белых, сумма черных, время белых, время черных]
+        players = {}  # игрок -> [игр, побед, поражений, взято шашек]
+        for result in results:
+            totals = winners.setdefault(result['winner'], [0, 0, 0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += result['white_pieces']
+            totals[2] += result['black_pieces']
+            totals[3] += result['white_time']
+            totals[4] += result['black_time']
+
+            for name in ('white', 'black'):
+                totals = players.setdefault(name, [0, 0, 0, 0])
+                won = result['winner'] == name
+                totals[0] += 1
+                totals[1] += won
+                totals[2] += not won
+                totals[3] += pieces_taken(result, name)
+
+        for winner, totals in winners.items():
+            cursor.execute(WINNER_STATS_UPSERT, (winner, *totals))
+        for name, totals in players.items():
+            cursor.execute(PLAYER_STATS_UPSERT, (name, *totals))
+
     def get_game_statistics(self, limit: int = 10) -> list:
         """Получает последние результаты игр из базы данных.
 
@@ -210,22 +462,101 @@ class DatabaseManager:
         Примечание:
             Возвращает пустой список если нет подключения к БД или произошла ошибка
         """
-        if not self.connection:
-            return []
+        games, _ = self.get_game_history(limit)
+        return games
+
+    def get_game_history(self, limit: int = 10, after: Optional[Tuple] = None,
+                         winner: Optional[str] = None, date_from: Optional[datetime] = None,
+                         date_to: Optional[datetime] = None) -> Tuple[list, Optional[Tuple]]:
+        """Получает страницу истории игр, от новых к старым.
+
+        Используется постраничная навигация по ключу (keyset): следующая
+        страница начинается после (game_date, id) последней игры предыдущей,
+        поэтому запрос идет по индексу и не замедляется для старых страниц.
+
+        Args:
+            limit (int): Размер страницы, по умолчанию 10
+            after (Optional[Tuple]): Курсор (game_date, id) из предыдущего вызова,
+                None - первая страница
+            winner (Optional[str]): Только игры с этим победителем ('white'/'black')
+            date_from (Optional[datetime]): Только игры не раньше этого времени
+            date_to (Optional[datetime]): Только игры раньше этого времени
+
+        Returns:
+            Tuple[list, Optional[Tuple]]: Игры страницы и курсор следующей
+                страницы (None, если страница последняя)
+        """
+        if not self.pool:
+            return [], None
+
+        conditions = []
+        params = []
+        if winner is not None:
+            conditions.append("winner = %s")
+            params.append(winner)
+        if date_from is not None:
+            conditions.append("game_date >= %s")
+            params.append(date_from)
+        if date_to is not None:
+            conditions.append("game_date < %s")
+            params.append(date_to)
+        if after is not None:
+            conditions.append("(game_date, id) < (%s, %s)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
         try:
-            query = """
-            SELECT * FROM game_results 
-            ORDER BY game_date DESC 
+            # берем на одну строку больше, чтобы узнать, есть ли следующая страница
+            query = f"""
+            SELECT * FROM game_results
+            {where}
+            ORDER BY game_date DESC, id DESC
             LIMIT %s;
             """
+            params.append(limit + 1)
 
-            self.cursor.execute(query, (limit,)) # вып запрос
-            return self.cursor.fetchall() # возваращем все записи
+            with self._cursor() as (connection, cursor):
+                cursor.execute(query, params) # вып запрос
+                rows = cursor.fetchall() # получаем все записи
+                connection.rollback() # завершаем транзакцию чтения перед возвратом в пул
+
+            if len(rows) <= limit:
+                return rows, None
+            rows = rows[:limit]
+            return rows, (rows[-1]['game_date'], rows[-1]['id'])
 
         except Exception as e:
             print(f"Ошибка при получении статистики: {e}")
-            return []
+            return [], None
+
+    def get_game_record(self, game_id: int) -> Optional[bytes]:
+        """Получает двоичную запись ходов сохраненной игры.
+
+        Партию можно восстановить функцией move_record.replay(); партию,
+        начатую из позиции, - с position=additional_info["start_position"].
+
+        Args:
+            game_id (int): Идентификатор игры в game_results
+
+        Returns:
+            Optional[bytes]: Запись ходов или None, если игры или записи нет
+        """
+        if not self.pool:
+            return None
+
+        try:
+            with self._cursor() as (connection, cursor):
+                cursor.execute("SELECT move_record FROM game_results WHERE id = %s;", (game_id,))
+                row = cursor.fetchone()
+                connection.rollback() # завершаем транзакцию чтения перед возвратом в пул
+
+            if not row or row['move_record'] is None:
+                return None
+            return bytes(row['move_record'])
+
+        except Exception as e:
+            print(f"Ошибка при получении записи партии: {e}")
+            return None
 
     def get_winner_stats(self) -> Dict:
         """Получает статистику побед по игрокам.
@@ -239,26 +570,31 @@ class DatabaseManager:
             - avg_black_pieces: среднее оставшихся черных шашек
             - avg_white_time: среднее оставшееся время белых
             - avg_black_time: среднее оставшееся время черных
+
+        Читается из накопительной таблицы winner_stats (по строке на победителя),
+        поэтому время запроса не зависит от количества сохраненных игр.
         """
-        if not self.connection:
+        if not self.pool:
             return {}
 
         try:
             query = """
-            SELECT 
+            SELECT
                 winner,
-                COUNT(*) as total_games,
-                AVG(white_pieces_remaining) as avg_white_pieces,
-                AVG(black_pieces_remaining) as avg_black_pieces,
-                AVG(white_time_remaining) as avg_white_time,
-                AVG(black_time_remaining) as avg_black_time
-            FROM game_results 
-            GROUP BY winner
+                total_games,
+                sum_white_pieces::float / total_games as avg_white_pieces,
+                sum_black_pieces::float / total_games as avg_black_pieces,
+                sum_white_time / total_games as avg_white_time,
+                sum_black_time / total_games as avg_black_time
+            FROM winner_stats
+            WHERE total_games > 0
             ORDER BY total_games DESC;
             """
 
-            self.cursor.execute(query)
-            results = self.cursor.fetchall() # получаем все записи по запросу
+            with self._cursor() as (connection, cursor):
+                cursor.execute(query)
+                results = cursor.fetchall() # получаем все записи по запросу
+                connection.rollback() # завершаем транзакцию чтения перед возвратом в пул
 
             stats = {}
             for row in results:
@@ -270,16 +606,43 @@ class DatabaseManager:
             print(f"Ошибка при получении статистики побед: {e}")
             return {}
 
+    def get_player_stats(self) -> Dict:
+        """Получает итоги по игрокам из таблицы player_stats.
+
+        Returns:
+            Dict: Словарь, где ключ - имя игрока ('white'/'black'), значение -
+                  total_games, wins, losses, total_pieces_taken
+        """
+        if not self.pool:
+            return {}
+
+        try:
+            query = """
+            SELECT player_name, total_games, wins, losses, total_pieces_taken
+            FROM player_stats
+            ORDER BY player_name;
+            """
+
+            with self._cursor() as (connection, cursor):
+                cursor.execute(query)
+                results = cursor.fetchall()
+                connection.rollback() # завершаем транзакцию чтения перед возвратом в пул
+
+            return {row['player_name']: dict(row) for row in results}
+
+        except Exception as e:
+            print(f"Ошибка при получении статистики игроков: {e}")
+            return {}
+
     def close(self):
-        """Закрывает соединение с базой данных.
+        """Закрывает соединения с базой данных.
 
-        Освобождает ресурсы курсора и соединения.
+        Закрывает все соединения пула (выданные закроются при возврате).
         Рекомендуется вызывать после завершения работы с БД.
         """
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
+        if self.pool:
+            self.pool.close_all()
+            self.pool = None
             print("Соединение с базой данных закрыто")
 
     def __enter__(self):
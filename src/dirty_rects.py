@@ -0,0 +1,101 @@
+"""
+Модуль отслеживания изменившихся областей экрана (dirty rectangles).
+
+Интерфейс описывает каждый кадр набором областей: имя, прямоугольник и
+"подпись" - кортеж всего, от чего зависит картинка области (шашка на
+клетке, текст таймера, наведение на кнопку и т.п.). DirtyRectTracker
+сравнивает подписи с прошлым кадром и возвращает только прямоугольники,
+которые нужно перерисовать и передать в pygame.display.update(rects).
+
+Особенности:
+    1. Перерисовывается и старый, и новый прямоугольник области, поэтому
+       после исчезновения свечения за пределами клетки не остается следов
+    2. Пересекающиеся прямоугольники объединяются
+    3. Если изменилось слишком много областей, возвращается один общий
+       прямоугольник
+    4. invalidate() требует полной перерисовки (первый кадр, открытие окна)
+
+Модуль не импортирует PyGame: прямоугольники передаются вызывающим кодом
+(нужны методы copy, colliderect, union, unionall и clip).
+"""
+
+from typing import Dict, Hashable, List, Tuple
+
+MAX_RECTS = 16  # больше прямоугольников - обновляем их общую область
+
+
+class DirtyRectTracker:
+    """Сравнивает области кадра с прошлым кадром.
+
+    Attributes:
+        full_redraw (bool): Следующий кадр нужно перерисовать целиком
+    """
+
+    def __init__(self):
+        """Создает трекер; первый кадр всегда перерисовывается целиком."""
+        self.full_redraw = True
+        self._regions: Dict[Hashable, Tuple[object, Hashable]] = {}
+
+    def invalidate(self):
+        """Требует полной перерисовки на следующем кадре."""
+        self.full_redraw = True
+
+    def update(self, regions: Dict[Hashable, Tuple[object, Hashable]], bounds) -> List:
+        """Запоминает области кадра и возвращает изменившиеся прямоугольники.
+
+        Args:
+            regions (Dict[Hashable, Tuple[Rect, Hashable]]): Имя области ->
+                (прямоугольник, подпись)
+            bounds (Rect): Прямоугольник всего экрана
+
+        Returns:
+            List[Rect]: Прямоугольники для перерисовки (внутри bounds); при
+                полной перерисовке - [bounds], если ничего не изменилось - []
+        """
+        previous, self._regions = self._regions, dict(regions)
+        if self.full_redraw:
+            self.full_redraw = False
+            return [bounds.copy()]
+
+        dirty = []
+        for name, (rect, signature) in regions.items():
+            old = previous.get(name)
+            if old is None:
+                dirty.append(rect)
+            elif old[1] != signature or old[0] != rect:
+                dirty.append(old[0])
+                if old[0] != rect:
+                    dirty.append(rect)
+        for name, (rect, _) in previous.items():
+            if name not in regions:
+                dirty.append(rect)  # область исчезла - стираем ее
+
+        dirty = [rect.clip(bounds) for rect in dirty]
+        merged = merge_rects([rect for rect in dirty if rect.width and rect.height])
+        if len(merged) > MAX_RECTS:
+            return [merged[0].unionall(merged[1:])]
+        return merged
+
+
+def merge_rects(rects: List) -> List:
+    """Объединяет пересекающиеся прямоугольники.
+
+    Args:
+        rects (List[Rect]): Прямоугольники
+
+    Returns:
+        List[Rect]: Попарно непересекающиеся прямоугольники, покрывающие исходные
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        changed = True
+        while changed:
+            changed = False
+            for index, other in enumerate(merged):
+                if rect.colliderect(other):
+                    rect = rect.union(merged.pop(index))
+                    changed = True
+                    break
+        merged.append(rect)
+    return merged
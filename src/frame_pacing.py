@@ -0,0 +1,67 @@
+"""
+Модуль адаптивного темпа кадров.
+
+Пока на экране ничего не движется, рисовать 60 кадров в секунду
+бессмысленно: доска статична, а на таймере раз в секунду меняется одна
+цифра. Игровой цикл спрашивает idle_timeout(), сколько можно ждать
+следующего события (pygame.event.wait с таймаутом): ноль - идет анимация
+или ход компьютера, нужен полный темп; иначе - время до ближайшего
+момента, когда картинка изменится сама (смена секунды таймера,
+обновление оверлея профилировщика).
+
+Особенности:
+    1. Любое событие (клик, движение мыши, клавиша) будит цикл сразу,
+       поэтому наведение на кнопки отрисовывается без задержки
+    2. Цикл просыпается чуть позже границы секунды (TIMER_WAKE_MARGIN),
+       чтобы таймер уже показывал новое значение
+    3. Ожидание ограничено IDLE_MAX_WAIT - страховка от пропущенных сроков
+
+Модуль не импортирует PyGame.
+"""
+
+import math
+from typing import Iterable, Optional
+
+IDLE_MAX_WAIT = 1000  # наибольшее ожидание события без отрисовки, мс
+TIMER_WAKE_MARGIN = 5  # запас после смены секунды таймера, мс
+
+
+def seconds_to_next_tick(seconds: float) -> float:
+    """Возвращает, через сколько секунд изменится показание таймера.
+
+    Таймер показывает целые секунды (CheckersGame.format_time), то есть
+    значение меняется, когда оставшееся время опускается ниже целого числа.
+
+    Args:
+        seconds (float): Оставшееся время игрока в секундах
+
+    Returns:
+        float: Время до смены показания (от 0 до 1 секунды), 0.0 если время вышло
+    """
+    if seconds <= 0:
+        return 0.0
+    fraction = seconds - math.floor(seconds)
+    return fraction if fraction > 0 else 1.0
+
+
+def idle_timeout(animating: bool, wake_after: Iterable[Optional[float]],
+                 max_wait: int = IDLE_MAX_WAIT) -> int:
+    """Возвращает, сколько миллисекунд цикл может ждать события.
+
+    Args:
+        animating (bool): На экране идет анимация или нужно действовать без
+            ожидания (ход компьютера, полная перерисовка)
+        wake_after (Iterable[Optional[float]]): Через сколько секунд картинка
+            изменится сама (None - не изменится)
+        max_wait (int): Наибольшее ожидание в миллисекундах
+
+    Returns:
+        int: Таймаут ожидания в миллисекундах, 0 - рисовать кадр без ожидания
+    """
+    if animating:
+        return 0
+    timeout = max_wait
+    for seconds in wake_after:
+        if seconds is not None:
+            timeout = min(timeout, int(math.ceil(seconds * 1000)) + TIMER_WAKE_MARGIN)
+    return max(0, timeout)
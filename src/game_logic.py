@@ -10,7 +10,7 @@
     3. Множественное взятие (несколько шашек за один ход)
     4. Превращение в дамку при достижении противоположного края
     5. Таймер на 7 минут для каждого игрока
-    6. Автоматическое сохранение результатов в базу данных
+    6. Сохранение результата через подключаемый приемник (например, DatabaseManager)
     7. Подсветка обязательных взятий
 """
 
@@ -18,8 +18,10 @@ import time
 from typing import List, Tuple, Optional, Set
 from .constants import BOARD_SIZE, INITIAL_TIME_SECONDS
 from .enums import PieceType, Player
-from .models import Piece
-from .database import db_manager  # Импортируем менеджер базы данных
+from .models import Piece, MoveTable
+from .zobrist import piece_key, board_key, state_key
+from .move_record import encode_moves
+from .position import Position, parse_position
 
 
 class CheckersGame:
@@ -40,13 +42,30 @@ class CheckersGame:
         move_history (List[Dict]): История всех ходов
         game_start_time (float): Время начала игры
         game_saved (bool): Флаг сохранения результата игры
+        position_version (int): Счетчик изменений позиции для кэша ходов
+        zobrist_key (int): 64-битный ключ Зобриста текущей позиции
+        result_sink: Приемник результатов игры или None
+        start_position (Optional[str]): Строка исходной позиции или None для
+            начальной расстановки
     """
 
-    def __init__(self):
+    def __init__(self, result_sink=None, position: Optional[str] = None):
         """Инициализирует новую игру в шашки.
 
-        Создает доску 8x8, расставляет шашки, устанавливает таймеры
-        и настраивает начальное состояние игры.
+        Создает доску 8x8, расставляет шашки (или загружает позицию из строки),
+        устанавливает таймеры и настраивает начальное состояние игры.
+
+        Args:
+            result_sink: Приемник результата партии - объект с методом
+                save_game_result(winner, white_pieces, black_pieces, white_time,
+                black_time, total_moves, game_duration, additional_info,
+                move_record) -> bool,
+                например DatabaseManager. По умолчанию None - результат не сохраняется
+            position (Optional[str]): Строка позиции (см. модуль position), с
+                которой начинается игра. По умолчанию None - начальная расстановка
+
+        Raises:
+            PositionError: Если строка позиции записана неверно
         """
         self.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
         self.current_player = Player.WHITE  # белые ходят первыми
@@ -59,10 +78,19 @@ class CheckersGame:
         self.last_time_update = time.time()  # время последнего обновления таймера
         self.multiple_capture = False  # нет множественного взятия
         self.captured_pieces_to_highlight = []  # нет шашек для подсветки
-        self.setup_board()  # расстановка шашек на доске
+        self.position_version = 0  # версия позиции для кэша допустимых ходов
+        self._move_table = None  # кэш допустимых ходов текущей позиции
+        self._placement_key = 0  # ключ Зобриста расстановки шашек
+        self._key_board = None  # доска, для которой посчитан ключ расстановки
+        self.start_position = None  # игра с начальной расстановки
+        if position is None:
+            self.setup_board()  # расстановка шашек на доске
+        else:
+            self.set_position(position)
         self.move_history = []  # история ходов
         self.game_start_time = time.time()  # время начала игры для статистики
         self.game_saved = False  # игра еще не сохранена в БД
+        self.result_sink = result_sink  # куда сохранять результат (None - никуда)
 
     def setup_board(self):
         """Расставляет шашки на доске в начальные позиции согласно правилам русских шашек.
@@ -82,6 +110,55 @@ class CheckersGame:
                 if (row + col) % 2 == 1:
                     self.board[row][col] = Piece(Player.WHITE)
 
+        self.invalidate_moves_cache()
+
+    @classmethod
+    def from_position(cls, position: str, result_sink=None) -> 'CheckersGame':
+        """Создает игру в позиции, заданной строкой, без начальной расстановки.
+
+        Args:
+            position (str): Строка позиции, например "W:W21,22,K30:B1,2"
+            result_sink: Приемник результатов, по умолчанию None
+
+        Returns:
+            CheckersGame: Игра в заданной позиции
+
+        Raises:
+            PositionError: Если строка позиции записана неверно
+        """
+        return cls(result_sink, position=position)
+
+    def set_position(self, position: str):
+        """Загружает позицию из строки, заменяя доску и сторону хода.
+
+        Выбор шашки, продолжение взятия и история ходов сбрасываются;
+        загруженная позиция становится исходной для записи партии.
+
+        Args:
+            position (str): Строка позиции
+
+        Raises:
+            PositionError: Если строка позиции записана неверно
+        """
+        parsed = parse_position(position)
+        self.board = parsed.to_board()
+        self.current_player = parsed.current_player
+        self.selected_piece = None
+        self.valid_moves = []
+        self.multiple_capture = False
+        self.captured_pieces_to_highlight = []
+        self.move_history = []
+        self.start_position = str(parsed)
+        self.invalidate_moves_cache()
+
+    def get_position(self) -> str:
+        """Возвращает текущую позицию строкой (доска и сторона хода).
+
+        Returns:
+            str: Строка позиции, например "W:W21,22,K30:B1,2"
+        """
+        return str(Position.from_board(self.board, self.current_player))
+
     def update_timer(self):
         """Обновляет таймеры игроков на основе прошедшего времени.
 
@@ -136,9 +213,107 @@ class CheckersGame:
             return self.board[row][col]
         return None
 
+    @property
+    def zobrist_key(self) -> int:
+        """Возвращает 64-битный ключ Зобриста текущей позиции.
+
+        Ключ учитывает расстановку шашек, сторону хода и шашку, продолжающую
+        взятие. Расстановка обновляется инкрементально в move_piece().
+
+        Returns:
+            int: Ключ позиции
+        """
+        continuation = self.selected_piece if self.multiple_capture else None
+        return state_key(self._get_placement_key(), self.current_player, continuation)
+
+    def _get_placement_key(self) -> int:
+        """Возвращает ключ расстановки, пересчитывая его, если доску заменили целиком."""
+        if self._key_board is not self.board:
+            self._placement_key = board_key(self.board)
+            self._key_board = self.board
+        return self._placement_key
+
+    def invalidate_moves_cache(self):
+        """Сбрасывает кэш допустимых ходов и пересчитывает ключ позиции.
+
+        Вызывается при расстановке шашек. Нужен, если доска изменяется
+        напрямую через board[row][col].
+        """
+        self._position_changed()
+        self._placement_key = board_key(self.board)
+        self._key_board = self.board
+
+    def snapshot(self) -> tuple:
+        """Запоминает состояние партии, которое меняет ход.
+
+        Сохраняются доска (вместе с типами шашек - превращение в дамку меняет
+        шашку на месте), сторона хода, выбор, продолжение взятия, окончание
+        партии и длина истории ходов. Часы и сохранение результата не
+        затрагиваются.
+
+        Returns:
+            tuple: Снимок для restore()
+        """
+        pieces = [(piece, piece.type) for row in self.board for piece in row if piece]
+        return ([row[:] for row in self.board], pieces, self.current_player,
+                self.multiple_capture, self.selected_piece, self.valid_moves,
+                self.captured_pieces_to_highlight, self.game_over, self.winner,
+                len(self.move_history), self._get_placement_key())
+
+    def restore(self, snapshot: tuple):
+        """Возвращает партию в состояние, запомненное snapshot().
+
+        Ходы, сделанные после снимка, удаляются из истории.
+
+        Args:
+            snapshot (tuple): Результат snapshot()
+        """
+        (board, pieces, self.current_player, self.multiple_capture,
+         self.selected_piece, self.valid_moves, self.captured_pieces_to_highlight,
+         self.game_over, self.winner, history_length, placement_key) = snapshot
+        self.board[:] = board
+        for piece, piece_type in pieces:
+            piece.type = piece_type
+        del self.move_history[history_length:]
+        self._position_changed()
+        self._placement_key, self._key_board = placement_key, self.board
+
+    def _position_changed(self):
+        """Отмечает изменение позиции: увеличивает версию и сбрасывает таблицу ходов."""
+        self.position_version += 1
+        self._move_table = None
+
+    def get_move_table(self) -> MoveTable:
+        """Возвращает таблицу допустимых ходов текущего игрока.
+
+        Таблица строится один раз для позиции и переиспользуется до следующего
+        хода (изменения position_version), смены текущего игрока или замены доски.
+
+        Returns:
+            MoveTable: Таблица взятий и простых ходов
+        """
+        table = self._move_table
+        if (table is not None and table.version == self.position_version and
+                table.player == self.current_player and table.board is self.board):
+            return table
+
+        captures = self._find_all_captures(self.current_player)
+        captures_by_piece = {}
+        max_captures = 0
+        for fr, fc, tr, tc, captured in captures:
+            captures_by_piece.setdefault((fr, fc), []).append((tr, tc, captured))
+            if len(captured) > max_captures:
+                max_captures = len(captured)
+
+        self._move_table = MoveTable(self.position_version, self.current_player, self.board,
+                                     captures, captures_by_piece, max_captures)
+        return self._move_table
+
     def get_all_possible_captures(self, player: Player):
         """Находит все возможные взятия для всех шашек указанного игрока.
 
+        Для текущего игрока результат берется из таблицы ходов позиции.
+
         Args:
             player (Player): Игрок (WHITE или BLACK)
 
@@ -146,6 +321,19 @@ class CheckersGame:
             List[Tuple]: Список всех возможных взятий в формате
                         (from_row, from_col, to_row, to_col, captured)
         """
+        if player == self.current_player:
+            return self.get_move_table().captures
+        return self._find_all_captures(player)
+
+    def _find_all_captures(self, player: Player):
+        """Перебирает доску и находит все взятия игрока без использования кэша.
+
+        Args:
+            player (Player): Игрок (WHITE или BLACK)
+
+        Returns:
+            List[Tuple]: Список взятий в формате (from_row, from_col, to_row, to_col, captured)
+        """
         all_captures = []
 
         for row in range(BOARD_SIZE):
@@ -215,13 +403,9 @@ class CheckersGame:
                     landing_row, landing_col = enemy_row + dr, enemy_col + dc
                     while 0 <= landing_row < BOARD_SIZE and 0 <= landing_col < BOARD_SIZE:
                         if not self.get_piece(landing_row, landing_col):
-                            # Сохраняем состояние доски
-                            original_board = [[self.board[r][c] for c in range(BOARD_SIZE)] for r in range(BOARD_SIZE)]
-
-                            # Временно делаем взятие
-                            self.board[landing_row][landing_col] = piece
-                            self.board[row][col] = None
-                            self.board[enemy_row][enemy_col] = None
+                            # Временно делаем взятие (меняются только три клетки)
+                            enemy_piece = self._make_capture(row, col, enemy_row, enemy_col,
+                                                             landing_row, landing_col, piece)
 
                             # Ищем дальнейшие взятия
                             new_captured = captured_so_far + [(enemy_row, enemy_col)]
@@ -229,7 +413,8 @@ class CheckersGame:
                                                                            new_captured, visited)
 
                             # Восстанавливаем доску
-                            self.board = original_board
+                            self._unmake_capture(row, col, enemy_row, enemy_col,
+                                                 landing_row, landing_col, piece, enemy_piece)
 
                             if further_captures:
                                 for fr, fc, fc_captured in further_captures:
@@ -258,13 +443,8 @@ class CheckersGame:
                     if (enemy_piece and enemy_piece.player != piece.player and
                             not jump_piece and (enemy_row, enemy_col) not in captured_so_far):
 
-                        # Сохраняем состояние доски
-                        original_board = [[self.board[r][c] for c in range(BOARD_SIZE)] for r in range(BOARD_SIZE)]
-
-                        # Временно делаем взятие
-                        self.board[jump_row][jump_col] = piece
-                        self.board[row][col] = None
-                        self.board[enemy_row][enemy_col] = None
+                        # Временно делаем взятие (меняются только три клетки)
+                        self._make_capture(row, col, enemy_row, enemy_col, jump_row, jump_col, piece)
 
                         # Ищем дальнейшие взятия
                         new_captured = captured_so_far + [(enemy_row, enemy_col)]
@@ -272,7 +452,8 @@ class CheckersGame:
                                                                        new_captured, visited)
 
                         # Восстанавливаем доску
-                        self.board = original_board
+                        self._unmake_capture(row, col, enemy_row, enemy_col,
+                                             jump_row, jump_col, piece, enemy_piece)
 
                         if further_captures:
                             for fr, fc, fc_captured in further_captures:
@@ -282,6 +463,44 @@ class CheckersGame:
 
         return captures
 
+    def _make_capture(self, row, col, enemy_row, enemy_col, landing_row, landing_col, piece):
+        """Временно выполняет один прыжок со взятием прямо на доске.
+
+        Args:
+            row (int): Ряд, с которого прыгает шашка
+            col (int): Столбец, с которого прыгает шашка
+            enemy_row (int): Ряд взятой шашки
+            enemy_col (int): Столбец взятой шашки
+            landing_row (int): Ряд клетки приземления
+            landing_col (int): Столбец клетки приземления
+            piece (Piece): Прыгающая шашка
+
+        Returns:
+            Piece: Снятая с доски шашка соперника (для отмены хода)
+        """
+        enemy_piece = self.board[enemy_row][enemy_col]
+        self.board[row][col] = None
+        self.board[enemy_row][enemy_col] = None
+        self.board[landing_row][landing_col] = piece
+        return enemy_piece
+
+    def _unmake_capture(self, row, col, enemy_row, enemy_col, landing_row, landing_col, piece, enemy_piece):
+        """Отменяет прыжок, выполненный _make_capture().
+
+        Args:
+            row (int): Ряд, с которого прыгала шашка
+            col (int): Столбец, с которого прыгала шашка
+            enemy_row (int): Ряд взятой шашки
+            enemy_col (int): Столбец взятой шашки
+            landing_row (int): Ряд клетки приземления
+            landing_col (int): Столбец клетки приземления
+            piece (Piece): Прыгавшая шашка
+            enemy_piece (Piece): Взятая шашка соперника
+        """
+        self.board[landing_row][landing_col] = None
+        self.board[enemy_row][enemy_col] = enemy_piece
+        self.board[row][col] = piece
+
     def get_simple_moves_for_piece(self, row: int, col: int, piece: Piece):
         """Получает простые ходы для шашки (без взятия).
 
@@ -338,22 +557,13 @@ class CheckersGame:
             return []
 
         # Проверяем, есть ли обязательные взятия у всего игрока
-        all_captures = self.get_all_possible_captures(self.current_player)
-
-        if all_captures:
-            # Находим максимальное количество взятий
-            max_captures = 0
-            for _, _, _, _, captured in all_captures:
-                if len(captured) > max_captures:
-                    max_captures = len(captured)
-
-            # Фильтруем только ходы с максимальным количеством взятий
-            best_captures = []
-            for fr, fc, tr, tc, captured in all_captures:
-                if fr == row and fc == col and len(captured) == max_captures:
-                    # Собираем шашки, которые будут взяты
-                    captured_coords = captured
-                    best_captures.append((tr, tc, captured_coords))
+        table = self.get_move_table()
+
+        if table.captures:
+            # Оставляем только ходы шашки с максимальным количеством взятий
+            best_captures = [(tr, tc, captured)
+                             for tr, tc, captured in table.captures_by_piece.get((row, col), [])
+                             if len(captured) == table.max_captures]
 
             if best_captures:
                 # Сохраняем шашки для подсветки
@@ -368,9 +578,80 @@ class CheckersGame:
         else:
             # Нет взятий - показываем простые ходы
             self.captured_pieces_to_highlight = []
-            simple_moves = self.get_simple_moves_for_piece(row, col, piece)
+            simple_moves = table.simple_moves.get((row, col))
+            if simple_moves is None:
+                simple_moves = self.get_simple_moves_for_piece(row, col, piece)
+                table.simple_moves[(row, col)] = simple_moves
             return [(mr, mc, []) for mr, mc in simple_moves]
 
+    def get_legal_moves(self):
+        """Возвращает все ходы текущего игрока, которые разрешает handle_click.
+
+        Одинаковые ходы (откуда, куда, множество взятых), найденные разными
+        путями взятия, возвращаются один раз.
+
+        Returns:
+            List[Tuple]: Ходы в формате (from_row, from_col, to_row, to_col, captured)
+        """
+        if self.game_over:
+            return []
+
+        moves = []
+        seen = set()
+
+        def add(from_row, from_col, to_row, to_col, captured):
+            key = (from_row, from_col, to_row, to_col, frozenset(captured))
+            if key not in seen:
+                seen.add(key)
+                moves.append((from_row, from_col, to_row, to_col, captured))
+
+        if self.multiple_capture:
+            from_row, from_col = self.selected_piece
+            for to_row, to_col, captured in self.valid_moves:
+                add(from_row, from_col, to_row, to_col, captured)
+            return moves
+
+        table = self.get_move_table()
+        if table.captures:
+            # у каждой шашки допустимы только ее самые длинные взятия
+            for (from_row, from_col), piece_captures in table.captures_by_piece.items():
+                longest = max(len(captured) for _, _, captured in piece_captures)
+                for to_row, to_col, captured in piece_captures:
+                    if len(captured) == longest:
+                        add(from_row, from_col, to_row, to_col, captured)
+            return moves
+
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                piece = self.board[row][col]
+                if piece and piece.player == self.current_player:
+                    for to_row, to_col in self.get_simple_moves_for_piece(row, col, piece):
+                        add(row, col, to_row, to_col, [])
+        return moves
+
+    def play_move(self, from_row, from_col, to_row, to_col, captured=None):
+        """Выполняет ход без кликов, проверив, что он допустим.
+
+        Args:
+            from_row (int): Исходный ряд
+            from_col (int): Исходный столбец
+            to_row (int): Целевой ряд
+            to_col (int): Целевой столбец
+            captured (Optional[List[Tuple[int, int]]]): Взятые шашки; нужны, если
+                в одну клетку можно прийти, взяв разные шашки
+
+        Returns:
+            bool: True если ход выполнен, False если такого хода нет
+        """
+        captured_set = None if captured is None else frozenset(captured)
+        for move in self.get_legal_moves():
+            if move[:4] == (from_row, from_col, to_row, to_col) and (
+                    captured_set is None or frozenset(move[4]) == captured_set):
+                self.selected_piece = (from_row, from_col)
+                self.valid_moves = [(to_row, to_col, move[4])]
+                return self.move_piece(from_row, from_col, to_row, to_col)
+        return False
+
     def move_piece(self, from_row, from_col, to_row, to_col):
         """Перемещает шашку на указанную позицию, выполняя взятия если необходимо.
 
@@ -406,9 +687,15 @@ class CheckersGame:
             'piece': piece
         })
 
-        # Выполняем ход
-        self.board[to_row][to_col] = piece
+        # Убираем из ключа позиции шашку на исходной клетке и взятые шашки
+        key = self._get_placement_key()
+        key ^= piece_key(from_row, from_col, piece)
+        for r, c in captured_pieces:
+            key ^= piece_key(r, c, self.board[r][c])
+
+        # Выполняем ход (сначала освобождаем клетку: взятие может закончиться на ней же)
         self.board[from_row][from_col] = None
+        self.board[to_row][to_col] = piece
 
         # Удаляем все взятые шашки
         for r, c in captured_pieces:
@@ -421,6 +708,12 @@ class CheckersGame:
             elif piece.player == Player.BLACK and to_row == BOARD_SIZE - 1:
                 piece.type = PieceType.KING
 
+        # Добавляем шашку на новой клетке (с учетом превращения)
+        self._placement_key = key ^ piece_key(to_row, to_col, piece)
+
+        # Позиция изменилась - таблица ходов устарела
+        self._position_changed()
+
         # Проверяем возможность дальнейшего взятия
         if captured_pieces:
             further_captures = self.get_captures_for_piece(to_row, to_col, piece)
@@ -507,9 +800,10 @@ class CheckersGame:
             self.save_game_result()  # Сохраняем результат
 
     def save_game_result(self):
-        """Сохраняет результат игры в базу данных.
+        """Сохраняет результат игры через приемник результатов.
 
-        Собирает статистику игры и сохраняет ее через DatabaseManager.
+        Собирает статистику игры и передает ее в result_sink. Если приемник
+        не задан, статистика не собирается и ничего не сохраняется.
 
         Returns:
             bool: True если сохранение успешно, False в противном случае
@@ -519,6 +813,9 @@ class CheckersGame:
 
         self.game_saved = True # предотваращаем повторное сохранение
 
+        if self.result_sink is None:
+            return False # сохранять некуда
+
         # Подсчитываем оставшиеся шашки и дамки
         white_pieces = 0
         black_pieces = 0
@@ -553,21 +850,20 @@ class CheckersGame:
             "white_queens": white_queens, # кол во дамок
             "black_queens": black_queens,
             "total_captures": sum(len(move['captured']) for move in self.move_history), # общее колво взятых шашек
+            # взятые каждой стороной: партия может начаться не с 12 шашек (set_position)
+            "white_captures": sum(len(move['captured']) for move in self.move_history
+                                  if move['piece'].player == Player.WHITE),
+            "black_captures": sum(len(move['captured']) for move in self.move_history
+                                  if move['piece'].player == Player.BLACK),
             "game_duration_seconds": game_duration_seconds,
-            "move_history_summary": [
-                {
-                    "from": move['from'], # откуда ходили
-                    "to": move['to'], # куда
-                    "captured_count": len(move['captured']), # сколько шашек взяли
-                    "piece_type": "king" if move['piece'].type == PieceType.KING else "man" # тип фигуры
-                }
-                for move in self.move_history[-20:]  # Последние 20 ходов
-            ]
         }
+        if self.start_position is not None:
+            # без исходной позиции запись ходов не воспроизвести (move_record.replay)
+            additional_info["start_position"] = self.start_position
 
-        # Сохраняем в базу данных через db_manager
+        # Передаем результат приемнику (например, в базу данных)
         try:
-            result = db_manager.save_game_result(
+            result = self.result_sink.save_game_result(
                 winner=winner,
                 white_pieces=white_pieces, # все что осталось и тд
                 black_pieces=black_pieces,
@@ -575,7 +871,8 @@ class CheckersGame:
                 black_time=self.black_time,
                 total_moves=total_moves,
                 game_duration=game_duration_str,
-                additional_info=additional_info
+                additional_info=additional_info,
+                move_record=encode_moves(self.move_history) # вся партия в двоичном виде
             )
 
             if result:
@@ -618,16 +915,13 @@ class CheckersGame:
                 self.captured_pieces_to_highlight = []
 
         # Проверяем, есть ли обязательные взятия у текущего игрока
-        all_captures = self.get_all_possible_captures(self.current_player)
+        table = self.get_move_table()
 
-        if all_captures:
+        if table.captures:
             # Есть обязательные взятия - можно выбрать только шашки, которые могут бить
             if piece and piece.player == self.current_player:
                 # Проверяем, может ли эта шашка бить
-                piece_captures = []
-                for fr, fc, tr, tc, captured in all_captures:
-                    if fr == row and fc == col:
-                        piece_captures.append((tr, tc, captured))
+                piece_captures = table.captures_by_piece.get((row, col), [])
 
                 if piece_captures:
                     self.selected_piece = (row, col)
@@ -11,16 +11,23 @@
     4. Панель управления с таймерами и кнопками
     5. Обработка пользовательского ввода
     6. Экран окончания игры
+    7. Оверлей профилировщика времени кадра (клавиша F3)
 """
 
 import pygame
 import sys
 import time
+from contextlib import nullcontext
 from typing import Optional, Tuple
 from .constants import *
 from .game_logic import CheckersGame
 from .enums import Player
-from .models import Piece
+from .renderer import PieceRenderer
+from .surface_cache import SurfaceCache
+from .dirty_rects import DirtyRectTracker
+from .text_cache import TextCache
+from .utils import create_gradient_surface
+from .frame_pacing import idle_timeout, seconds_to_next_tick
 
 
 class CheckersGUI:
@@ -39,19 +46,64 @@ class CheckersGUI:
         last_pulse_time (float): Время последней пульсации
         restart_button_rect: Область кнопки "Новая игра"
         exit_button_rect: Область кнопки "Выход"
+        ai_player: Компьютерный соперник (AIPlayer) или None для игры двух людей
+        piece_renderer (PieceRenderer): Отрисовщик шашек
+        result_sink: Приемник результатов партий (например, DatabaseManager) или None
+        board_theme (Tuple[Tuple, Tuple]): Цвета светлого и темного дерева доски
+        surfaces (SurfaceCache): Кэш заранее отрисованных поверхностей
+        dirty_rendering (bool): Перерисовывать только изменившиеся области экрана
+        dirty_tracker (DirtyRectTracker): Трекер изменившихся областей
+        text (TextCache): Кэш шрифтов и отрисованных надписей
+        profiler (Optional[FrameProfiler]): Профилировщик времени кадра или None
+        show_profiler (bool): Показывать оверлей профилировщика (клавиша F3)
+        adaptive_pacing (bool): Рисовать с полным FPS только во время анимаций,
+            а в остальное время ждать события или смены секунды таймера
     """
 
-    def __init__(self):
+    RULES = [
+        "ПРАВИЛА:",
+        "• Обязательное взятие",
+        "• Множественное взятие",
+        "• Дамки ходят свободно",
+        "• 7 минут на партию"
+    ]
+
+    def __init__(self, ai_player=None, result_sink=None, dirty_rendering=True, profiler=None,
+                 adaptive_pacing=True):
         """Инициализирует графический интерфейс игры.
 
         Создает окно PyGame, настраивает заголовок, иконку, шрифты
         и создает экземпляр игровой логики.
+
+        Args:
+            ai_player (Optional[AIPlayer]): Компьютерный соперник, по умолчанию нет
+            result_sink: Куда сохранять результаты партий, по умолчанию никуда
+            dirty_rendering (bool): Обновлять на экране только изменившиеся
+                области (pygame.display.update(rects)), по умолчанию True.
+                False - каждый кадр перерисовывается целиком
+            profiler (Optional[FrameProfiler]): Замерять время этапов кадра,
+                по умолчанию нет. Если задан, оверлей со статистикой виден
+                сразу и переключается клавишей F3
+            adaptive_pacing (bool): Без анимаций ждать события или смены
+                секунды таймера вместо отрисовки FPS кадров в секунду,
+                по умолчанию True
         """
         # Создаем окно с заголовком
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("♔ Русские Шашки - Профессиональная Версия ♚")
         self.clock = pygame.time.Clock()
-        self.game = CheckersGame()
+        self.result_sink = result_sink
+        self.game = CheckersGame(result_sink)
+        self.ai_player = ai_player
+        self.piece_renderer = PieceRenderer()
+        self.board_theme = (LIGHT_WOOD, DARK_WOOD)
+        self.surfaces = SurfaceCache()
+        self.dirty_rendering = dirty_rendering
+        self.dirty_tracker = DirtyRectTracker()
+        self.profiler = profiler
+        self.show_profiler = profiler is not None
+        self._profiler_overlay = None  # (отметка времени, поверхность)
+        self.adaptive_pacing = adaptive_pacing
 
         # Флаг для предотвращения повторного сохранения
         self.game_saved = False
@@ -66,78 +118,85 @@ class CheckersGUI:
         except:
             pass
 
-        # Загружаем шрифты
-        try:
-            self.font_large = pygame.font.Font(None, 48)  # для заголовков
-            self.font_medium = pygame.font.Font(None, 32)  # для основного текста
-            self.font_small = pygame.font.Font(None, 24)  # для мелкого текста
-            self.font_tiny = pygame.font.Font(None, 18)  # для очень мелкого текста
-        except:
-            # если шрифт по умолчанию не доступен, используем системный Arial
-            self.font_large = pygame.font.SysFont('arial', 48, bold=True)
-            self.font_medium = pygame.font.SysFont('arial', 32)
-            self.font_small = pygame.font.SysFont('arial', 24)
-            self.font_tiny = pygame.font.SysFont('arial', 18)
+        # Загружаем шрифты (если шрифт по умолчанию не доступен, TextCache
+        # использует системный Arial)
+        self.text = TextCache()
+        self.font_large = self.text.font(48, bold=True)  # для заголовков
+        self.font_medium = self.text.font(32)  # для основного текста
+        self.font_small = self.text.font(24)  # для мелкого текста
+        self.font_tiny = self.text.font(18)  # для очень мелкого текста
 
             # переменные для анимационных эффектов
         self.pulse_value = 0  # текущее значение для пульсации
         self.last_pulse_time = 0  # время последней пульсации
 
-    def draw_gradient_rect(self, rect, color1, color2, vertical=True):
+    def draw_gradient_rect(self, rect, color1, color2, vertical=True, surface=None):
         """Рисует прямоугольник с градиентной заливкой на экране.
 
+        Градиент строится один раз (utils.create_gradient_surface) и копируется.
+
         Args:
             rect: Объект pygame.Rect или кортеж (x, y, width, height)
             color1 (Tuple[int, int, int]): Начальный цвет градиента (RGB)
             color2 (Tuple[int, int, int]): Конечный цвет градиента (RGB)
             vertical (bool): Направление градиента (True - вертикальный)
+            surface: Поверхность для рисования, по умолчанию экран
         """
-        if vertical:
-            for y in range(rect.height):
-                ratio = y / rect.height
-                r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-                g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-                b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-                pygame.draw.line(self.screen, (r, g, b),
-                                 (rect.x, rect.y + y),
-                                 (rect.x + rect.width, rect.y + y))
-        else:
-            for x in range(rect.width):
-                ratio = x / rect.width
-                r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-                g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-                b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-                pygame.draw.line(self.screen, (r, g, b),
-                                 (rect.x + x, rect.y),
-                                 (rect.x + x, rect.y + rect.height))
+        rect = pygame.Rect(rect)
+        target = self.screen if surface is None else surface
+        target.blit(create_gradient_surface(rect.width, rect.height, color1, color2, vertical), rect)
 
-    def draw_board(self):
-        """Отрисовывает игровую доску с клетками и подсветками.
+    def set_board_theme(self, light_wood, dark_wood):
+        """Меняет цвета доски; фон доски будет отрисован заново.
 
-        Рисует:
-        1. Клетки доски в шахматном порядке с градиентами
-        2. Подсветку шашек для обязательного взятия (красная пульсация)
-        3. Подсветку допустимых ходов (зеленая пульсация)
-        4. Подсветку выбранной шашки (золотая рамка)
+        Args:
+            light_wood (Tuple[int, int, int]): Цвет светлых клеток
+            dark_wood (Tuple[int, int, int]): Цвет темных клеток
         """
-        self.screen.fill(BACKGROUND)
+        self.board_theme = (tuple(light_wood), tuple(dark_wood))
 
-        # Рисуем доску
+    def get_board_surface(self):
+        """Возвращает фон доски (клетки с градиентами), отрисованный один раз.
+
+        Поверхность строится заново только при смене размера клетки или
+        цветов доски.
+
+        Returns:
+            pygame.Surface: Фон доски размером BOARD_SIZE * SQUARE_SIZE
+        """
+        key = ("board", SQUARE_SIZE, self.board_theme)
+        return self.surfaces.get(key, self._build_board_surface)
+
+    def _build_board_surface(self):
+        """Рисует клетки доски в шахматном порядке с градиентами."""
+        light_wood, dark_wood = self.board_theme
+        surface = pygame.Surface((BOARD_SIZE * SQUARE_SIZE, BOARD_SIZE * SQUARE_SIZE))
         for row in range(BOARD_SIZE):
             for col in range(BOARD_SIZE):
-                x = col * SQUARE_SIZE
-                y = row * SQUARE_SIZE
-
+                cell_rect = pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
                 if (row + col) % 2 == 0:
-                    cell_rect = pygame.Rect(x, y, SQUARE_SIZE, SQUARE_SIZE)
                     self.draw_gradient_rect(cell_rect,
-                                            (LIGHT_WOOD[0] + 10, LIGHT_WOOD[1] + 10, LIGHT_WOOD[2] + 10),
-                                            LIGHT_WOOD)
+                                            (light_wood[0] + 10, light_wood[1] + 10, light_wood[2] + 10),
+                                            light_wood, surface=surface)
                 else:
-                    cell_rect = pygame.Rect(x, y, SQUARE_SIZE, SQUARE_SIZE)
                     self.draw_gradient_rect(cell_rect,
-                                            DARK_WOOD,
-                                            (DARK_WOOD[0] - 10, DARK_WOOD[1] - 10, DARK_WOOD[2] - 10))
+                                            dark_wood,
+                                            (dark_wood[0] - 10, dark_wood[1] - 10, dark_wood[2] - 10),
+                                            surface=surface)
+        return surface
+
+    def draw_board(self):
+        """Отрисовывает игровую доску с клетками и подсветками.
+
+        Рисует:
+        1. Клетки доски (готовый фон из кэша, см. get_board_surface)
+        2. Подсветку шашек для обязательного взятия (красная пульсация)
+        3. Подсветку допустимых ходов (зеленая пульсация)
+        4. Подсветку выбранной шашки (золотая рамка)
+        """
+        # Доска, статусная панель и боковая панель вместе закрывают все окно,
+        # поэтому отдельная заливка фона не нужна
+        self.screen.blit(self.get_board_surface(), (0, 0))
 
         # Подсветка шашек, которые можно взять (обязательное взятие)
         if self.game.captured_pieces_to_highlight:
@@ -212,7 +271,7 @@ class CheckersGUI:
     def draw_pieces(self):
         """Отрисовывает все шашки на игровой доске.
 
-        Использует метод draw() класса Piece для отрисовки каждой шашки
+        Использует PieceRenderer для отрисовки каждой шашки
         с учетом ее типа (простая/дамка) и состояния (выделена/не выделена).
         """
         for row in range(BOARD_SIZE):
@@ -225,22 +284,14 @@ class CheckersGUI:
                     selected = (self.game.selected_piece and
                                 (row, col) == self.game.selected_piece)
 
-                    piece.draw(self.screen, center_x, center_y, SQUARE_SIZE, selected)
+                    self.piece_renderer.draw(self.screen, piece, center_x, center_y, SQUARE_SIZE, selected)
 
-    def draw_status_bar(self):
-        """Отрисовывает нижнюю статусную панель с информацией о ходе игры.
+    def get_status_text(self):
+        """Возвращает текст статусной панели для текущего состояния игры.
 
-        Отображает:
-        1. Текущее состояние игры (ожидание хода, обязательное взятие, конец игры)
-        2. Причину окончания игры (время, шашки)
+        Returns:
+            str: Текст статуса (не длиннее 40 символов)
         """
-        status_rect = pygame.Rect(0, BOARD_SIZE * SQUARE_SIZE, WIDTH, 50)
-        self.draw_gradient_rect(status_rect, STATUS_BAR, (STATUS_BAR[0] - 5, STATUS_BAR[1] - 5, STATUS_BAR[2] - 5))
-
-        pygame.draw.line(self.screen, PANEL_ACCENT,
-                         (0, BOARD_SIZE * SQUARE_SIZE),
-                         (WIDTH, BOARD_SIZE * SQUARE_SIZE), 2)
-
         status_text = ""
         if self.game.game_over:
             if self.game.white_time <= 0:
@@ -261,83 +312,167 @@ class CheckersGUI:
         # Обрезаем текст, если он слишком длинный
         if len(status_text) > 40:
             status_text = status_text[:37] + "..."
+        return status_text
+
+    def draw_status_bar(self):
+        """Отрисовывает нижнюю статусную панель с информацией о ходе игры.
+
+        Отображает:
+        1. Текущее состояние игры (ожидание хода, обязательное взятие, конец игры)
+        2. Причину окончания игры (время, шашки)
+        """
+        self.screen.blit(self.surfaces.get(("status_bar",), self._build_status_layer),
+                         (0, BOARD_SIZE * SQUARE_SIZE))
 
-        status_surface = self.font_small.render(status_text, True, TEXT_LIGHT)
+        status_text = self.get_status_text()
+        status_surface = self.text.render(status_text, self.font_small, TEXT_LIGHT)
         text_rect = status_surface.get_rect(midleft=(20, BOARD_SIZE * SQUARE_SIZE + 25))
         self.screen.blit(status_surface, text_rect)
 
-    def draw_panel(self):
-        """Отрисовывает правую боковую панель с управлением и информацией.
-
-        Содержит:
-        1. Таймеры игроков с подсветкой активного игрока
-        2. Информацию о текущем ходе и счете шашек
-        3. Список правил игры
-        4. Кнопки управления (Новая игра, Выход)
-        """
-        panel_rect = pygame.Rect(BOARD_SIZE * SQUARE_SIZE, 0, 300, HEIGHT)
-        self.draw_gradient_rect(panel_rect, PANEL_COLOR,
-                                (PANEL_COLOR[0] - 10, PANEL_COLOR[1] - 10, PANEL_COLOR[2] - 10))
+    def _build_status_layer(self):
+        """Рисует фон статусной панели с разделительной линией."""
+        surface = pygame.Surface((WIDTH, 50))
+        self.draw_gradient_rect(pygame.Rect(0, 0, WIDTH, 50), STATUS_BAR,
+                                (STATUS_BAR[0] - 5, STATUS_BAR[1] - 5, STATUS_BAR[2] - 5), surface=surface)
+        pygame.draw.line(surface, PANEL_ACCENT, (0, 0), (WIDTH, 0), 2)
+        return surface
+
+    def _build_panel_layer(self):
+        """Рисует неизменяемую часть боковой панели: фон, заголовок и правила."""
+        surface = pygame.Surface((300, HEIGHT))
+        self.draw_gradient_rect(pygame.Rect(0, 0, 300, HEIGHT), PANEL_COLOR,
+                                (PANEL_COLOR[0] - 10, PANEL_COLOR[1] - 10, PANEL_COLOR[2] - 10),
+                                surface=surface)
 
         for i in range(3):
-            pygame.draw.line(self.screen,
+            pygame.draw.line(surface,
                              (PANEL_ACCENT[0] + i * 10, PANEL_ACCENT[1] + i * 10, PANEL_ACCENT[2] + i * 10),
-                             (BOARD_SIZE * SQUARE_SIZE + i, 0),
-                             (BOARD_SIZE * SQUARE_SIZE + i, HEIGHT), 1)
+                             (i, 0), (i, HEIGHT), 1)
 
         # Заголовок
-        title = self.font_medium.render("ШАШКИ", True, ACCENT_GOLD)
-        title_rect = title.get_rect(center=(BOARD_SIZE * SQUARE_SIZE + 150, 30))
-        self.screen.blit(title, title_rect)
+        title = self.text.render("ШАШКИ", self.font_medium, ACCENT_GOLD)
+        surface.blit(title, title.get_rect(center=(150, 30)))
 
-        timer_height = 100
+        # Правила (с переносами строк)
+        rules = self.get_panel_layout()["rules"]
+        for i, rule in enumerate(self.RULES):
+            rule_surface = self.text.render(rule, self.font_tiny, TEXT_DARK if i == 0 else (160, 160, 180))
+            rule_rect = rule_surface.get_rect(midleft=(rules.left - BOARD_SIZE * SQUARE_SIZE,
+                                                       rules.top + 11 + i * 22))
+            surface.blit(rule_surface, rule_rect)
+        return surface
 
-        # Белые таймер
-        white_timer_rect = pygame.Rect(BOARD_SIZE * SQUARE_SIZE + 30, 60, 240, timer_height)
-        is_active = self.game.current_player == Player.WHITE and not self.game.game_over
-        timer_color1 = (PANEL_ACCENT[0] + 20, PANEL_ACCENT[1] + 20, PANEL_ACCENT[2] + 20) if is_active else PANEL_ACCENT
-        timer_color2 = (timer_color1[0] - 10, timer_color1[1] - 10, timer_color1[2] - 10)
+    def get_timer_layer(self, player, is_active):
+        """Возвращает рамку таймера с подписью, отрисованную один раз.
 
-        self.draw_gradient_rect(white_timer_rect, timer_color1, timer_color2)
-        border_color = ACCENT_SILVER if is_active else (100, 100, 120)
-        pygame.draw.rect(self.screen, border_color, white_timer_rect, 3, border_radius=12)
+        Args:
+            player (Player): Чей таймер
+            is_active (bool): Таймер игрока, который сейчас ходит
 
-        time_text = self.game.format_time(self.game.white_time)
-        color = ACCENT_RED if self.game.white_time < 60 and not self.game.game_over else TEXT_LIGHT
-        time_surface = self.font_large.render(time_text, True, color)
-        time_rect = time_surface.get_rect(center=white_timer_rect.center)
-        self.screen.blit(time_surface, time_rect)
+        Returns:
+            pygame.Surface: Рамка таймера без времени
+        """
+        def build():
+            rect = self.get_panel_layout()["white_timer"]
+            surface = pygame.Surface(rect.size)
+            timer_color1 = (PANEL_ACCENT[0] + 20, PANEL_ACCENT[1] + 20, PANEL_ACCENT[2] + 20) if is_active else PANEL_ACCENT
+            timer_color2 = (timer_color1[0] - 10, timer_color1[1] - 10, timer_color1[2] - 10)
+            self.draw_gradient_rect(surface.get_rect(), timer_color1, timer_color2, surface=surface)
+            border_color = ACCENT_SILVER if is_active else (100, 100, 120)
+            pygame.draw.rect(surface, border_color, surface.get_rect(), 3, border_radius=12)
 
-        label = self.font_small.render("БЕЛЫЕ", True, ACCENT_SILVER if is_active else TEXT_DARK)
-        label_rect = label.get_rect(center=(white_timer_rect.centerx, white_timer_rect.top + 20))
-        self.screen.blit(label, label_rect)
+            label = self.text.render("БЕЛЫЕ" if player == Player.WHITE else "ЧЕРНЫЕ", self.font_small,
+                                     ACCENT_SILVER if is_active else TEXT_DARK)
+            surface.blit(label, label.get_rect(center=(rect.width // 2, 20)))
+            return surface
 
-        # Черные таймер
-        black_timer_rect = pygame.Rect(BOARD_SIZE * SQUARE_SIZE + 30, 60 + timer_height + 20, 240, timer_height)
-        is_active = self.game.current_player == Player.BLACK and not self.game.game_over
-        timer_color1 = (PANEL_ACCENT[0] + 20, PANEL_ACCENT[1] + 20, PANEL_ACCENT[2] + 20) if is_active else PANEL_ACCENT
-        timer_color2 = (timer_color1[0] - 10, timer_color1[1] - 10, timer_color1[2] - 10)
+        return self.surfaces.get(("timer", player, is_active), build)
 
-        self.draw_gradient_rect(black_timer_rect, timer_color1, timer_color2)
-        border_color = ACCENT_SILVER if is_active else (100, 100, 120)
-        pygame.draw.rect(self.screen, border_color, black_timer_rect, 3, border_radius=12)
+    def get_button_layer(self, name, hover):
+        """Возвращает кнопку панели с надписью, отрисованную один раз.
 
-        time_text = self.game.format_time(self.game.black_time)
-        color = ACCENT_RED if self.game.black_time < 60 and not self.game.game_over else TEXT_LIGHT
-        time_surface = self.font_large.render(time_text, True, color)
-        time_rect = time_surface.get_rect(center=black_timer_rect.center)
-        self.screen.blit(time_surface, time_rect)
+        Args:
+            name (str): "restart" или "exit"
+            hover (bool): Курсор над кнопкой
+
+        Returns:
+            pygame.Surface: Кнопка
+        """
+        def build():
+            rect = self.get_panel_layout()[name]
+            surface = pygame.Surface(rect.size)
+            if name == "restart":
+                color1 = ACCENT_BLUE if not hover else (ACCENT_BLUE[0] + 20, ACCENT_BLUE[1] + 20, ACCENT_BLUE[2] + 20)
+                border_color, label = LIGHT_BLUE, "НОВАЯ ИГРА"
+            else:
+                color1 = (100, 50, 50) if not hover else (120, 60, 60)
+                border_color, label = (200, 100, 100), "ВЫХОД"
+            color2 = (color1[0] - 20, color1[1] - 20, color1[2] - 20)
+
+            self.draw_gradient_rect(surface.get_rect(), color1, color2, surface=surface)
+            pygame.draw.rect(surface, border_color, surface.get_rect(), 3, border_radius=8)
+            text = self.text.render(label, self.font_medium, TEXT_LIGHT)
+            surface.blit(text, text.get_rect(center=surface.get_rect().center))
+            return surface
+
+        return self.surfaces.get(("button", name, hover), build)
+
+    def get_panel_layout(self):
+        """Возвращает расположение изменяемых элементов боковой панели.
+
+        Returns:
+            Dict[str, pygame.Rect]: Прямоугольники "white_timer", "black_timer",
+                "info" (ход и счет шашек), "rules" (список правил, по 22 пикселя
+                на строку), "restart" и "exit" (кнопки)
+        """
+        left = BOARD_SIZE * SQUARE_SIZE
+        timer_height = 100
+        white_timer = pygame.Rect(left + 30, 60, 240, timer_height)
+        black_timer = pygame.Rect(left + 30, 60 + timer_height + 20, 240, timer_height)
+        info_y = black_timer.bottom + 30
+        rules_y = info_y + 35 + 40
+        button_y = rules_y + len(self.RULES) * 22 + 25
+        return {
+            "white_timer": white_timer,
+            "black_timer": black_timer,
+            "info": pygame.Rect(left + 3, info_y - 20, 297, 75),
+            "rules": pygame.Rect(left + 30, rules_y - 11, 240, len(self.RULES) * 22),
+            "restart": pygame.Rect(left + 30, button_y, 240, 45),
+            "exit": pygame.Rect(left + 30, button_y + 60, 240, 45),
+        }
+
+    def draw_panel(self):
+        """Отрисовывает правую боковую панель с управлением и информацией.
+
+        Содержит:
+        1. Таймеры игроков с подсветкой активного игрока
+        2. Информацию о текущем ходе и счете шашек
+        3. Список правил игры
+        4. Кнопки управления (Новая игра, Выход)
+        """
+        # Фон, заголовок и правила
+        self.screen.blit(self.surfaces.get(("panel",), self._build_panel_layer), (BOARD_SIZE * SQUARE_SIZE, 0))
+
+        layout = self.get_panel_layout()
 
-        label = self.font_small.render("ЧЕРНЫЕ", True, ACCENT_SILVER if is_active else TEXT_DARK)
-        label_rect = label.get_rect(center=(black_timer_rect.centerx, black_timer_rect.top + 20))
-        self.screen.blit(label, label_rect)
+        # Таймеры: готовая рамка с подписью и время поверх нее
+        for name, player, seconds in (("white_timer", Player.WHITE, self.game.white_time),
+                                      ("black_timer", Player.BLACK, self.game.black_time)):
+            timer_rect = layout[name]
+            is_active = self.game.current_player == player and not self.game.game_over
+            self.screen.blit(self.get_timer_layer(player, is_active), timer_rect)
+
+            time_text = self.game.format_time(seconds)
+            color = ACCENT_RED if seconds < 60 and not self.game.game_over else TEXT_LIGHT
+            time_surface = self.text.render(time_text, self.font_large, color)
+            self.screen.blit(time_surface, time_surface.get_rect(center=timer_rect.center))
 
         # Информация о ходе
-        info_y = black_timer_rect.bottom + 30
+        info_y = layout["info"].top + 20
 
         player_text = "ХОД БЕЛЫХ" if self.game.current_player == Player.WHITE else "ХОД ЧЕРНЫХ"
-        player_surface = self.font_medium.render(player_text, True,
-                                                 ACCENT_SILVER if self.game.current_player == Player.WHITE else TEXT_DARK)
+        player_surface = self.text.render(player_text, self.font_medium,
+                                          ACCENT_SILVER if self.game.current_player == Player.WHITE else TEXT_DARK)
         player_rect = player_surface.get_rect(center=(BOARD_SIZE * SQUARE_SIZE + 150, info_y))
         self.screen.blit(player_surface, player_rect)
 
@@ -347,59 +482,17 @@ class CheckersGUI:
 
         count_y = info_y + 35
         count_text = f" Белые: {white_count}  |  Черные: {black_count}"
-        count_surface = self.font_small.render(count_text, True, TEXT_LIGHT)
+        count_surface = self.text.render(count_text, self.font_small, TEXT_LIGHT)
         count_rect = count_surface.get_rect(center=(BOARD_SIZE * SQUARE_SIZE + 150, count_y))
         self.screen.blit(count_surface, count_rect)
 
-        # Правила (с переносами строк)
-        rules_y = count_y + 40
-        rules = [
-            "ПРАВИЛА:",
-            "• Обязательное взятие",
-            "• Множественное взятие",
-            "• Дамки ходят свободно",
-            "• 7 минут на партию"
-        ]
-
-        for i, rule in enumerate(rules):
-            rule_surface = self.font_tiny.render(rule, True, TEXT_DARK if i == 0 else (160, 160, 180))
-            rule_rect = rule_surface.get_rect(midleft=(BOARD_SIZE * SQUARE_SIZE + 30, rules_y + i * 22))
-            self.screen.blit(rule_surface, rule_rect)
-
-        # Кнопки управления
-        button_y = rules_y + len(rules) * 22 + 25
-
-        # Кнопка рестарта
-        restart_rect = pygame.Rect(BOARD_SIZE * SQUARE_SIZE + 30, button_y, 240, 45)
+        # Кнопки управления (обычное состояние или наведение)
         mouse_pos = pygame.mouse.get_pos()
-        restart_hover = restart_rect.collidepoint(mouse_pos)
-
-        restart_color1 = ACCENT_BLUE if not restart_hover else (ACCENT_BLUE[0] + 20, ACCENT_BLUE[1] + 20,
-                                                                ACCENT_BLUE[2] + 20)
-        restart_color2 = (restart_color1[0] - 20, restart_color1[1] - 20, restart_color1[2] - 20)
-
-        self.draw_gradient_rect(restart_rect, restart_color1, restart_color2)
-        pygame.draw.rect(self.screen, LIGHT_BLUE, restart_rect, 3, border_radius=8)
-
-        restart_text = self.font_medium.render("НОВАЯ ИГРА", True, TEXT_LIGHT)
-        restart_rect_text = restart_text.get_rect(center=restart_rect.center)
-        self.screen.blit(restart_text, restart_rect_text)
-        self.restart_button_rect = restart_rect
-
-        # Кнопка выхода
-        exit_rect = pygame.Rect(BOARD_SIZE * SQUARE_SIZE + 30, button_y + 60, 240, 45)
-        exit_hover = exit_rect.collidepoint(mouse_pos)
-
-        exit_color1 = (100, 50, 50) if not exit_hover else (120, 60, 60)
-        exit_color2 = (exit_color1[0] - 20, exit_color1[1] - 20, exit_color1[2] - 20)
-
-        self.draw_gradient_rect(exit_rect, exit_color1, exit_color2)
-        pygame.draw.rect(self.screen, (200, 100, 100), exit_rect, 3, border_radius=8)
-
-        exit_text = self.font_medium.render("ВЫХОД", True, TEXT_LIGHT)
-        exit_rect_text = exit_text.get_rect(center=exit_rect.center)
-        self.screen.blit(exit_text, exit_rect_text)
-        self.exit_button_rect = exit_rect
+        for name in ("restart", "exit"):
+            button_rect = layout[name]
+            self.screen.blit(self.get_button_layer(name, button_rect.collidepoint(mouse_pos)), button_rect)
+        self.restart_button_rect = layout["restart"]
+        self.exit_button_rect = layout["exit"]
 
     def draw_game_over_screen(self):
         """Отрисовывает экран окончания игры с информацией о победителе.
@@ -420,14 +513,11 @@ class CheckersGUI:
                 print("Не удалось сохранить результат игры")
             self.game_saved = True
 
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # Более темный фон для лучшей читаемости
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.surfaces.get(("game_over_dim",), self._build_dim_layer), (0, 0))
 
-        # Увеличиваем размеры окна
+        # Окно с рамкой, подсказками и украшениями рисуется один раз
         win_rect = pygame.Rect(WIDTH // 2 - 300, HEIGHT // 2 - 180, 600, 360)  # Было 400x240, теперь 600x360
-        self.draw_gradient_rect(win_rect, (50, 50, 70), (30, 30, 50))
-        pygame.draw.rect(self.screen, ACCENT_GOLD, win_rect, 8, border_radius=20)  # Более толстая рамка
+        self.screen.blit(self.surfaces.get(("game_over_window",), self._build_game_over_window), win_rect)
 
         # Заголовок победителя - увеличенный шрифт
         if self.game.winner == Player.WHITE:
@@ -439,11 +529,11 @@ class CheckersGUI:
 
         # Заголовок с эффектом тени
         shadow_offset = 3
-        shadow_text = pygame.font.Font(None, 64).render(winner_text, True, (0, 0, 0, 150))
+        shadow_text = self.text.render(winner_text, self.text.font(64), (0, 0, 0, 150))
         shadow_rect = shadow_text.get_rect(center=(WIDTH // 2 + shadow_offset, HEIGHT // 2 - 120 + shadow_offset))
         self.screen.blit(shadow_text, shadow_rect)
 
-        win_title = pygame.font.Font(None, 64).render(winner_text, True, ACCENT_GOLD)
+        win_title = self.text.render(winner_text, self.text.font(64), ACCENT_GOLD)
         win_title_rect = win_title.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 120))
         self.screen.blit(win_title, win_title_rect)
 
@@ -464,12 +554,12 @@ class CheckersGUI:
             additional_info = f"Белые: {white_count} шашек  |  Черные: {black_count} шашек"
 
         # Основная причина
-        reason_surface = pygame.font.Font(None, 36).render(reason, True, color)
+        reason_surface = self.text.render(reason, self.text.font(36), color)
         reason_rect = reason_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 60))
         self.screen.blit(reason_surface, reason_rect)
 
         # Дополнительная информация
-        info_surface = pygame.font.Font(None, 28).render(additional_info, True, (200, 200, 220))
+        info_surface = self.text.render(additional_info, self.text.font(28), (200, 200, 220))
         info_rect = info_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 20))
         self.screen.blit(info_surface, info_rect)
 
@@ -477,12 +567,25 @@ class CheckersGUI:
         white_time_str = self.game.format_time(self.game.white_time)
         black_time_str = self.game.format_time(self.game.black_time)
         time_stats = f"Оставшееся время: Белые: {white_time_str}  |  Черные: {black_time_str}"
-        time_surface = pygame.font.Font(None, 24).render(time_stats, True, (180, 180, 200))
+        time_surface = self.text.render(time_stats, self.text.font(24), (180, 180, 200))
         time_rect = time_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 20))
         self.screen.blit(time_surface, time_rect)
 
-        # Подсказки управления - более заметные
-        hint_y = HEIGHT // 2 + 70
+    def _build_dim_layer(self):
+        """Создает полупрозрачное затемнение всего окна."""
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 200))  # Более темный фон для лучшей читаемости
+        return overlay
+
+    def _build_game_over_window(self):
+        """Рисует окно окончания игры без текста о результате."""
+        surface = pygame.Surface((600, 360))
+        win_rect = surface.get_rect()
+        self.draw_gradient_rect(win_rect, (50, 50, 70), (30, 30, 50), surface=surface)
+        pygame.draw.rect(surface, ACCENT_GOLD, win_rect, 8, border_radius=20)  # Более толстая рамка
+
+        # Подсказки управления - более заметные (координаты внутри окна)
+        hint_y = 180 + 70
         hints = [
             "Нажмите R для новой игры",
             "Нажмите ESC для выхода",
@@ -490,18 +593,18 @@ class CheckersGUI:
         ]
 
         for i, hint in enumerate(hints):
-            hint_surface = pygame.font.Font(None, 24).render(hint, True, TEXT_LIGHT if i == 2 else (200, 200, 220))
-            hint_rect = hint_surface.get_rect(center=(WIDTH // 2, hint_y + i * 30))
+            hint_surface = self.text.render(hint, self.text.font(24), TEXT_LIGHT if i == 2 else (200, 200, 220))
+            hint_rect = hint_surface.get_rect(center=(win_rect.centerx, hint_y + i * 30))
 
             # Подсветка последней подсказки
             if i == 2:
                 hint_bg = pygame.Surface((hint_surface.get_width() + 20, hint_surface.get_height() + 10),
                                          pygame.SRCALPHA)
                 hint_bg.fill((40, 40, 60, 200))
-                hint_bg_rect = hint_bg.get_rect(center=(WIDTH // 2, hint_y + i * 30))
-                self.screen.blit(hint_bg, hint_bg_rect)
+                hint_bg_rect = hint_bg.get_rect(center=(win_rect.centerx, hint_y + i * 30))
+                surface.blit(hint_bg, hint_bg_rect)
 
-            self.screen.blit(hint_surface, hint_rect)
+            surface.blit(hint_surface, hint_rect)
 
         # Декоративные элементы по углам
         corner_size = 30
@@ -513,11 +616,127 @@ class CheckersGUI:
         ]
 
         for corner_x, corner_y in corners:
-            pygame.draw.circle(self.screen, ACCENT_GOLD, (corner_x, corner_y), 8)
-            pygame.draw.circle(self.screen, (255, 200, 0), (corner_x, corner_y), 5)
+            pygame.draw.circle(surface, ACCENT_GOLD, (corner_x, corner_y), 8)
+            pygame.draw.circle(surface, (255, 200, 0), (corner_x, corner_y), 5)
+        return surface
 
-    def draw(self):
-        """Основной метод отрисовки, который вызывает все компоненты интерфейса.
+    def _stage(self, name):
+        """Возвращает контекст замера этапа кадра.
+
+        Args:
+            name (str): Имя этапа
+
+        Returns:
+            Контекстный менеджер профилировщика или пустой контекст, если
+            профилировщик не задан
+        """
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name)
+
+    def get_profiler_overlay(self):
+        """Возвращает поверхность оверлея профилировщика.
+
+        Таблица p50/p95/p99 по этапам строится заново не чаще раза в
+        PROFILER_OVERLAY_REFRESH мс, чтобы цифры можно было прочитать и
+        оверлей сам не занимал заметную часть кадра.
+
+        Returns:
+            Tuple[int, pygame.Surface]: Отметка обновления и поверхность оверлея
+        """
+        stamp = pygame.time.get_ticks() // PROFILER_OVERLAY_REFRESH
+        if self._profiler_overlay is not None and self._profiler_overlay[0] == stamp:
+            return self._profiler_overlay
+
+        font = self.font_tiny
+        line_height = font.get_linesize() + 2
+        name_width, column_width, padding = 130, 56, 6
+        rows = [("этап, мс", "p50", "p95", "p99")]
+        for name, stats in self.profiler.summary().items():
+            rows.append((name, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}"))
+
+        surface = pygame.Surface((name_width + column_width * 3 + padding * 2,
+                                  line_height * len(rows) + padding * 2), pygame.SRCALPHA)
+        surface.fill(PROFILER_OVERLAY_BACKGROUND)
+        for index, row in enumerate(rows):
+            y = padding + index * line_height
+            color = ACCENT_GOLD if index == 0 else TEXT_LIGHT
+            surface.blit(font.render(row[0], True, color), (padding, y))
+            # числа выравниваются по правому краю столбца
+            for column, value in enumerate(row[1:]):
+                label = font.render(value, True, color)
+                right = padding + name_width + column_width * (column + 1)
+                surface.blit(label, (right - label.get_width(), y))
+
+        self._profiler_overlay = (stamp, surface)
+        return self._profiler_overlay
+
+    def get_profiler_overlay_rect(self):
+        """Возвращает область оверлея профилировщика (левый верхний угол доски).
+
+        Returns:
+            pygame.Rect: Прямоугольник оверлея
+        """
+        return self.get_profiler_overlay()[1].get_rect(topleft=(8, 8))
+
+    def draw_profiler_overlay(self):
+        """Отрисовывает статистику профилировщика поверх кадра."""
+        with self._stage("profiler_overlay"):
+            self.screen.blit(self.get_profiler_overlay()[1], self.get_profiler_overlay_rect())
+
+    def collect_regions(self):
+        """Описывает текущий кадр набором областей для DirtyRectTracker.
+
+        Подпись области включает все, от чего зависит ее картинка. Клетки
+        с пульсирующей подсветкой получают в подписи текущее время, то есть
+        перерисовываются каждый кадр, пока подсветка видна.
+
+        Returns:
+            Dict[Hashable, Tuple[pygame.Rect, Hashable]]: Имя -> (прямоугольник, подпись)
+        """
+        ticks = pygame.time.get_ticks()
+        selected = self.game.selected_piece
+        targets = {(row, col) for row, col, _ in self.game.valid_moves} if selected else set()
+        captures = set(self.game.captured_pieces_to_highlight)
+
+        regions = {}
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                piece = self.game.board[row][col]
+                rect = pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+                animated = (row, col) == selected or (row, col) in targets or (row, col) in captures
+                if animated:
+                    rect.inflate_ip(HIGHLIGHT_GLOW_MARGIN * 2, HIGHLIGHT_GLOW_MARGIN * 2)
+                signature = ((piece.player, piece.type) if piece else None, ticks if animated else None)
+                regions[("square", row, col)] = (rect, signature)
+
+        regions["status"] = (pygame.Rect(0, BOARD_SIZE * SQUARE_SIZE, WIDTH, 50), self.get_status_text())
+
+        layout = self.get_panel_layout()
+        game_over = self.game.game_over
+        for name, player, seconds in (("white_timer", Player.WHITE, self.game.white_time),
+                                      ("black_timer", Player.BLACK, self.game.black_time)):
+            active = self.game.current_player == player and not game_over
+            warning = seconds < 60 and not game_over
+            regions[name] = (layout[name], (self.game.format_time(seconds), active, warning))
+
+        white_count = sum(1 for row in self.game.board for piece in row if piece and piece.player == Player.WHITE)
+        black_count = sum(1 for row in self.game.board for piece in row if piece and piece.player == Player.BLACK)
+        regions["info"] = (layout["info"], (self.game.current_player, white_count, black_count))
+
+        mouse_pos = pygame.mouse.get_pos()
+        for name in ("restart", "exit"):
+            regions[name] = (layout[name], layout[name].collidepoint(mouse_pos))
+
+        if game_over:
+            regions["game_over"] = (pygame.Rect(0, 0, WIDTH, HEIGHT), self.game.winner)
+        if self.profiler is not None and self.show_profiler:
+            stamp, _ = self.get_profiler_overlay()
+            regions["profiler"] = (self.get_profiler_overlay_rect(), stamp)
+        return regions
+
+    def draw_frame(self, area=None):
+        """Рисует кадр целиком или только части, пересекающие область.
 
         Порядок отрисовки:
         1. Игровая доска
@@ -525,17 +744,67 @@ class CheckersGUI:
         3. Статусная панель
         4. Боковая панель управления
         5. Экран окончания игры (если игра завершена)
+        6. Оверлей профилировщика (если включен)
+
+        Args:
+            area (Optional[pygame.Rect]): Перерисовываемая область, None - весь экран
         """
-        self.draw_board()
-        self.draw_pieces()
-        self.draw_status_bar()
-        self.draw_panel()
+        board_rect = pygame.Rect(0, 0, BOARD_SIZE * SQUARE_SIZE, BOARD_SIZE * SQUARE_SIZE)
+        status_rect = pygame.Rect(0, BOARD_SIZE * SQUARE_SIZE, WIDTH, 50)
+        panel_rect = pygame.Rect(BOARD_SIZE * SQUARE_SIZE, 0, 300, HEIGHT)
+
+        if area is None or area.colliderect(board_rect):
+            with self._stage("draw_board"):
+                self.draw_board()
+            with self._stage("draw_pieces"):
+                self.draw_pieces()
+        if area is None or area.colliderect(status_rect):
+            with self._stage("draw_status_bar"):
+                self.draw_status_bar()
+        if area is None or area.colliderect(panel_rect):
+            with self._stage("draw_panel"):
+                self.draw_panel()
 
         # Отрисовываем экран окончания игры поверх всего
         if self.game.game_over:
-            self.draw_game_over_screen()
+            with self._stage("draw_game_over_screen"):
+                self.draw_game_over_screen()
+
+        if self.profiler is not None and self.show_profiler:
+            if area is None or area.colliderect(self.get_profiler_overlay_rect()):
+                self.draw_profiler_overlay()
 
-        pygame.display.flip()
+    def draw(self):
+        """Основной метод отрисовки, который вызывает все компоненты интерфейса.
+
+        В режиме dirty_rendering кадр сравнивается с предыдущим (collect_regions),
+        перерисовываются только изменившиеся области (с обрезкой по ним) и на
+        экран выводятся только они. Если ничего не изменилось, кадр не рисуется.
+        Иначе кадр рисуется целиком и выводится через pygame.display.flip().
+        """
+        if not self.dirty_rendering:
+            self.draw_frame()
+            with self._stage("present"):
+                pygame.display.flip()
+            return
+
+        screen_rect = self.screen.get_rect()
+        with self._stage("collect_regions"):
+            rects = self.dirty_tracker.update(self.collect_regions(), screen_rect)
+        if not rects:
+            return
+        if rects[0] == screen_rect:
+            self.draw_frame()
+            with self._stage("present"):
+                pygame.display.flip()
+            return
+
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.draw_frame(rect)
+        self.screen.set_clip(None)
+        with self._stage("present"):
+            pygame.display.update(rects)
 
     def get_board_position(self, pos):
         """Преобразует координаты мыши в позицию на игровой доске.
@@ -578,54 +847,149 @@ class CheckersGUI:
 
         return None
 
+    def is_ai_turn(self):
+        """Проверяет, должен ли сейчас ходить компьютер.
+
+        Returns:
+            bool: True если соперник-компьютер задан, игра идет и его очередь ходить
+        """
+        return (self.ai_player is not None and not self.game.game_over and
+                self.game.current_player == self.ai_player.player)
+
     def restart_game(self):
         """Перезапускает игру, создавая новый экземпляр CheckersGame.
 
         Сбрасывает все игровые состояния, таймеры и флаги сохранения.
         """
-        self.game = CheckersGame()
+        self.game = CheckersGame(self.result_sink)
         self.game_saved = False  # Сбрасываем флаг сохранения при новой игре
 
+    def is_animating(self):
+        """Проверяет, нужно ли рисовать кадры с полным FPS.
+
+        Returns:
+            bool: True если на доске пульсирует подсветка (выбранная шашка,
+                ходы, обязательные взятия), ходит компьютер или ожидается
+                полная перерисовка
+        """
+        return (self.game.selected_piece is not None or
+                bool(self.game.captured_pieces_to_highlight) or
+                self.is_ai_turn() or self.dirty_tracker.full_redraw)
+
+    def get_idle_timeout(self):
+        """Возвращает, сколько миллисекунд можно ждать события до следующего кадра.
+
+        Returns:
+            int: 0 - рисовать без ожидания; иначе время до смены секунды на
+                таймере текущего игрока или обновления оверлея профилировщика
+        """
+        wake_after = []
+        if not self.game.game_over:
+            seconds = self.game.white_time if self.game.current_player == Player.WHITE else self.game.black_time
+            wake_after.append(seconds_to_next_tick(seconds))
+        if self.profiler is not None and self.show_profiler:
+            ticks = pygame.time.get_ticks()
+            wake_after.append((PROFILER_OVERLAY_REFRESH - ticks % PROFILER_OVERLAY_REFRESH) / 1000)
+        return idle_timeout(self.is_animating(), wake_after)
+
+    def wait_for_events(self, timeout):
+        """Возвращает накопившиеся события, при необходимости дождавшись первого.
+
+        Args:
+            timeout (int): Наибольшее ожидание в миллисекундах, 0 - не ждать
+
+        Returns:
+            List[pygame.event.Event]: События (пустой список, если время вышло)
+        """
+        if timeout <= 0:
+            return pygame.event.get()
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def toggle_profiler(self):
+        """Показывает или скрывает оверлей профилировщика (клавиша F3).
+
+        Без профилировщика ничего не делает.
+        """
+        if self.profiler is None:
+            return
+        self.show_profiler = not self.show_profiler
+
     def run(self):
         """Основной игровой цикл, обрабатывающий события и обновляющий экран.
 
         Цикл:
         1. Обрабатывает события PyGame (клики, клавиши, закрытие)
         2. Обновляет игровой таймер
-        3. Отрисовывает интерфейс
-        4. Поддерживает стабильный FPS
+        3. Делает ход за компьютер, если сейчас его очередь
+        4. Отрисовывает интерфейс
+        5. Ограничивает частоту кадров значением FPS
+
+        В режиме adaptive_pacing цикл без анимаций спит в ожидании события
+        или смены секунды таймера (get_idle_timeout), а не рисует FPS
+        кадров в секунду.
+
+        Если задан профилировщик, время каждого этапа замеряется (ожидание
+        событий и clock.tick в кадр не входят), а при выходе трасса
+        сохраняется в его trace_path.
 
         Выход из цикла происходит при закрытии окна или нажатии ESC.
         """
         running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        button = self.check_button_click(event.pos)
-                        if button == "RESTART":
-                            self.restart_game()
-                        elif button == "EXIT":
+        try:
+            while running:
+                events = self.wait_for_events(self.get_idle_timeout() if self.adaptive_pacing else 0)
+                if self.profiler is not None:
+                    self.profiler.begin_frame()
+
+                with self._stage("events"):
+                    for event in events:
+                        if event.type == pygame.QUIT:
                             running = False
-                        else:
-                            pos = self.get_board_position(event.pos)
-                            if pos:
-                                self.game.handle_click(*pos)
-
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        self.restart_game()
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
-
-            # Обновляем таймер
-            self.game.update_timer()
 
-            self.draw()
-            self.clock.tick(FPS)
+                        elif event.type == pygame.MOUSEBUTTONDOWN:
+                            if event.button == 1:
+                                button = self.check_button_click(event.pos)
+                                if button == "RESTART":
+                                    self.restart_game()
+                                elif button == "EXIT":
+                                    running = False
+                                else:
+                                    pos = self.get_board_position(event.pos)
+                                    if pos and not self.is_ai_turn():
+                                        self.game.handle_click(*pos)
+
+                        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                            # окно было перекрыто или восстановлено - рисуем все заново
+                            self.dirty_tracker.invalidate()
+
+                        elif event.type == pygame.KEYDOWN:
+                            if event.key == pygame.K_r:
+                                self.restart_game()
+                            elif event.key == pygame.K_F3:
+                                self.toggle_profiler()
+                            elif event.key == pygame.K_ESCAPE:
+                                running = False
+
+                # Обновляем таймер
+                with self._stage("update_timer"):
+                    self.game.update_timer()
+
+                # Ход компьютера (время поиска списывается с его таймера)
+                if self.is_ai_turn():
+                    with self._stage("ai_move"):
+                        self.ai_player.play(self.game)
+                        self.game.update_timer()
+
+                self.draw()
+                if self.profiler is not None:
+                    self.profiler.end_frame()
+                self.clock.tick(FPS)
+        finally:
+            if self.profiler is not None:
+                self.profiler.save()
 
         pygame.quit()
-        sys.exit()
\ No newline at end of file
+        sys.exit()
@@ -0,0 +1,157 @@
+"""
+Модуль компактной двоичной записи партии.
+
+Полная история ходов (CheckersGame.move_history) упаковывается в несколько
+байт на ход и хранится в столбце BYTEA move_record таблицы game_results.
+По записи партия восстанавливается ход за ходом (replay).
+
+Формат (версия 1):
+    1. Байт версии формата
+    2. Количество ходов - 2 байта (big-endian)
+    3. Битовый поток, для каждого хода:
+       - клетка "откуда" - 5 бит (номер игровой клетки 0..31)
+       - клетка "куда" - 5 бит
+       - количество взятых шашек - 4 бита
+       - взятые шашки - по 5 бит, разностью с предыдущей клеткой по модулю 32
+         (для первой взятой - с клеткой "откуда")
+    Последний байт дополняется нулевыми битами.
+
+Каждая запись move_history - отдельный ход, включая продолжение взятия
+новой дамкой, поэтому партия воспроизводится через CheckersGame.play_move.
+Партия, начатая из позиции, воспроизводится из той же позиции (replay(position=...)).
+"""
+
+from typing import List, Optional, Tuple
+from .bitboard import SQUARE_COUNT, coords_to_square, square_to_coords
+
+FORMAT_VERSION = 1
+SQUARE_BITS = 5  # номер клетки 0..31
+COUNT_BITS = 4  # взятых за ход не больше 12
+MAX_MOVES = 0xFFFF
+
+RecordedMove = Tuple[Tuple[int, int], Tuple[int, int], List[Tuple[int, int]]]
+
+
+class MoveRecordError(ValueError):
+    """Исключение: запись партии повреждена или содержит недопустимый ход."""
+
+
+def encode_moves(moves) -> bytes:
+    """Упаковывает ходы партии в байты.
+
+    Args:
+        moves (Iterable): Записи move_history (словари с ключами 'from', 'to',
+            'captured') или кортежи (from, to, captured)
+
+    Returns:
+        bytes: Двоичная запись партии
+
+    Raises:
+        MoveRecordError: Если ходов слишком много или во взятии больше 15 шашек
+    """
+    moves = list(moves)
+    if len(moves) > MAX_MOVES:
+        raise MoveRecordError(f"Слишком много ходов для записи: {len(moves)}")
+
+    bits = 0
+    bit_count = 0
+    for move in moves:
+        if isinstance(move, dict):
+            from_pos, to_pos, captured = move['from'], move['to'], move['captured']
+        else:
+            from_pos, to_pos, captured = move
+        if len(captured) >= 1 << COUNT_BITS:
+            raise MoveRecordError(f"Слишком много взятых шашек: {len(captured)}")
+
+        from_square = coords_to_square(*from_pos)
+        fields = [(from_square, SQUARE_BITS), (coords_to_square(*to_pos), SQUARE_BITS),
+                  (len(captured), COUNT_BITS)]
+        previous = from_square
+        for pos in captured:
+            square = coords_to_square(*pos)
+            fields.append(((square - previous) % SQUARE_COUNT, SQUARE_BITS))
+            previous = square
+
+        for value, width in fields:
+            bits = bits << width | value
+            bit_count += width
+
+    padding = -bit_count % 8
+    body = (bits << padding).to_bytes((bit_count + padding) // 8, 'big')
+    return bytes([FORMAT_VERSION]) + len(moves).to_bytes(2, 'big') + body
+
+
+def decode_moves(data: bytes) -> List[RecordedMove]:
+    """Распаковывает двоичную запись партии.
+
+    Args:
+        data (bytes): Запись из encode_moves() (подходят bytes и memoryview)
+
+    Returns:
+        List[RecordedMove]: Ходы в формате ((from_row, from_col), (to_row, to_col), captured)
+
+    Raises:
+        MoveRecordError: Если запись повреждена или другой версии
+    """
+    data = bytes(data)
+    if len(data) < 3 or data[0] != FORMAT_VERSION:
+        raise MoveRecordError("Неизвестный формат записи партии")
+
+    move_count = int.from_bytes(data[1:3], 'big')
+    body = data[3:]
+    bits = int.from_bytes(body, 'big')
+    remaining = len(body) * 8
+
+    def read(width):
+        nonlocal remaining
+        if remaining < width:
+            raise MoveRecordError("Запись партии обрезана")
+        remaining -= width
+        return bits >> remaining & ((1 << width) - 1)
+
+    moves = []
+    for _ in range(move_count):
+        from_square = read(SQUARE_BITS)
+        to_square = read(SQUARE_BITS)
+        captured = []
+        previous = from_square
+        for _ in range(read(COUNT_BITS)):
+            previous = (previous + read(SQUARE_BITS)) % SQUARE_COUNT
+            captured.append(square_to_coords(previous))
+        moves.append((square_to_coords(from_square), square_to_coords(to_square), captured))
+
+    if remaining >= 8 or bits & ((1 << remaining) - 1):
+        raise MoveRecordError("Лишние данные в конце записи партии")
+    return moves
+
+
+def replay(data: bytes, result_sink=None, position: Optional[str] = None):
+    """Восстанавливает партию по двоичной записи.
+
+    Каждый ход проверяется правилами игры, поэтому поврежденная или чужая
+    запись не может привести к недопустимой позиции.
+
+    Args:
+        data (bytes): Запись из encode_moves()
+        result_sink: Приемник результатов для созданной игры, по умолчанию None
+        position (Optional[str]): Исходная позиция партии (CheckersGame.start_position,
+            в базе - additional_info["start_position"]), None - начальная расстановка
+
+    Returns:
+        CheckersGame: Игра в позиции после всех записанных ходов
+
+    Raises:
+        MoveRecordError: Если запись повреждена, исходная позиция неверна
+            или ход недопустим
+    """
+    from .game_logic import CheckersGame
+    from .position import PositionError
+
+    try:
+        game = CheckersGame(result_sink, position=position)
+    except PositionError as e:
+        raise MoveRecordError(f"Неверная исходная позиция: {e}") from None
+    for number, ((from_row, from_col), (to_row, to_col), captured) in enumerate(decode_moves(data), 1):
+        if not game.play_move(from_row, from_col, to_row, to_col, captured):
+            raise MoveRecordError(f"Недопустимый ход {number} в записи партии")
+    return game
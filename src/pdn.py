@@ -0,0 +1,490 @@
+"""
+Модуль импорта и экспорта партий в формате PDN (Portable Draughts Notation).
+
+Клетки записываются алгебраически: столбцы a-h слева направо, горизонтали
+1-8 снизу вверх (ряд 7 доски - первая горизонталь, там стоят белые).
+Тихий ход - "c3-d4", взятие - "c3:e5" или с промежуточными клетками
+"c3:e5:g3" (вместо ":" допускается "x").
+
+Особенности:
+    1. Экспорт move_history игры в PDN с тегами (GameType 25 - русские шашки)
+    2. Потоковое чтение: read_games() принимает итерируемые строки (например,
+       открытый файл) и выдает партии по одной, не загружая архив в память
+    3. Проверка и воспроизведение каждой партии правилами CheckersGame,
+       в том числе с исходной позицией из тега FEN
+    4. Продолжение взятия новой дамкой записывается одним ходом с
+       промежуточной клеткой превращения; если в ту же клетку ведет другое
+       взятие, записываются все промежуточные клетки пути
+    5. Комментарии {...} и ; ..., варианты (...) и оценки ходов (!, ?) пропускаются
+
+Запуск из командной строки (проверка архива):
+    python -m src.pdn games.pdn
+"""
+
+import argparse
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .constants import BOARD_SIZE
+from .enums import Player, PieceType
+from .game_logic import CheckersGame
+from .position import FILES, PositionError, parse_square_name
+
+RESULTS = ("2-0", "0-2", "1-1", "*")  # победа белых, победа черных, ничья, не окончена
+LINE_WIDTH = 79
+
+_TAG_RE = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]$')
+_MOVE_NUMBER_RE = re.compile(r'^\d+\.+')
+_MOVE_RE = re.compile(r'^[a-h][1-8](?:[-:x][a-h][1-8])+$')
+_SQUARE_RE = re.compile(r'[a-h][1-8]')
+
+
+class PdnError(ValueError):
+    """Исключение: ошибка разбора или недопустимый ход в PDN."""
+
+
+@dataclass
+class PdnGame:
+    """Класс, представляющий партию, прочитанную из PDN.
+
+    Attributes:
+        tags (Dict[str, str]): Теги партии (Event, White, Black, Result и др.)
+        moves (List[str]): Ходы в порядке игры, например ["c3-d4", "f6-e5"]
+        result (str): Результат из текста ходов ("2-0", "0-2", "1-1" или "*")
+        line (int): Номер строки файла, с которой начинается партия
+    """
+    tags: Dict[str, str] = field(default_factory=dict)
+    moves: List[str] = field(default_factory=list)
+    result: str = "*"
+    line: int = 0
+
+
+def square_name(row: int, col: int) -> str:
+    """Возвращает название клетки в алгебраической записи (ряд 7 - первая горизонталь).
+
+    Args:
+        row (int): Ряд клетки
+        col (int): Столбец клетки
+
+    Returns:
+        str: Название клетки, например "c3"
+    """
+    return f"{FILES[col]}{BOARD_SIZE - row}"
+
+
+def parse_square(name: str) -> Tuple[int, int]:
+    """Переводит алгебраическое название клетки в (ряд, столбец).
+
+    Args:
+        name (str): Название клетки, например "c3"
+
+    Returns:
+        Tuple[int, int]: Координаты клетки на доске
+
+    Raises:
+        PdnError: Если название неверно или клетка светлая
+    """
+    try:
+        return parse_square_name(name)
+    except PositionError as e:
+        raise PdnError(str(e)) from None
+
+
+def _direction(start: Tuple[int, int], end: Tuple[int, int]) -> Tuple[int, int]:
+    """Возвращает шаг по диагонали от start в сторону end."""
+    return (end[0] > start[0]) - (end[0] < start[0]), (end[1] > start[1]) - (end[1] < start[1])
+
+
+def capture_path(start: Tuple[int, int], captured: List[Tuple[int, int]],
+                 end: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """Восстанавливает клетки, на которые встает шашка после каждого взятия.
+
+    Шашка встает сразу за взятой, а дамка - на первую клетку за взятой,
+    с которой по диагонали видна следующая взятая шашка. Если дамка бьет
+    дальше по той же линии, подходит любая клетка до следующей взятой;
+    выбирается первая.
+
+    Args:
+        start (Tuple[int, int]): Клетка, с которой начинается взятие
+        captured (List[Tuple[int, int]]): Взятые шашки в порядке взятия
+        end (Tuple[int, int]): Клетка, на которой взятие заканчивается
+
+    Returns:
+        List[Tuple[int, int]]: Клетки после каждого взятия, последняя - end
+    """
+    path = []
+    current = start
+    for index, enemy in enumerate(captured[:-1]):
+        step_row, step_col = _direction(current, enemy)
+        next_row, next_col = captured[index + 1]
+        row, col = enemy[0] + step_row, enemy[1] + step_col
+        while 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+            if next_row != row and abs(next_row - row) == abs(next_col - col):
+                break
+            row, col = row + step_row, col + step_col
+        else:
+            row, col = enemy[0] + step_row, enemy[1] + step_col  # взятие записано неверно
+        current = (row, col)
+        path.append(current)
+    path.append(end)
+    return path
+
+
+def _turn_points(points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Оставляет в ломаной только начало, конец и точки поворота."""
+    turns = points[:1]
+    for index in range(1, len(points) - 1):
+        if _direction(turns[-1], points[index]) != _direction(points[index], points[index + 1]):
+            turns.append(points[index])
+    return turns + points[-1:]
+
+
+def _trajectory(points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Возвращает все клетки, по которым проходит ломаная (без начальной)."""
+    squares = []
+    for start, end in zip(points, points[1:]):
+        step_row, step_col = _direction(start, end)
+        row, col = start
+        while (row, col) != end:
+            row, col = row + step_row, col + step_col
+            squares.append((row, col))
+    return squares
+
+
+def _path_score(move, listed: List[Tuple[int, int]]) -> int:
+    """Оценивает, насколько записанные промежуточные клетки соответствуют ходу.
+
+    Args:
+        move (Tuple): Ход (from_row, from_col, to_row, to_col, captured)
+        listed (List[Tuple[int, int]]): Промежуточные клетки из записи хода
+
+    Returns:
+        int: 2 - записан путь этого хода, 1 - клетки лежат на его пути по
+            порядку (или не записаны), 0 - ход не подходит
+    """
+    start, end = tuple(move[:2]), tuple(move[2:4])
+    if move[4]:
+        points = [start] + capture_path(start, move[4], end)
+    else:
+        points = [start, end]
+    if _turn_points([start] + listed + [end]) == _turn_points(points):
+        return 2
+    remaining = iter(_trajectory(points)[:-1])
+    return 1 if all(square in remaining for square in listed) else 0
+
+
+def _promotes(game, move) -> bool:
+    """Проверяет, превращается ли простая шашка в дамку этим ходом."""
+    piece = game.board[move[0]][move[1]]
+    crown_row = 0 if piece.player == Player.WHITE else BOARD_SIZE - 1
+    return piece.type == PieceType.MAN and move[2] == crown_row
+
+
+def history_to_moves(move_history, start_position: Optional[str] = None) -> List[Tuple[Player, str]]:
+    """Переводит историю ходов игры в ходы PDN.
+
+    Продолжение взятия той же шашкой (после превращения в дамку) сливается
+    с предыдущим взятием в один ход через клетку превращения. Если в ту же
+    клетку можно прийти другим взятием, записываются и промежуточные
+    клетки, чтобы при чтении был выбран именно этот путь.
+
+    Args:
+        move_history (List[Dict]): CheckersGame.move_history
+        start_position (Optional[str]): Исходная позиция партии, None - начальная
+
+    Returns:
+        List[Tuple[Player, str]]: (кто ходил, запись хода)
+    """
+    # партия переигрывается, чтобы знать допустимые ходы перед каждым ходом
+    game = CheckersGame(position=start_position)
+    moves = []
+    previous = None
+    for entry in move_history:
+        landings = []
+        if game is not None and entry['captured']:
+            endpoints = (*entry['from'], *entry['to'])
+            if sum(1 for move in game.get_legal_moves() if move[:4] == endpoints) > 1:
+                landings = capture_path(entry['from'], entry['captured'], entry['to'])[:-1]
+        squares = [square_name(*square) for square in landings + [entry['to']]]
+
+        if (previous is not None and previous['captured'] and entry['captured'] and
+                entry['piece'] is previous['piece'] and entry['from'] == previous['to']):
+            player, text = moves[-1]
+            moves[-1] = (player, ":".join([text] + squares))
+        else:
+            separator = ":" if entry['captured'] else "-"
+            moves.append((entry['piece'].player,
+                          f"{square_name(*entry['from'])}{separator}{':'.join(squares)}"))
+
+        if game is not None and not game.play_move(*entry['from'], *entry['to'], entry['captured']):
+            game = None  # история не переигрывается - дальше пишем только концы ходов
+        previous = entry
+    return moves
+
+
+def game_result(game) -> str:
+    """Возвращает результат партии в записи PDN.
+
+    Args:
+        game (CheckersGame): Игра
+
+    Returns:
+        str: "2-0", "0-2" или "*" для неоконченной партии
+    """
+    if not game.game_over:
+        return "*"
+    return "2-0" if game.winner == Player.WHITE else "0-2"
+
+
+def export_game(game, tags: Optional[Dict[str, str]] = None) -> str:
+    """Записывает партию в формате PDN.
+
+    Args:
+        game (CheckersGame): Игра
+        tags (Optional[Dict[str, str]]): Дополнительные или заменяющие теги
+
+    Returns:
+        str: Текст партии в PDN, заканчивающийся пустой строкой
+    """
+    result = game_result(game)
+    all_tags = {
+        "Event": "Шашки на PyGame",
+        "Date": date.today().strftime("%Y.%m.%d"),
+        "White": "white",
+        "Black": "black",
+        "Result": result,
+        "GameType": "25",
+    }
+    if game.start_position is not None:
+        all_tags["SetUp"] = "1"
+        all_tags["FEN"] = game.start_position
+    all_tags.update(tags or {})
+
+    lines = [f'[{name} "{value}"]' for name, value in all_tags.items()]
+    lines.append("")
+
+    tokens = []
+    number = 1
+    for index, (player, text) in enumerate(history_to_moves(game.move_history, game.start_position)):
+        if player == Player.WHITE:
+            tokens.append(f"{number}.")
+        elif index == 0:
+            tokens.append(f"{number}...")  # партия начинается ходом черных
+        if player == Player.BLACK:
+            number += 1
+        tokens.append(text)
+    tokens.append(result)
+
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > LINE_WIDTH:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return "\n".join(lines) + "\n\n"
+
+
+def read_games(lines: Iterable[str]) -> Iterator[PdnGame]:
+    """Читает партии из PDN по одной.
+
+    Строки обрабатываются по мере чтения, поэтому архив любого размера
+    можно передать открытым файлом.
+
+    Args:
+        lines (Iterable[str]): Строки PDN (например, открытый текстовый файл)
+
+    Yields:
+        PdnGame: Очередная партия
+
+    Raises:
+        PdnError: Если в тексте ходов встретился неизвестный токен
+    """
+    game = None
+    in_comment = False
+    variation_depth = 0
+
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+
+        if not in_comment and variation_depth == 0 and line.startswith("["):
+            match = _TAG_RE.match(line)
+            if not match:
+                raise PdnError(f"Строка {line_number}: неверный тег {line}")
+            if game is not None and game.moves:
+                yield game  # новая партия без результата в конце предыдущей
+                game = None
+            if game is None:
+                game = PdnGame(line=line_number)
+            game.tags[match.group(1)] = match.group(2).replace('\\"', '"')
+            continue
+
+        position = 0
+        while position < len(line):
+            char = line[position]
+            if in_comment:
+                end = line.find("}", position)
+                if end < 0:
+                    break
+                in_comment = False
+                position = end + 1
+                continue
+            if char == "{":
+                in_comment = True
+                position += 1
+                continue
+            if char == ";":
+                break  # комментарий до конца строки
+            if char == "(":
+                variation_depth += 1
+                position += 1
+                continue
+            if char == ")":
+                variation_depth = max(0, variation_depth - 1)
+                position += 1
+                continue
+            if char.isspace():
+                position += 1
+                continue
+
+            end = position
+            while end < len(line) and not line[end].isspace() and line[end] not in "{}();":
+                end += 1
+            token = line[position:end]
+            position = end
+            if variation_depth:
+                continue
+
+            if game is None:
+                game = PdnGame(line=line_number)
+            if token in RESULTS:
+                game.result = token
+                yield game
+                game = None
+                continue
+
+            token = _MOVE_NUMBER_RE.sub("", token).rstrip("!?")
+            if not token:
+                continue
+            if not _MOVE_RE.match(token):
+                raise PdnError(f"Строка {line_number}: неизвестный ход {token}")
+            game.moves.append(token)
+
+    if game is not None and (game.moves or game.tags):
+        yield game
+
+
+def play_pdn_move(game, text: str):
+    """Выполняет в игре ход, записанный в PDN.
+
+    Записанные клетки проходятся по порядку. Ход игры выбирается по
+    начальной и конечной клеткам, а если таких ходов несколько - по пути
+    взятия через записанные промежуточные клетки. Ход игры заканчивается
+    на промежуточной клетке только при превращении в дамку посреди взятия
+    (продолжение взятия - отдельный ход игры).
+
+    Args:
+        game (CheckersGame): Игра
+        text (str): Запись хода, например "c3-d4" или "c3:e5:g3"
+
+    Raises:
+        PdnError: Если ход недопустим
+    """
+    squares = [parse_square(name) for name in _SQUARE_RE.findall(text)]
+    is_capture = "-" not in text
+    last = len(squares) - 1
+    current = squares[0]
+    player = game.current_player
+
+    index = 1
+    while True:
+        best = None
+        for move in game.get_legal_moves():
+            if move[:2] != current or bool(move[4]) != is_capture:
+                continue
+            for target_index in range(index, last + 1):
+                if squares[target_index] != move[2:4]:
+                    continue
+                if target_index < last and not _promotes(game, move):
+                    continue
+                score = _path_score(move, squares[index:target_index])
+                if score and (best is None or score > best[0]):
+                    best = (score, move, target_index)
+        if best is None:
+            raise PdnError(f"Недопустимый ход {text}")
+
+        _, move, target_index = best
+        game.play_move(*move)
+        current, index = squares[target_index], target_index + 1
+        if index > last:
+            if game.multiple_capture and game.current_player == player:
+                raise PdnError(f"Ход {text} не завершает обязательное взятие")
+            return
+        if not (game.multiple_capture and game.current_player == player):
+            raise PdnError(f"Недопустимый ход {text}")
+
+
+def replay(pdn_game: PdnGame, result_sink=None) -> CheckersGame:
+    """Воспроизводит партию по правилам игры.
+
+    Args:
+        pdn_game (PdnGame): Партия из read_games()
+        result_sink: Приемник результатов для созданной игры, по умолчанию None
+
+    Returns:
+        CheckersGame: Игра после всех ходов партии
+
+    Raises:
+        PdnError: Если неверна исходная позиция (тег FEN) или ход недопустим
+    """
+    try:
+        game = CheckersGame(result_sink, position=pdn_game.tags.get("FEN"))
+    except PositionError as e:
+        raise PdnError(f"Партия со строки {pdn_game.line}: {e}") from None
+    for number, text in enumerate(pdn_game.moves, 1):
+        try:
+            play_pdn_move(game, text)
+        except PdnError as e:
+            raise PdnError(f"Партия со строки {pdn_game.line}, полуход {number}: {e}") from None
+    return game
+
+
+def validate_games(lines: Iterable[str]) -> Iterator[Tuple[PdnGame, Optional[CheckersGame], Optional[PdnError]]]:
+    """Читает и проверяет партии по одной.
+
+    Args:
+        lines (Iterable[str]): Строки PDN
+
+    Yields:
+        Tuple: (партия, восстановленная игра или None, ошибка или None)
+    """
+    for pdn_game in read_games(lines):
+        try:
+            yield pdn_game, replay(pdn_game), None
+        except PdnError as e:
+            yield pdn_game, None, e
+
+
+def main(argv=None):
+    """Проверяет PDN-архив из командной строки и печатает итог."""
+    parser = argparse.ArgumentParser(description="Проверка партий в формате PDN")
+    parser.add_argument("path", help="файл PDN")
+    parser.add_argument("--quiet", action="store_true", help="не печатать ошибки партий")
+    args = parser.parse_args(argv)
+
+    valid = invalid = 0
+    with open(args.path, encoding="utf-8", errors="replace") as stream:
+        for pdn_game, game, error in validate_games(stream):
+            if error is None:
+                valid += 1
+            else:
+                invalid += 1
+                if not args.quiet:
+                    print(error)
+    print(f"Партий прочитано: {valid + invalid}, допустимых: {valid}, с ошибками: {invalid}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Модуль perft - подсчета позиций дерева ходов.
+
+perft(depth) перебирает все допустимые ходы на заданную глубину и считает
+листья дерева. Результат сравнивается с эталонными числами: любое расхождение
+означает ошибку в генераторе ходов, а число позиций в секунду показывает его
+скорость.
+
+Особенности:
+    1. Два генератора: CheckersGame (get_legal_moves и move_piece, как в игре) и
+       BitboardPosition (быстрый битбордовый генератор)
+    2. Ход - это один переход (откуда, куда, множество взятых); одинаковые
+       переходы, найденные разными путями взятия, считаются одним ходом
+    3. Продолжение взятия новой дамкой считается отдельным полуходом
+    4. divide - разбивка числа листьев по ходам из корня
+    5. Эталонные числа для начальной позиции и позиций с взятиями дамками
+
+Запуск из командной строки:
+    python -m src.perft 6
+    python -m src.perft 4 --backend game --divide --position king_chain
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from .bitboard import BitboardPosition
+from .pdn import square_name
+from .position import INITIAL_POSITION, parse_position
+
+GameMove = Tuple[int, int, int, int, List[Tuple[int, int]]]
+
+
+@dataclass
+class PerftResult:
+    """Класс, представляющий результат замера perft.
+
+    Attributes:
+        depth (int): Глубина перебора
+        nodes (int): Количество листьев дерева
+        elapsed (float): Затраченное время в секундах
+    """
+    depth: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Скорость перебора в позициях в секунду."""
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def move_name(move: GameMove) -> str:
+    """Возвращает запись хода: "c3-d4" для тихого хода, "c3:e5" для взятия.
+
+    Args:
+        move (GameMove): Ход (from_row, from_col, to_row, to_col, captured)
+
+    Returns:
+        str: Запись хода
+    """
+    from_row, from_col, to_row, to_col, captured = move
+    separator = ":" if captured else "-"
+    return f"{square_name(from_row, from_col)}{separator}{square_name(to_row, to_col)}"
+
+
+def bitboard_moves(position: BitboardPosition) -> list:
+    """Возвращает допустимые ходы битборда без повторов одинаковых переходов.
+
+    Args:
+        position (BitboardPosition): Позиция
+
+    Returns:
+        List[BitMove]: Ходы позиции
+    """
+    moves = []
+    seen = set()
+    for move in position.generate_moves():
+        key = (move[0], move[1], frozenset(move[2]))
+        if key not in seen:
+            seen.add(key)
+            moves.append(move)
+    return moves
+
+
+def _make_game_move(game, move: GameMove):
+    """Выполняет ход через move_piece и возвращает снимок для отката."""
+    from_row, from_col, to_row, to_col, captured = move
+    state = game.snapshot()
+    game.selected_piece = (from_row, from_col)
+    game.valid_moves = [(to_row, to_col, captured)]
+    game.move_piece(from_row, from_col, to_row, to_col)
+    return state
+
+
+def _perft_game(game, depth: int) -> int:
+    """Рекурсивный perft по CheckersGame."""
+    moves = game.get_legal_moves()
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        state = _make_game_move(game, move)
+        nodes += _perft_game(game, depth - 1)
+        game.restore(state)
+    return nodes
+
+
+def _perft_bitboard(position: BitboardPosition, depth: int) -> int:
+    """Рекурсивный perft по BitboardPosition."""
+    moves = bitboard_moves(position)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        nodes += _perft_bitboard(position.apply_move(move), depth - 1)
+    return nodes
+
+
+def perft(target, depth: int) -> int:
+    """Считает количество позиций на глубине depth.
+
+    Для CheckersGame ходы выполняются через move_piece и откатываются, после
+    подсчета игра остается в исходном состоянии. Результат в базу данных
+    при этом не сохраняется.
+
+    Args:
+        target (Union[CheckersGame, BitboardPosition]): Исходная позиция
+        depth (int): Глубина перебора в полуходах
+
+    Returns:
+        int: Количество листьев дерева ходов
+    """
+    if depth <= 0:
+        return 1
+    if isinstance(target, BitboardPosition):
+        return _perft_bitboard(target, depth)
+
+    game_saved = target.game_saved
+    target.game_saved = True  # окончание партии внутри перебора не сохраняется
+    try:
+        return _perft_game(target, depth)
+    finally:
+        target.game_saved = game_saved
+
+
+def divide(target, depth: int) -> Dict[str, int]:
+    """Разбивает perft(depth) по ходам из корня.
+
+    Args:
+        target (Union[CheckersGame, BitboardPosition]): Исходная позиция
+        depth (int): Глубина перебора в полуходах (не меньше 1)
+
+    Returns:
+        Dict[str, int]: Запись хода -> количество листьев под ним
+    """
+    result = {}
+    if isinstance(target, BitboardPosition):
+        for move in bitboard_moves(target):
+            result[move_name(target.to_game_move(move))] = perft(target.apply_move(move), depth - 1)
+        return result
+
+    game_saved = target.game_saved
+    target.game_saved = True
+    try:
+        for move in target.get_legal_moves():
+            state = _make_game_move(target, move)
+            result[move_name(move)] = _perft_game(target, depth - 1) if depth > 1 else 1
+            target.restore(state)
+    finally:
+        target.game_saved = game_saved
+    return result
+
+
+def run_perft(target, depth: int) -> PerftResult:
+    """Выполняет perft с замером времени.
+
+    Args:
+        target (Union[CheckersGame, BitboardPosition]): Исходная позиция
+        depth (int): Глубина перебора в полуходах
+
+    Returns:
+        PerftResult: Количество листьев и затраченное время
+    """
+    start = time.perf_counter()
+    nodes = perft(target, depth)
+    return PerftResult(depth, nodes, time.perf_counter() - start)
+
+
+# Позиции с эталонными числами: название -> (строка позиции, {глубина:
+# количество листьев}). Числа соответствуют правилам этой игры (у шашки
+# обязательно самое длинное из ее взятий), поэтому с глубины 6 отличаются
+# от опубликованных для классических русских шашек.
+REFERENCE_POSITIONS = {
+    "initial": (INITIAL_POSITION,
+                {1: 7, 2: 49, 3: 302, 4: 1469, 5: 7482, 6: 37976, 7: 190020}),
+    "king_chain": ("W:W28,K29:BK4,6,8,14,15,22",
+                   {1: 1, 2: 4, 3: 26, 4: 92, 5: 541, 6: 2742, 7: 17248}),
+    "crowning_capture": ("W:W10,25,27:B6,7,16,17,K32",
+                         {1: 2, 2: 2, 3: 8, 4: 64, 5: 412, 6: 3437, 7: 19760}),
+    "kings_crossfire": ("B:WK17,25,K31:BK2,10,11,K16,23",
+                        {1: 12, 2: 51, 3: 424, 4: 3010, 5: 23090, 6: 175167}),
+}
+
+
+def reference_game(name: str):
+    """Создает CheckersGame в эталонной позиции.
+
+    Args:
+        name (str): Название позиции из REFERENCE_POSITIONS
+
+    Returns:
+        CheckersGame: Игра в эталонной позиции
+    """
+    from .game_logic import CheckersGame
+
+    return CheckersGame.from_position(REFERENCE_POSITIONS[name][0])
+
+
+def reference_position(name: str) -> BitboardPosition:
+    """Создает битбордовую позицию из REFERENCE_POSITIONS.
+
+    Args:
+        name (str): Название позиции
+
+    Returns:
+        BitboardPosition: Эталонная позиция
+    """
+    position = parse_position(REFERENCE_POSITIONS[name][0])
+    return BitboardPosition.from_board(position.to_board(), position.current_player)
+
+
+def main(argv=None):
+    """Запускает perft из командной строки и печатает результат."""
+    parser = argparse.ArgumentParser(description="Подсчет позиций дерева ходов (perft)")
+    parser.add_argument("depth", type=int, nargs="?", default=6, help="глубина в полуходах")
+    parser.add_argument("--backend", choices=("bitboard", "game"), default="bitboard",
+                        help="генератор ходов")
+    parser.add_argument("--position", choices=sorted(REFERENCE_POSITIONS), default="initial",
+                        help="исходная позиция")
+    parser.add_argument("--divide", action="store_true", help="разбивка по ходам из корня")
+    args = parser.parse_args(argv)
+
+    if args.backend == "game":
+        target = reference_game(args.position)
+    else:
+        target = reference_position(args.position)
+
+    if args.divide:
+        for name, nodes in sorted(divide(target, args.depth).items()):
+            print(f"{name}: {nodes}")
+
+    expected = REFERENCE_POSITIONS[args.position][1]
+    for depth in range(1, args.depth + 1):
+        result = run_perft(target, depth)
+        check = ""
+        if depth in expected:
+            check = " ok" if result.nodes == expected[depth] else f" ОШИБКА (ожидалось {expected[depth]})"
+        print(f"perft({depth}) = {result.nodes} за {result.elapsed:.3f} с "
+              f"({result.nodes_per_second:,.0f} поз/с){check}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Модуль строковой записи позиции (FEN в формате PDN).
+
+Позиция записывается одной строкой: сторона хода, затем шашки белых и
+черных номерами клеток 1-32, дамки - с префиксом K:
+
+    W:W21,22,23,K30:B1,2,K12
+
+Клетки нумеруются слева направо сверху вниз, как coords_to_square() + 1:
+клетка 1 - b8 (ряд 0), клетка 32 - g1 (ряд 7). В начальной позиции черные
+занимают клетки 1-12, белые - 21-32. При разборе допускаются диапазоны
+("W:W21-32:B1-12"), пробелы и пустой список шашек, а также алгебраические
+названия клеток, принятые в PDN русских шашек (GameType 25):
+"W:Wa1,c1,Ke1:Bb8,d8".
+
+Строка позиции не хранит продолжение взятия и таймеры: это снимок доски
+и стороны хода для тестов, эталонных позиций и передачи в другие процессы.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+from .bitboard import SQUARE_COUNT, coords_to_square, square_to_coords
+from .constants import BOARD_SIZE
+from .enums import PieceType, Player
+from .models import Piece
+
+FILES = "abcdefgh"  # столбцы доски в алгебраической записи
+INITIAL_POSITION = "W:W21,22,23,24,25,26,27,28,29,30,31,32:B1,2,3,4,5,6,7,8,9,10,11,12"
+
+_SIDES = {"W": Player.WHITE, "B": Player.BLACK}
+_LETTERS = {Player.WHITE: "W", Player.BLACK: "B"}
+
+
+class PositionError(ValueError):
+    """Исключение: строка позиции записана неверно."""
+
+
+@dataclass
+class Position:
+    """Класс, представляющий разобранную строку позиции.
+
+    Клетки хранятся номерами 0-31 (как в coords_to_square).
+
+    Attributes:
+        current_player (Player): Сторона, которая делает ход
+        white_men (List[int]): Клетки белых простых шашек
+        white_kings (List[int]): Клетки белых дамок
+        black_men (List[int]): Клетки черных простых шашек
+        black_kings (List[int]): Клетки черных дамок
+    """
+    current_player: Player = Player.WHITE
+    white_men: List[int] = field(default_factory=list)
+    white_kings: List[int] = field(default_factory=list)
+    black_men: List[int] = field(default_factory=list)
+    black_kings: List[int] = field(default_factory=list)
+
+    def pieces(self):
+        """Перебирает шашки позиции.
+
+        Yields:
+            Tuple[int, Player, PieceType]: (клетка 0-31, владелец, тип)
+        """
+        for squares, player, piece_type in ((self.white_men, Player.WHITE, PieceType.MAN),
+                                            (self.white_kings, Player.WHITE, PieceType.KING),
+                                            (self.black_men, Player.BLACK, PieceType.MAN),
+                                            (self.black_kings, Player.BLACK, PieceType.KING)):
+            for square in squares:
+                yield square, player, piece_type
+
+    def to_board(self) -> List[List[Optional[Piece]]]:
+        """Создает доску 8x8 с шашками позиции.
+
+        Returns:
+            List[List[Optional[Piece]]]: Доска
+        """
+        board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        for square, player, piece_type in self.pieces():
+            row, col = square_to_coords(square)
+            board[row][col] = Piece(player, piece_type)
+        return board
+
+    @classmethod
+    def from_board(cls, board, current_player: Player = Player.WHITE) -> 'Position':
+        """Собирает позицию по доске 8x8.
+
+        Args:
+            board (List[List[Optional[Piece]]]): Доска
+            current_player (Player): Сторона, которая делает ход
+
+        Returns:
+            Position: Позиция
+        """
+        position = cls(current_player)
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                piece = board[row][col]
+                if piece:
+                    position._squares(piece.player, piece.type).append(coords_to_square(row, col))
+        return position
+
+    def _squares(self, player: Player, piece_type: PieceType) -> List[int]:
+        """Возвращает список клеток шашек данного игрока и типа."""
+        if player == Player.WHITE:
+            return self.white_kings if piece_type == PieceType.KING else self.white_men
+        return self.black_kings if piece_type == PieceType.KING else self.black_men
+
+    def __str__(self) -> str:
+        return f"{_LETTERS[self.current_player]}:{self._format_side(Player.WHITE)}:{self._format_side(Player.BLACK)}"
+
+    def _format_side(self, player: Player) -> str:
+        """Записывает шашки одного игрока: W21,22,K30."""
+        squares = [(square, "") for square in self._squares(player, PieceType.MAN)]
+        squares += [(square, "K") for square in self._squares(player, PieceType.KING)]
+        return _LETTERS[player] + ",".join(f"{prefix}{square + 1}" for square, prefix in sorted(squares))
+
+
+def parse_square_name(name: str) -> Tuple[int, int]:
+    """Переводит алгебраическое название клетки в (ряд, столбец).
+
+    Столбцы a-h слева направо, горизонтали 1-8 снизу вверх (ряд 7 - первая
+    горизонталь).
+
+    Args:
+        name (str): Название клетки, например "c3"
+
+    Returns:
+        Tuple[int, int]: Координаты клетки на доске
+
+    Raises:
+        PositionError: Если название неверно или клетка светлая
+    """
+    if len(name) != 2 or name[0] not in FILES or not "1" <= name[1] <= "8":
+        raise PositionError(f"Неверная клетка: {name}")
+    row, col = BOARD_SIZE - int(name[1]), FILES.index(name[0])
+    if (row + col) % 2 == 0:
+        raise PositionError(f"Клетка {name} не игровая")
+    return row, col
+
+
+def _parse_squares(text: str) -> Iterable[int]:
+    """Разбирает номер клетки, диапазон "21-32" или название "c3" в номера 0-31."""
+    if text[:1].isalpha():
+        return [coords_to_square(*parse_square_name(text.lower()))]
+    first, _, last = text.partition("-")
+    try:
+        start = int(first)
+        end = int(last) if last else start
+    except ValueError:
+        raise PositionError(f"Неверный номер клетки: {text}") from None
+    if not 1 <= start <= end <= SQUARE_COUNT:
+        raise PositionError(f"Неверный номер клетки: {text}")
+    return range(start - 1, end)
+
+
+def parse_position(text: str) -> Position:
+    """Разбирает строку позиции.
+
+    Args:
+        text (str): Строка вида "W:W21,22,K30:B1,2" или "W:Wa1,c1,Ke1:Bb8"
+
+    Returns:
+        Position: Разобранная позиция
+
+    Raises:
+        PositionError: Если строка записана неверно, клетка занята дважды или
+            простая шашка стоит на поле превращения
+    """
+    parts = [part.strip() for part in text.strip().rstrip(".").split(":")]
+    if len(parts) != 3 or parts[0].upper() not in _SIDES:
+        raise PositionError(f"Неверная строка позиции: {text}")
+
+    position = Position(_SIDES[parts[0].upper()])
+    occupied = set()
+    seen_sides = set()
+    for part in parts[1:]:
+        side = part[:1].upper()
+        if side not in _SIDES or side in seen_sides:
+            raise PositionError(f"Неверная строка позиции: {text}")
+        seen_sides.add(side)
+        player = _SIDES[side]
+
+        for item in part[1:].split(","):
+            item = item.strip()
+            if not item:
+                continue
+            piece_type = PieceType.MAN
+            if item[0] in "Kk":
+                piece_type = PieceType.KING
+                item = item[1:]
+            for square in _parse_squares(item):
+                if square in occupied:
+                    raise PositionError(f"Клетка {square + 1} занята дважды")
+                row, _ = square_to_coords(square)
+                promotion_row = 0 if player == Player.WHITE else BOARD_SIZE - 1
+                if piece_type == PieceType.MAN and row == promotion_row:
+                    raise PositionError(f"Простая шашка на поле превращения: {square + 1}")
+                occupied.add(square)
+                position._squares(player, piece_type).append(square)
+    return position
+
+
+def format_position(board, current_player: Player = Player.WHITE) -> str:
+    """Записывает доску и сторону хода строкой позиции.
+
+    Args:
+        board (List[List[Optional[Piece]]]): Доска 8x8
+        current_player (Player): Сторона, которая делает ход
+
+    Returns:
+        str: Строка позиции
+    """
+    return str(Position.from_board(board, current_player))
@@ -0,0 +1,184 @@
+"""
+Модуль замера времени кадра по этапам.
+
+FrameProfiler измеряет, сколько времени каждый кадр занимают отдельные
+этапы игрового цикла (обработка событий, таймер, отрисовка доски, шашек,
+панелей и т.д.), хранит последние кадры для скользящих процентилей и
+полную трассу для сохранения в CSV или JSON при выходе.
+
+Особенности:
+    1. Этап замеряется контекстным менеджером: with profiler.stage("draw_board")
+    2. Процентили p50/p95/p99 и максимум по последним window кадрам
+    3. Трасса ограничена max_frames кадрами (самые старые отбрасываются)
+    4. Формат файла трассы выбирается по расширению: .json или .csv
+
+Модуль не импортирует PyGame; экранный оверлей со статистикой из
+summary() рисует CheckersGUI.
+"""
+
+import csv
+import json
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+FRAME = "frame"  # имя полного времени кадра в статистике и трассе
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Возвращает процентиль по методу ближайшего ранга.
+
+    Args:
+        values (List[float]): Отсортированные значения
+        fraction (float): Доля от 0 до 1 (0.95 - 95-й процентиль)
+
+    Returns:
+        float: Значение процентиля, 0.0 для пустого списка
+    """
+    if not values:
+        return 0.0
+    index = min(len(values), max(1, math.ceil(fraction * len(values)))) - 1
+    return values[index]
+
+
+class FrameProfiler:
+    """Профилировщик времени кадра с разбивкой по этапам.
+
+    Attributes:
+        window (int): Сколько последних кадров учитывается в процентилях
+        max_frames (int): Наибольшее число кадров в трассе
+        trace_path (Optional[str]): Куда сохранить трассу в save()
+        stages (List[str]): Имена этапов в порядке первого появления
+    """
+
+    def __init__(self, window: int = 300, max_frames: int = 36000,
+                 trace_path: Optional[str] = None):
+        """Создает профилировщик.
+
+        Args:
+            window (int): Размер окна для процентилей, по умолчанию 300 кадров
+            max_frames (int): Ограничение трассы, по умолчанию 36000 кадров
+                (10 минут при 60 кадрах в секунду)
+            trace_path (Optional[str]): Файл трассы (.csv или .json), None - не сохранять
+        """
+        self.window = window
+        self.max_frames = max_frames
+        self.trace_path = trace_path
+        self.stages: List[str] = []
+        self._recent: Dict[str, deque] = {}
+        self._trace = deque(maxlen=max_frames)
+        self._current: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        self._frame_number = 0
+
+    def begin_frame(self):
+        """Начинает замер нового кадра."""
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Завершает кадр: добавляет его время в статистику и трассу."""
+        if self._frame_start is None:
+            return
+        self._current[FRAME] = time.perf_counter() - self._frame_start
+        self._frame_start = None
+        self._frame_number += 1
+
+        for name, seconds in self._current.items():
+            recent = self._recent.get(name)
+            if recent is None:
+                recent = self._recent[name] = deque(maxlen=self.window)
+            recent.append(seconds)
+        self._trace.append((self._frame_number, self._current))
+
+    @contextmanager
+    def stage(self, name: str):
+        """Замеряет этап текущего кадра.
+
+        Повторные замеры одного этапа за кадр складываются.
+
+        Args:
+            name (str): Имя этапа
+        """
+        if name not in self.stages:
+            self.stages.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] = self._current.get(name, 0.0) + time.perf_counter() - start
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Возвращает скользящую статистику в миллисекундах.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Этап (и "frame") -> {"p50", "p95",
+                "p99", "max", "mean"}; кадры, где этап не выполнялся, не учитываются
+        """
+        result = {}
+        for name in [FRAME] + self.stages:
+            values = sorted(self._recent.get(name, ()))
+            if not values:
+                continue
+            result[name] = {
+                "p50": percentile(values, 0.50) * 1000,
+                "p95": percentile(values, 0.95) * 1000,
+                "p99": percentile(values, 0.99) * 1000,
+                "max": values[-1] * 1000,
+                "mean": sum(values) / len(values) * 1000,
+            }
+        return result
+
+    def frames(self) -> List[Dict[str, float]]:
+        """Возвращает трассу: по словарю на кадр, время этапов в миллисекундах.
+
+        Returns:
+            List[Dict[str, float]]: Кадры с ключом "frame_number" и временами этапов
+        """
+        result = []
+        for number, stages in self._trace:
+            row = {"frame_number": number}
+            row.update({name: seconds * 1000 for name, seconds in stages.items()})
+            result.append(row)
+        return result
+
+    def dump(self, path: str):
+        """Сохраняет трассу и сводную статистику.
+
+        Файл .json содержит {"summary": ..., "frames": [...]}; любой другой
+        путь сохраняется как CSV: строка на кадр, столбец на этап (в
+        миллисекундах, пусто если этап в кадре не выполнялся).
+
+        Args:
+            path (str): Путь к файлу
+        """
+        if path.lower().endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"summary": self.summary(), "frames": self.frames()}, f,
+                          ensure_ascii=False, indent=1)
+            return
+
+        columns = ["frame_number", FRAME] + self.stages
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, restval="")
+            writer.writeheader()
+            for row in self.frames():
+                writer.writerow({name: (f"{value:.4f}" if name != "frame_number" else value)
+                                 for name, value in row.items()})
+
+    def save(self) -> bool:
+        """Сохраняет трассу в trace_path, если он задан.
+
+        Returns:
+            bool: True если трасса сохранена
+        """
+        if not self.trace_path:
+            return False
+        try:
+            self.dump(self.trace_path)
+        except OSError as e:
+            print(f"Не удалось сохранить трассу кадров: {e}")
+            return False
+        return True
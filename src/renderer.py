@@ -0,0 +1,160 @@
+"""
+Модуль отрисовки шашек.
+
+Отрисовка вынесена из классов данных (models.Piece), чтобы логика игры
+импортировалась без PyGame. Графический интерфейс рисует шашки через
+PieceRenderer.
+
+Каждый вид шашки (игрок, тип, размер, свечение выделения) рисуется один
+раз в прозрачный спрайт, который затем только копируется на экран.
+Геометрия короны дамки вычисляется при загрузке модуля.
+"""
+
+import pygame
+from .constants import PIECE_SHADOW, ACCENT_GOLD
+from .enums import PieceType, Player
+from .surface_cache import SurfaceCache
+
+SHADOW_OFFSET = 3
+SPRITE_MARGIN = 8  # запас вокруг шашки под тень и свечение выделения
+SPRITE_COLORKEY = (255, 0, 255)  # прозрачный цвет спрайтов, в шашках не встречается
+
+WHITE_COLORS = [
+    (255, 255, 255),
+    (240, 240, 250),
+    (220, 220, 235),
+    (200, 200, 220)
+]
+BLACK_COLORS = [
+    (80, 80, 100),
+    (60, 60, 80),
+    (45, 45, 60),
+    (30, 30, 45)
+]
+
+# Единичные векторы вершин короны (пять точек через 72 градуса)
+CROWN_DIRECTIONS = tuple(pygame.math.Vector2(1, 0).rotate(i * 72) for i in range(5))
+
+
+class PieceRenderer:
+    """Класс, отрисовывающий шашки на поверхности PyGame.
+
+    Attributes:
+        sprites (SurfaceCache): Готовые спрайты шашек
+    """
+
+    def __init__(self):
+        """Создает отрисовщик с пустым кэшем спрайтов."""
+        self.sprites = SurfaceCache(max_entries=64)
+
+    def draw(self, screen, piece, x, y, size, selected=False):
+        """Отрисовывает шашку на экране.
+
+        Args:
+            screen: Поверхность PyGame для отрисовки
+            piece (Piece): Шашка
+            x (int): X-координата центра шашки
+            y (int): Y-координата центра шашки
+            size (int): Размер шашки в пикселях
+            selected (bool): Флаг выделения шашки, по умолчанию False
+        """
+        glow_size = 0
+        if selected:
+            pulse = (pygame.time.get_ticks() % 1000) / 1000
+            glow_size = int(5 + 2 * pulse)
+
+        sprite = self.get_sprite(piece.player, piece.type, size, glow_size)
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (x - half, y - half))
+
+    def get_sprite(self, player, piece_type, size, glow_size=0):
+        """Возвращает спрайт шашки, отрисованный один раз.
+
+        Args:
+            player (Player): Владелец шашки
+            piece_type (PieceType): Тип шашки
+            size (int): Размер клетки в пикселях
+            glow_size (int): Ширина свечения выделения, 0 - шашка не выделена
+
+        Returns:
+            pygame.Surface: Прозрачный спрайт, центр шашки - центр спрайта
+        """
+        key = (player, piece_type, size, glow_size)
+        return self.sprites.get(key, lambda: self._build_sprite(player, piece_type, size, glow_size))
+
+    def _build_sprite(self, player, piece_type, size, glow_size):
+        """Рисует шашку в новый прозрачный спрайт.
+
+        Шашка без свечения состоит из непрозрачных пикселей, поэтому ее спрайт
+        использует цветовой ключ (RLE) - такое копирование быстрее попиксельной
+        прозрачности. Попиксельная прозрачность нужна только свечению выделения.
+        """
+        half = size // 2 - 5 + SPRITE_MARGIN
+        if glow_size:
+            sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            # прозрачный золотой фон: полупрозрачное свечение за краем шашки
+            # сохраняет свой цвет при наложении
+            sprite.fill((*ACCENT_GOLD[:3], 0))
+        else:
+            sprite = pygame.Surface((half * 2, half * 2))
+            sprite.fill(SPRITE_COLORKEY)
+            sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        self.render(sprite, player, piece_type, half, half, size, glow_size)
+        if pygame.display.get_surface() is not None:
+            # формат пикселей экрана: копирование без преобразования
+            sprite = sprite.convert_alpha() if glow_size else sprite.convert()
+        return sprite
+
+    @staticmethod
+    def render(surface, player, piece_type, x, y, size, glow_size=0):
+        """Рисует шашку на поверхности примитивами PyGame.
+
+        Args:
+            surface: Поверхность для рисования
+            player (Player): Владелец шашки
+            piece_type (PieceType): Тип шашки
+            x (int): X-координата центра шашки
+            y (int): Y-координата центра шашки
+            size (int): Размер клетки в пикселях
+            glow_size (int): Ширина свечения выделения, 0 - без свечения
+        """
+        radius = size // 2 - 5
+
+        # Тень
+        pygame.draw.circle(surface, PIECE_SHADOW,
+                           (x + SHADOW_OFFSET, y + SHADOW_OFFSET),
+                           radius + 2)
+
+        # Градиентный круг
+        colors = WHITE_COLORS if player == Player.WHITE else BLACK_COLORS
+        for i in range(4):
+            current_radius = radius - i * 2
+            if current_radius > 0:
+                pygame.draw.circle(surface, colors[i], (x, y), current_radius)
+
+        # Блик
+        highlight_radius = radius // 3
+        highlight_x = x - radius // 3
+        highlight_y = y - radius // 3
+        pygame.draw.circle(surface, (255, 255, 255) if player == Player.WHITE else (150, 150, 170),
+                           (highlight_x, highlight_y), highlight_radius)
+
+        # Подсветка если выбрана
+        if glow_size:
+            s = pygame.Surface((radius * 2 + glow_size * 2, radius * 2 + glow_size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*ACCENT_GOLD[:3], 150),
+                               (radius + glow_size, radius + glow_size),
+                               radius + glow_size)
+            surface.blit(s, (x - radius - glow_size, y - radius - glow_size))
+
+        # Корона для дамки
+        if piece_type == PieceType.KING:
+            crown_size = radius // 2
+            pygame.draw.circle(surface, ACCENT_GOLD, (x, y), crown_size + 2)
+
+            points = [(x + int(crown_size * 0.8 * direction.x), y + int(crown_size * 0.8 * direction.y))
+                      for direction in CROWN_DIRECTIONS]
+            pygame.draw.polygon(surface, ACCENT_GOLD, points)
+            pygame.draw.polygon(surface, (200, 170, 0), points, 2)
+
+            pygame.draw.circle(surface, (255, 230, 50), (x, y), crown_size // 2)
@@ -0,0 +1,281 @@
+"""
+Модуль фонового и пакетного сохранения результатов игр.
+
+AsyncResultWriter оборачивает приемник результатов (например, DatabaseManager)
+и выполняет сохранение в отдельном потоке. CheckersGame передает результат
+в очередь и сразу продолжает работу, поэтому задержки базы данных не
+останавливают игровой цикл.
+
+BatchResultWriter копит результаты и сохраняет их пачками через
+DatabaseManager.save_game_results - для массовой загрузки партий турниров
+и игр компьютера с самим собой.
+
+Особенности:
+    1. Очередь и один фоновый поток-писатель
+    2. Повторные попытки с экспоненциально растущей паузой
+    3. Обратный вызов по завершении сохранения (успешного или нет)
+    4. flush()/close() для дожидания записи при выходе из программы
+    5. Пакетная запись по размеру пачки или по таймеру с первой записи
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+_STOP = object()  # сигнал остановки потока-писателя
+
+
+class AsyncResultWriter:
+    """Приемник результатов, сохраняющий их в фоновом потоке.
+
+    Attributes:
+        sink: Приемник, выполняющий само сохранение (метод save_game_result)
+        max_attempts (int): Наибольшее число попыток сохранить один результат
+        backoff (float): Пауза перед второй попыткой в секундах (далее удваивается)
+        on_complete (Optional[Callable[[bool, Dict], None]]): Вызывается после
+            сохранения с флагом успеха и сохраненными данными
+        saved (int): Количество успешно сохраненных результатов
+        failed (int): Количество результатов, которые не удалось сохранить
+    """
+
+    def __init__(self, sink, max_attempts: int = 3, backoff: float = 0.5,
+                 on_complete: Optional[Callable[[bool, Dict], None]] = None):
+        """Создает писатель; поток запускается при первом результате.
+
+        Args:
+            sink: Приемник результатов, например DatabaseManager
+            max_attempts (int): Число попыток на один результат, по умолчанию 3
+            backoff (float): Начальная пауза между попытками в секундах
+            on_complete (Optional[Callable[[bool, Dict], None]]): Обратный вызов
+                по завершении сохранения, выполняется в фоновом потоке
+        """
+        self.sink = sink
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.on_complete = on_complete
+        self.saved = 0
+        self.failed = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def save_game_result(self, **result) -> bool:
+        """Ставит результат игры в очередь на сохранение.
+
+        Принимает те же именованные аргументы, что и
+        DatabaseManager.save_game_result, и возвращается сразу.
+
+        Returns:
+            bool: True если результат принят в очередь, False если писатель закрыт
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+                self._thread.start()
+            self._queue.put(result)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Ждет сохранения всех результатов, поставленных в очередь.
+
+        Args:
+            timeout (Optional[float]): Наибольшее время ожидания в секундах,
+                None - ждать без ограничения
+
+        Returns:
+            bool: True если очередь обработана, False если время вышло
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if deadline is None:
+                    self._queue.all_tasks_done.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Дописывает очередь и останавливает фоновый поток.
+
+        После закрытия новые результаты не принимаются.
+
+        Args:
+            timeout (Optional[float]): Наибольшее время ожидания в секундах
+
+        Returns:
+            bool: True если все результаты обработаны до закрытия
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return True
+
+        flushed = self.flush(timeout)
+        self._queue.put(_STOP)
+        if flushed:
+            thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        """Цикл потока-писателя: берет результаты из очереди и сохраняет их."""
+        while True:
+            result = self._queue.get()
+            try:
+                if result is _STOP:
+                    return
+                self._write(result)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, result: Dict):
+        """Сохраняет один результат с повторными попытками."""
+        delay = self.backoff
+        success = False
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                success = bool(self.sink.save_game_result(**result))
+            except Exception as e:
+                print(f"Ошибка фонового сохранения результата (попытка {attempt}): {e}")
+                success = False
+            if success:
+                break
+            if attempt < self.max_attempts:
+                time.sleep(delay)
+                delay *= 2
+
+        if success:
+            self.saved += 1
+        else:
+            self.failed += 1
+            print(f"Не удалось сохранить результат игры после {self.max_attempts} попыток")
+
+        if self.on_complete:
+            try:
+                self.on_complete(success, result)
+            except Exception as e:
+                print(f"Ошибка в обработчике завершения сохранения: {e}")
+
+
+class BatchResultWriter:
+    """Приемник результатов, сохраняющий их пачками.
+
+    Пачка сохраняется, когда в ней набралось batch_size результатов или с
+    момента первого результата в ней прошло flush_interval секунд (по
+    таймеру в фоновом потоке, даже если новых результатов нет), а также при
+    вызове flush() или close(). После close() результаты не копятся в буфере,
+    а сохраняются сразу.
+
+    Attributes:
+        sink: Приемник с методом save_game_results(results) -> int
+        batch_size (int): Размер пачки
+        flush_interval (float): Наибольшее время хранения результата в буфере
+        saved (int): Количество сохраненных результатов
+        failed (int): Количество результатов из пачек, которые не удалось сохранить
+    """
+
+    def __init__(self, sink, batch_size: int = 500, flush_interval: float = 5.0):
+        """Создает пакетный писатель.
+
+        Args:
+            sink: Приемник результатов, например DatabaseManager
+            batch_size (int): Размер пачки, по умолчанию 500
+            flush_interval (float): Время в секундах, через которое неполная
+                пачка сохраняется по таймеру, по умолчанию 5
+
+        Raises:
+            ValueError: Если размер пачки не положительный
+        """
+        if batch_size < 1:
+            raise ValueError("Размер пачки должен быть положительным")
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.saved = 0
+        self.failed = 0
+        self._buffer = []
+        self._timer = None  # сохраняет неполную пачку через flush_interval
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def save_game_result(self, **result) -> bool:
+        """Добавляет результат в буфер и при необходимости сохраняет пачку.
+
+        Принимает те же именованные аргументы, что и DatabaseManager.save_game_result.
+
+        Returns:
+            bool: True если результат принят (или сохранен вместе с пачкой);
+                после close() - True если результат сохранен
+        """
+        with self._lock:
+            self._buffer.append(result)
+            if self._closed or len(self._buffer) >= self.batch_size:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            return self._write(batch)
+        return True
+
+    def flush(self) -> int:
+        """Сохраняет накопленные результаты.
+
+        Returns:
+            int: Количество сохраненных результатов
+        """
+        with self._lock:
+            batch = self._take()
+        if not batch:
+            return 0
+        return len(batch) if self._write(batch) else 0
+
+    def close(self) -> int:
+        """Сохраняет остаток буфера и отменяет таймер.
+
+        Последующие результаты сохраняются сразу, без буфера и таймера.
+
+        Returns:
+            int: Количество сохраненных результатов
+        """
+        with self._lock:
+            self._closed = True
+        return self.flush()
+
+    def pending(self) -> int:
+        """Возвращает количество результатов в буфере."""
+        return len(self._buffer)
+
+    def _take(self):
+        """Забирает содержимое буфера и отменяет таймер (вызывается под блокировкой)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def _write(self, batch) -> bool:
+        """Сохраняет одну пачку через приемник."""
+        try:
+            saved = self.sink.save_game_results(batch)
+        except Exception as e:
+            print(f"Ошибка пакетного сохранения результатов: {e}")
+            saved = 0
+        # пачку по таймеру пишет другой поток - счетчики меняются под блокировкой
+        with self._lock:
+            if saved == len(batch):
+                self.saved += saved
+                return True
+            self.failed += len(batch)
+        print(f"Не удалось сохранить пачку из {len(batch)} результатов")
+        return False
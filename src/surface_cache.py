@@ -0,0 +1,83 @@
+"""
+Модуль кэша заранее отрисованных поверхностей.
+
+Статичные части интерфейса (фон доски, спрайты шашек, надписи, слои панели)
+рисуются один раз и затем только копируются на экран. SurfaceCache хранит
+готовые поверхности по ключу, описывающему все, от чего зависит картинка
+(размеры, цвета, состояние), поэтому при смене размера или темы
+поверхность просто строится заново под новым ключом.
+
+Особенности:
+    1. Построение поверхности по требованию (get(key, build))
+    2. Необязательное ограничение размера с вытеснением давно не
+       использованных записей (LRU)
+    3. Счетчики попаданий и промахов для оценки пользы кэша
+
+Модуль не импортирует PyGame: кэш хранит любые объекты.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+
+class SurfaceCache:
+    """Кэш поверхностей по ключу с вытеснением LRU.
+
+    Attributes:
+        max_entries (Optional[int]): Наибольшее число записей, None - без ограничения
+        hits (int): Сколько раз поверхность нашлась в кэше
+        misses (int): Сколько раз поверхность пришлось строить
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """Создает пустой кэш.
+
+        Args:
+            max_entries (Optional[int]): Ограничение числа записей, по умолчанию нет
+
+        Raises:
+            ValueError: Если ограничение не положительное
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], object]):
+        """Возвращает поверхность по ключу, при отсутствии строит ее.
+
+        Возвращаемая поверхность общая для всех вызовов: ее можно копировать
+        на экран, но нельзя изменять.
+
+        Args:
+            key (Hashable): Ключ, однозначно описывающий картинку
+            build (Callable[[], object]): Функция, строящая поверхность
+
+        Returns:
+            Поверхность из кэша или только что построенная
+        """
+        try:
+            surface = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            surface = build()
+            self._entries[key] = surface
+            if self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # самая давно не использованная
+            return surface
+        self.hits += 1
+        if self.max_entries is not None:
+            self._entries.move_to_end(key)
+        return surface
+
+    def clear(self):
+        """Удаляет все поверхности (например, при смене темы оформления)."""
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
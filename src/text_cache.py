@@ -0,0 +1,72 @@
+"""
+Модуль кэша шрифтов и отрисованных надписей.
+
+Создание pygame.font.Font читает файл шрифта с диска, а font.render каждый
+раз растеризует текст заново. TextCache создает каждый шрифт один раз и
+хранит готовые поверхности надписей по ключу (текст, шрифт, цвет).
+Постоянные надписи (заголовки, правила, кнопки) рисуются один раз, а
+меняющиеся (таймеры, счет) вытесняются из кэша по принципу LRU.
+"""
+
+import pygame
+from typing import Dict, Tuple
+from .surface_cache import SurfaceCache
+
+TEXT_CACHE_SIZE = 256  # надписей в кэше: все постоянные и последние значения таймеров
+
+
+class TextCache:
+    """Кэш шрифтов по размеру и надписей по тексту, шрифту и цвету.
+
+    Attributes:
+        surfaces (SurfaceCache): Отрисованные надписи
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        """Создает пустой кэш.
+
+        Args:
+            max_entries (int): Наибольшее число хранимых надписей
+        """
+        self.surfaces = SurfaceCache(max_entries)
+        self._fonts: Dict[Tuple[int, bool], pygame.font.Font] = {}
+
+    def font(self, size: int, bold: bool = False) -> pygame.font.Font:
+        """Возвращает шрифт по умолчанию заданного размера, создавая его один раз.
+
+        Если шрифт по умолчанию недоступен, используется системный Arial.
+
+        Args:
+            size (int): Размер шрифта
+            bold (bool): Жирное начертание для системного шрифта
+
+        Returns:
+            pygame.font.Font: Шрифт
+        """
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(None, size)
+            except Exception:
+                font = pygame.font.SysFont('arial', size, bold=bold)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text: str, font: pygame.font.Font, color, antialias: bool = True) -> pygame.Surface:
+        """Возвращает поверхность с надписью, отрисовывая ее только при первом запросе.
+
+        Поверхность общая для всех вызовов: ее можно копировать на экран,
+        но нельзя изменять.
+
+        Args:
+            text (str): Текст надписи
+            font (pygame.font.Font): Шрифт (например, из font())
+            color (Tuple[int, ...]): Цвет текста
+            antialias (bool): Сглаживание, по умолчанию True
+
+        Returns:
+            pygame.Surface: Надпись
+        """
+        key = (text, font, tuple(color), antialias)
+        return self.surfaces.get(key, lambda: font.render(text, antialias, color))
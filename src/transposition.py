@@ -0,0 +1,160 @@
+"""
+Модуль таблицы транспозиций.
+
+Таблица транспозиций запоминает результаты поиска для позиций, в которые
+поиск приходит разными порядками ходов. Позиция определяется ключом Зобриста
+(см. модуль zobrist).
+
+Особенности:
+    1. Память выделяется один раз при создании (массивы array фиксированного
+       размера), объем задается в мегабайтах
+    2. Таблица разбита на корзины по две записи: первая заменяется только
+       более глубоким (или устаревшим) результатом, вторая - всегда
+    3. Ход хранится упакованным в 64-битное число: откуда, куда и маска взятых
+"""
+
+from array import array
+from typing import Optional, Tuple
+
+# типы оценки в записи
+EXACT = 0  # точная оценка
+LOWER = 1  # нижняя граница (было отсечение по beta)
+UPPER = 2  # верхняя граница (ни один ход не улучшил alpha)
+
+ENTRY_BYTES = 23  # ключ 8 + ход 8 + оценка 4 + глубина 1 + тип 1 + поколение 1
+SLOTS_PER_BUCKET = 2  # запись "по глубине" и запись "всегда заменять"
+
+NO_MOVE = 0
+
+
+def pack_move(move) -> int:
+    """Упаковывает ход битборда в одно число.
+
+    Args:
+        move (BitMove): Ход (бит откуда, бит куда, взятые биты)
+
+    Returns:
+        int: Упакованный ход (0 зарезервирован под отсутствие хода)
+    """
+    from_bit, to_bit, captured = move
+    captured_mask = 0
+    for bit in captured:
+        captured_mask |= 1 << bit
+    return 1 | from_bit << 1 | to_bit << 7 | captured_mask << 13
+
+
+class TranspositionTable:
+    """Таблица транспозиций фиксированного размера.
+
+    Attributes:
+        size_mb (float): Выделенный объем памяти в мегабайтах
+        buckets (int): Количество корзин
+        generation (int): Номер текущего поиска (для вытеснения старых записей)
+        probes (int): Количество обращений к таблице
+        hits (int): Количество найденных записей
+        stores (int): Количество сохраненных записей
+    """
+
+    def __init__(self, size_mb: float = 16):
+        """Создает таблицу и сразу выделяет под нее память.
+
+        Args:
+            size_mb (float): Объем памяти в мегабайтах, по умолчанию 16
+
+        Raises:
+            ValueError: Если объем памяти не положительный
+        """
+        if size_mb <= 0:
+            raise ValueError("Размер таблицы транспозиций должен быть положительным")
+
+        self.size_mb = size_mb
+        self.buckets = max(1, int(size_mb * 1024 * 1024) // (ENTRY_BYTES * SLOTS_PER_BUCKET))
+        self._allocate()
+
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def _allocate(self):
+        """Выделяет обнуленные массивы под все записи таблицы."""
+        slots = self.buckets * SLOTS_PER_BUCKET
+        self._keys = array('Q', bytes(8 * slots))
+        self._moves = array('Q', bytes(8 * slots))
+        self._scores = array('i', bytes(4 * slots))
+        self._depths = array('b', bytes(slots))
+        self._flags = array('B', bytes(slots))
+        self._ages = array('B', bytes(slots))
+
+    def new_search(self):
+        """Начинает новый поиск: записи прошлых поисков становятся заменяемыми."""
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self):
+        """Очищает все записи таблицы."""
+        self._allocate()
+        self.probes = self.hits = self.stores = 0
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int]]:
+        """Ищет запись для позиции.
+
+        Args:
+            key (int): Ключ Зобриста позиции
+
+        Returns:
+            Optional[Tuple[int, int, int, int]]: (глубина, тип оценки, оценка,
+                                                 упакованный ход) или None
+        """
+        self.probes += 1
+        slot = (key % self.buckets) * SLOTS_PER_BUCKET
+        keys = self._keys
+        for index in (slot, slot + 1):
+            if keys[index] == key:
+                self.hits += 1
+                return self._depths[index], self._flags[index], self._scores[index], self._moves[index]
+        return None
+
+    def store(self, key: int, depth: int, flag: int, score: int, move: int = NO_MOVE):
+        """Сохраняет результат поиска.
+
+        Первая запись корзины заменяется, если новый результат не мельче
+        сохраненного или сохраненный остался от прошлого поиска; иначе
+        результат пишется во вторую запись, которая заменяется всегда.
+
+        Args:
+            key (int): Ключ Зобриста позиции
+            depth (int): Глубина поиска
+            flag (int): Тип оценки (EXACT, LOWER или UPPER)
+            score (int): Оценка
+            move (int): Упакованный лучший ход (pack_move) или NO_MOVE
+        """
+        slot = (key % self.buckets) * SLOTS_PER_BUCKET
+        if (self._keys[slot] == key or depth >= self._depths[slot] or
+                self._ages[slot] != self.generation):
+            index = slot
+        else:
+            index = slot + 1
+
+        if move == NO_MOVE and self._keys[index] == key:
+            move = self._moves[index]  # сохраняем известный лучший ход позиции
+
+        self._keys[index] = key
+        self._moves[index] = move
+        self._scores[index] = score
+        self._depths[index] = max(-128, min(127, depth))
+        self._flags[index] = flag
+        self._ages[index] = self.generation
+        self.stores += 1
+
+    def usage(self) -> float:
+        """Возвращает долю занятых записей текущего поиска.
+
+        Оценивается по равномерной выборке не более чем из 4096 записей.
+
+        Returns:
+            float: Значение от 0 до 1
+        """
+        slots = self.buckets * SLOTS_PER_BUCKET
+        sample = range(0, slots, max(1, slots // 4096))
+        used = sum(1 for i in sample if self._keys[i] and self._ages[i] == self.generation)
+        return used / len(sample)
@@ -5,31 +5,77 @@
 import pygame
 from typing import Tuple, Dict
 from .constants import *
+from .surface_cache import SurfaceCache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # шкала градиента вычисляется в цикле
+
+GRADIENT_CACHE_SIZE = 128  # готовых градиентов в памяти
+
+_gradients = SurfaceCache(GRADIENT_CACHE_SIZE)
+
+
+def gradient_ramp(color1: Tuple[int, int, int], color2: Tuple[int, int, int], length: int) -> bytes:
+    """Вычисляет цвета градиента для каждой строки (или столбца).
+
+    Цвет i-й строки - int(color1 + (color2 - color1) * i / length) по каждому
+    каналу, как при построчном рисовании. Если установлен NumPy, шкала
+    вычисляется одним векторным выражением.
+
+    Args:
+        color1 (Tuple[int, int, int]): Начальный цвет (RGB)
+        color2 (Tuple[int, int, int]): Конечный цвет (RGB)
+        length (int): Количество строк градиента
+
+    Returns:
+        bytes: length пикселей RGBA (непрозрачных), по 4 байта на пиксель
+    """
+    if np is not None:
+        ratio = np.arange(length, dtype=np.float64) / length
+        start = np.array(color1[:3], dtype=np.float64)
+        delta = np.array(color2[:3], dtype=np.float64) - start
+        ramp = np.empty((length, 4), dtype=np.uint8)
+        ramp[:, :3] = (start + delta * ratio[:, None]).astype(np.uint8)
+        ramp[:, 3] = 255
+        return ramp.tobytes()
+
+    ramp = bytearray()
+    for i in range(length):
+        ratio = i / length
+        ramp += bytes((int(color1[0] + (color2[0] - color1[0]) * ratio),
+                       int(color1[1] + (color2[1] - color1[1]) * ratio),
+                       int(color1[2] + (color2[2] - color1[2]) * ratio),
+                       255))
+    return bytes(ramp)
 
 
 def create_gradient_surface(width: int, height: int,
                             color1: Tuple[int, int, int],
                             color2: Tuple[int, int, int],
                             vertical: bool = True) -> pygame.Surface:
-    """Создание поверхности с градиентом"""
-    surface = pygame.Surface((width, height), pygame.SRCALPHA)
-
-    if vertical:
-        for y in range(height):
-            ratio = y / height
-            r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-            g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-            b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
-    else:
-        for x in range(width):
-            ratio = x / width
-            r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-            g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-            b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-            pygame.draw.line(surface, (r, g, b), (x, 0), (x, height))
-
-    return surface
+    """Создание поверхности с градиентом.
+
+    Шкала цветов записывается в полосу шириной в один пиксель, которая
+    растягивается на всю поверхность. Готовые поверхности запоминаются по
+    (размер, цвета, направление), поэтому повторный вызов ничего не рисует.
+    Возвращаемую поверхность нельзя изменять - ее можно только копировать.
+    """
+    key = (width, height, tuple(color1[:3]), tuple(color2[:3]), vertical)
+    return _gradients.get(key, lambda: _build_gradient(width, height, color1, color2, vertical))
+
+
+def _build_gradient(width, height, color1, color2, vertical):
+    """Строит поверхность с градиентом из полосы в один пиксель."""
+    if width <= 0 or height <= 0:
+        return pygame.Surface((max(width, 0), max(height, 0)), pygame.SRCALPHA)
+
+    length = height if vertical else width
+    strip_size = (1, height) if vertical else (width, 1)
+    strip = pygame.image.frombuffer(gradient_ramp(color1, color2, length), strip_size, 'RGBA')
+    # вдоль полосы размер не меняется, поэтому цвета остаются точными
+    return pygame.transform.scale(strip, (width, height))
 
 
 def draw_text_with_shadow(surface: pygame.Surface, text: str, font: pygame.font.Font,
@@ -0,0 +1,110 @@
+"""
+Модуль для хеширования позиций по Зобристу.
+
+Каждой комбинации (игрок, тип шашки, клетка) сопоставлено случайное 64-битное
+число. Ключ позиции - XOR чисел всех шашек на доске, числа стороны, которая
+ходит, и числа клетки дамки, продолжающей взятие. Ключ обновляется
+инкрементально за O(1) при каждом ходе и подходит для кэшей, поиска повторений
+и таблиц транспозиций.
+
+Таблица ключей строится детерминированно из фиксированного зерна, поэтому
+ключи одной и той же позиции совпадают между запусками и процессами.
+"""
+
+import random
+from typing import Optional, Tuple
+from .constants import BOARD_SIZE
+from .enums import PieceType, Player
+from .bitboard import SQUARE_COUNT, BIT_TO_SQUARE, coords_to_square, iter_bits
+
+ZOBRIST_SEED = 20250301  # зерно генератора ключей
+
+_rng = random.Random(ZOBRIST_SEED)
+
+# PIECE_KEYS[игрок][дамка][клетка]
+PIECE_KEYS = tuple(
+    tuple(tuple(_rng.getrandbits(64) for _ in range(SQUARE_COUNT)) for _ in range(2))
+    for _ in range(2)
+)
+SIDE_KEY = _rng.getrandbits(64)  # добавляется, когда ходят черные
+CONTINUATION_KEYS = tuple(_rng.getrandbits(64) for _ in range(SQUARE_COUNT))
+
+del _rng
+
+
+def piece_key(row: int, col: int, piece) -> int:
+    """Возвращает ключ шашки на клетке.
+
+    Args:
+        row (int): Ряд клетки
+        col (int): Столбец клетки
+        piece (Piece): Шашка
+
+    Returns:
+        int: 64-битный ключ
+    """
+    is_king = 1 if piece.type == PieceType.KING else 0
+    return PIECE_KEYS[piece.player.value][is_king][coords_to_square(row, col)]
+
+
+def board_key(board) -> int:
+    """Вычисляет ключ расстановки шашек на доске (без стороны хода).
+
+    Args:
+        board (List[List[Optional[Piece]]]): Доска 8x8
+
+    Returns:
+        int: 64-битный ключ расстановки
+    """
+    key = 0
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            piece = board[row][col]
+            if piece:
+                key ^= piece_key(row, col, piece)
+    return key
+
+
+def state_key(placement_key: int, current_player: Player,
+              continuation: Optional[Tuple[int, int]] = None) -> int:
+    """Дополняет ключ расстановки стороной хода и продолжением взятия.
+
+    Args:
+        placement_key (int): Ключ расстановки из board_key()
+        current_player (Player): Игрок, который ходит
+        continuation (Optional[Tuple[int, int]]): Клетка шашки, продолжающей взятие
+
+    Returns:
+        int: 64-битный ключ позиции
+    """
+    key = placement_key
+    if current_player == Player.BLACK:
+        key ^= SIDE_KEY
+    if continuation is not None:
+        key ^= CONTINUATION_KEYS[coords_to_square(*continuation)]
+    return key
+
+
+def position_key(position) -> int:
+    """Вычисляет ключ битбордовой позиции.
+
+    Ключ совпадает с CheckersGame.zobrist_key для той же позиции.
+
+    Args:
+        position (BitboardPosition): Позиция
+
+    Returns:
+        int: 64-битный ключ позиции
+    """
+    key = 0
+    white_keys, black_keys = PIECE_KEYS[Player.WHITE.value], PIECE_KEYS[Player.BLACK.value]
+    kings = position.kings
+    for bit in iter_bits(position.white):
+        key ^= white_keys[kings >> bit & 1][BIT_TO_SQUARE[bit]]
+    for bit in iter_bits(position.black):
+        key ^= black_keys[kings >> bit & 1][BIT_TO_SQUARE[bit]]
+    if position.current_player == Player.BLACK:
+        key ^= SIDE_KEY
+    if position.pending >= 0:
+        key ^= CONTINUATION_KEYS[BIT_TO_SQUARE[position.pending]]
+    return key
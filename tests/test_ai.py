@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.ai import AIPlayer, evaluate, MATE_SCORE, MAX_PLY
+from src.bitboard import BitboardPosition
+from src.constants import BOARD_SIZE
+from src.enums import PieceType, Player
+from src.models import Piece
+
+
+def empty_board():
+    """Создает пустую доску"""
+    return [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+
+
+class TestEvaluation(unittest.TestCase):
+    """Тесты статической оценки"""
+
+    def test_initial_position_is_equal(self):
+        """Тест нулевой оценки симметричной начальной позиции"""
+        self.assertEqual(evaluate(BitboardPosition.initial()), 0)
+
+    def test_king_worth_more_than_man(self):
+        """Тест преимущества дамки над простой шашкой"""
+        board = empty_board()
+        board[4][3] = Piece(Player.WHITE, PieceType.KING)
+        board[3][6] = Piece(Player.BLACK)
+
+        self.assertGreater(evaluate(BitboardPosition.from_board(board, Player.WHITE)), 0)
+        self.assertLess(evaluate(BitboardPosition.from_board(board, Player.BLACK)), 0)
+
+
+class TestSearch(unittest.TestCase):
+    """Тесты поиска хода"""
+
+    def test_search_returns_legal_move(self):
+        """Тест выбора допустимого хода в начальной позиции"""
+        position = BitboardPosition.initial()
+        result = AIPlayer(Player.WHITE).search(position, 0.2)
+
+        self.assertIn(result.move, position.generate_moves())
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertGreater(result.nodes, 0)
+
+    def test_finds_blocking_win(self):
+        """Тест нахождения хода, оставляющего соперника без ходов"""
+        board = empty_board()
+        board[0][1] = Piece(Player.BLACK)
+        board[1][0] = Piece(Player.WHITE)
+        board[1][2] = Piece(Player.WHITE)
+        board[2][3] = Piece(Player.WHITE)
+        board[6][7] = Piece(Player.WHITE)
+
+        position = BitboardPosition.from_board(board, Player.WHITE)
+        result = AIPlayer(Player.WHITE).search(position, 1.0)
+
+        self.assertEqual(position.to_game_move(result.move)[:4], (6, 7, 5, 6))
+        self.assertGreaterEqual(result.score, MATE_SCORE - MAX_PLY)
+
+    def test_no_moves(self):
+        """Тест поиска в позиции без ходов"""
+        board = empty_board()
+        board[0][1] = Piece(Player.WHITE)
+
+        result = AIPlayer(Player.WHITE).search(BitboardPosition.from_board(board), 0.1)
+        self.assertIsNone(result.move)
+
+    def test_captures_beyond_max_ply(self):
+        """Тест: досчет взятий глубже MAX_PLY не обращается к убийцам за пределами таблицы"""
+        ai = AIPlayer(Player.WHITE)
+        ai._deadline = float("inf")
+        position = BitboardPosition.from_game(CheckersGame(position="W:W22,31:B18,11"))
+
+        score = ai._negamax(position, 0, -MATE_SCORE, MATE_SCORE, MAX_PLY)
+        self.assertGreater(score, 0)
+        ai._record_cutoff(position.generate_moves()[0], 1, MAX_PLY)
+
+
+class TestAIPlayer(unittest.TestCase):
+    """Тесты компьютерного игрока в игре"""
+
+    def test_time_budget_uses_remaining_time(self):
+        """Тест распределения оставшегося времени"""
+        game = CheckersGame()
+        ai = AIPlayer(Player.BLACK, max_time=0.5, moves_to_go=30)
+
+        self.assertEqual(ai.time_budget(game), 0.5)
+        game.black_time = 3.0
+        self.assertAlmostEqual(ai.time_budget(game), 0.1)
+
+    def test_play_makes_move(self):
+        """Тест хода компьютера"""
+        game = CheckersGame()
+        ai = AIPlayer(Player.WHITE, max_time=0.1)
+
+        self.assertTrue(ai.play(game))
+        self.assertEqual(game.current_player, Player.BLACK)
+        self.assertEqual(len(game.move_history), 1)
+        self.assertFalse(ai.play(game))  # не его очередь
+
+    def test_play_keeps_chosen_captures(self):
+        """Тест: из двух взятий с общим концом выполняется найденное поиском"""
+        game = CheckersGame(position="B:W13,23,24,25,26,28,32:B1,5,6,8,9,10,21,K29")
+        chains = [move for move in game.get_legal_moves() if move[:4] == (7, 0, 4, 7)]
+        self.assertEqual(len(chains), 2)
+
+        for chain in chains:
+            game = CheckersGame(position="B:W13,23,24,25,26,28,32:B1,5,6,8,9,10,21,K29")
+            ai = AIPlayer(Player.BLACK)
+            with patch.object(ai, "choose_move", return_value=chain):
+                self.assertTrue(ai.play(game))
+            self.assertEqual(game.move_history[-1]['captured'], chain[4])
+
+    @patch.object(CheckersGame, 'save_game_result')
+    def test_plays_full_game(self, mock_save):
+        """Тест партии компьютера против самого себя до конца"""
+        game = CheckersGame()
+        players = {Player.WHITE: AIPlayer(Player.WHITE, max_depth=2),
+                   Player.BLACK: AIPlayer(Player.BLACK, max_depth=2)}
+
+        for _ in range(500):
+            if game.game_over:
+                break
+            self.assertTrue(players[game.current_player].play(game))
+
+        self.assertGreater(len(game.move_history), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+import random
+import sys
+import os
+from unittest.mock import patch
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.bitboard import (BitboardPosition, coords_to_bit, coords_to_square, square_to_coords,
+                          BOARD_MASK, SQUARE_COUNT)
+from src.constants import BOARD_SIZE
+from src.enums import PieceType, Player
+from src.models import Piece
+
+
+def game_legal_moves(game):
+    """Собирает допустимые ходы CheckersGame так же, как их разрешает handle_click"""
+    if game.multiple_capture:
+        fr, fc = game.selected_piece
+        return {(fr, fc, tr, tc, frozenset(c)) for tr, tc, c in game.valid_moves}
+
+    all_captures = game.get_all_possible_captures(game.current_player)
+    moves = set()
+    if all_captures:
+        by_piece = {}
+        for fr, fc, tr, tc, captured in all_captures:
+            by_piece.setdefault((fr, fc), []).append((tr, tc, captured))
+        for (fr, fc), piece_captures in by_piece.items():
+            longest = max(len(c) for _, _, c in piece_captures)
+            for tr, tc, captured in piece_captures:
+                if len(captured) == longest:
+                    moves.add((fr, fc, tr, tc, frozenset(captured)))
+    else:
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                piece = game.get_piece(row, col)
+                if piece and piece.player == game.current_player:
+                    for tr, tc in game.get_simple_moves_for_piece(row, col, piece):
+                        moves.add((row, col, tr, tc, frozenset()))
+    return moves
+
+
+def bitboard_legal_moves(position):
+    """Переводит ходы битборда в формат CheckersGame"""
+    moves = set()
+    for move in position.generate_moves():
+        fr, fc, tr, tc, captured = position.to_game_move(move)
+        moves.add((fr, fc, tr, tc, frozenset(captured)))
+    return moves
+
+
+class TestSquareMapping(unittest.TestCase):
+    """Тесты соответствия клеток и битов"""
+
+    def test_square_round_trip(self):
+        """Тест взаимного преобразования номера клетки и координат"""
+        for square in range(SQUARE_COUNT):
+            row, col = square_to_coords(square)
+            self.assertEqual((row + col) % 2, 1)
+            self.assertEqual(coords_to_square(row, col), square)
+
+    def test_board_mask_has_32_squares(self):
+        """Тест количества игровых клеток в маске"""
+        self.assertEqual(bin(BOARD_MASK).count("1"), SQUARE_COUNT)
+
+
+class TestBitboardConversion(unittest.TestCase):
+    """Тесты преобразования доски в битборд и обратно"""
+
+    def test_initial_position_matches_game(self):
+        """Тест совпадения начальной позиции с расстановкой CheckersGame"""
+        game = CheckersGame()
+        self.assertEqual(BitboardPosition.from_game(game), BitboardPosition.initial())
+
+    def test_board_round_trip(self):
+        """Тест обратного преобразования доски с дамками"""
+        board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        board[0][1] = Piece(Player.WHITE, PieceType.KING)
+        board[3][4] = Piece(Player.BLACK)
+        board[7][6] = Piece(Player.BLACK, PieceType.KING)
+
+        position = BitboardPosition.from_board(board, Player.BLACK)
+        restored = position.to_board()
+
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                self.assertEqual(restored[row][col], board[row][col])
+
+
+class TestBitboardMoveGeneration(unittest.TestCase):
+    """Тесты генератора ходов на битбордах"""
+
+    def test_initial_moves(self):
+        """Тест количества ходов в начальной позиции"""
+        self.assertEqual(len(BitboardPosition.initial().generate_moves()), 7)
+
+    def test_king_multiple_capture(self):
+        """Тест множественного взятия дамкой"""
+        board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        board[7][0] = Piece(Player.WHITE, PieceType.KING)
+        board[5][2] = Piece(Player.BLACK)
+        board[2][3] = Piece(Player.BLACK)
+
+        game = CheckersGame()
+        game.board = board
+        position = BitboardPosition.from_board(board)
+
+        self.assertEqual(bitboard_legal_moves(position), game_legal_moves(game))
+        self.assertTrue(all(len(captured) == 2 for _, _, captured in position.generate_moves()))
+
+    def test_promotion_continues_capture(self):
+        """Тест продолжения взятия дамкой после превращения"""
+        board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        board[2][3] = Piece(Player.WHITE)
+        board[1][2] = Piece(Player.BLACK)
+        board[4][5] = Piece(Player.BLACK)
+
+        position = BitboardPosition.from_board(board)
+        moves = position.generate_moves()
+        self.assertEqual(len(moves), 1)
+
+        after = position.apply_move(moves[0])
+        self.assertEqual(after.current_player, Player.WHITE)
+        self.assertEqual(after.pending, coords_to_bit(0, 1))
+        self.assertTrue(after.kings >> after.pending & 1)
+
+    def test_capture_ending_on_start_square(self):
+        """Тест взятия по кругу с возвратом на исходную клетку"""
+        board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        board[2][7] = Piece(Player.WHITE)
+        for row, col in [(1, 6), (1, 4), (3, 4), (3, 6)]:
+            board[row][col] = Piece(Player.BLACK)
+
+        position = BitboardPosition.from_board(board)
+        circle = [m for m in position.generate_moves() if m[0] == m[1]]
+        self.assertTrue(circle)
+
+        after = position.apply_move(circle[0])
+        self.assertEqual(after.count(Player.WHITE), 1)
+        self.assertEqual(after.count(Player.BLACK), 0)
+
+    @patch.object(CheckersGame, 'save_game_result')
+    def test_random_games_match_checkers_game(self, mock_save):
+        """Тест совпадения ходов с CheckersGame на случайных партиях"""
+        rng = random.Random(2024)
+
+        for _ in range(20):
+            game = CheckersGame()
+            position = BitboardPosition.initial()
+
+            while not game.game_over:
+                self.assertEqual(BitboardPosition.from_game(game), position)
+                self.assertEqual(bitboard_legal_moves(position), game_legal_moves(game))
+
+                move = rng.choice(position.generate_moves())
+                fr, fc, tr, tc, captured = position.to_game_move(move)
+                game.selected_piece = (fr, fc)
+                game.valid_moves = [(tr, tc, captured)]
+                self.assertTrue(game.move_piece(fr, fc, tr, tc))
+                position = position.apply_move(move)
+
+
+if __name__ == '__main__':
+    unittest.main()
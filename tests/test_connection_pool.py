@@ -0,0 +1,340 @@
+import unittest
+import threading
+import time
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.connection_pool import ConnectionPool, PoolExhaustedError
+from src.database import DatabaseManager
+
+
+class FakeCursor:
+    """Курсор-заглушка, записывающий запросы в соединение"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, params=None):
+        if self.connection.fail_queries:
+            raise RuntimeError("server closed the connection")
+        words = query.split()
+        self.connection.queries.append(words[2] if words[0] == "INSERT" else words[0])
+        self.connection.params.append(params)
+        self.connection.sql.append(" ".join(words))
+
+    def fetchone(self):
+        return {'id': 1}
+
+    def fetchall(self):
+        return [{'winner': 'white', 'total_games': 3}]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Соединение-заглушка"""
+
+    def __init__(self):
+        self.closed = 0
+        self.fail_queries = False
+        self.queries = []
+        self.params = []
+        self.sql = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.in_use = False
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Тесты пула соединений"""
+
+    def test_opens_min_connections(self):
+        """Тест открытия минимального числа соединений при создании"""
+        pool = ConnectionPool(FakeConnection, min_size=2, max_size=4)
+        self.assertEqual((pool.size, pool.idle), (2, 2))
+
+    def test_invalid_sizes(self):
+        """Тест проверки размеров пула"""
+        with self.assertRaises(ValueError):
+            ConnectionPool(FakeConnection, min_size=3, max_size=2)
+
+    def test_reuses_released_connection(self):
+        """Тест повторного использования возвращенного соединения"""
+        pool = ConnectionPool(FakeConnection, min_size=0, max_size=2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(pool.size, 1)
+
+    def test_max_size_and_timeout(self):
+        """Тест ограничения размера пула"""
+        pool = ConnectionPool(FakeConnection, min_size=0, max_size=2)
+        first, second = pool.acquire(), pool.acquire()
+
+        with self.assertRaises(PoolExhaustedError):
+            pool.acquire(timeout=0.05)
+
+        pool.release(first)
+        self.assertIs(pool.acquire(timeout=0.05), first)
+        pool.release(second)
+
+    def test_waiting_caller_gets_released_connection(self):
+        """Тест ожидания освобождения соединения другим потоком"""
+        pool = ConnectionPool(FakeConnection, min_size=1, max_size=1)
+        held = pool.acquire()
+        threading.Timer(0.05, pool.release, args=(held,)).start()
+
+        self.assertIs(pool.acquire(timeout=2), held)
+
+    def test_closed_connection_replaced_on_borrow(self):
+        """Тест замены закрытого соединения при выдаче"""
+        pool = ConnectionPool(FakeConnection, min_size=1, max_size=1)
+        with pool.connection() as connection:
+            pass
+        connection.closed = 1
+
+        with pool.connection() as fresh:
+            self.assertIsNot(fresh, connection)
+        self.assertEqual(pool.size, 1)
+
+    def test_stale_connection_is_pinged(self):
+        """Тест проверки давно простаивавшего соединения запросом"""
+        pool = ConnectionPool(FakeConnection, min_size=1, max_size=1, ping_after=0)
+        with pool.connection() as connection:
+            pass
+        connection.fail_queries = True
+
+        with pool.connection() as fresh:
+            self.assertIsNot(fresh, connection)
+        self.assertEqual(connection.closed, 1)
+
+    def test_error_rolls_back(self):
+        """Тест отката транзакции при ошибке внутри операции"""
+        pool = ConnectionPool(FakeConnection, min_size=1, max_size=1)
+        with self.assertRaises(ZeroDivisionError):
+            with pool.connection() as connection:
+                1 / 0
+        self.assertEqual(connection.rollbacks, 1)
+        self.assertEqual(pool.idle, 1)
+
+    def test_reaps_idle_connections_above_minimum(self):
+        """Тест закрытия лишних простаивающих соединений"""
+        pool = ConnectionPool(FakeConnection, min_size=1, max_size=3, max_idle_time=0.05)
+        connections = [pool.acquire() for _ in range(3)]
+        for connection in connections:
+            pool.release(connection)
+        self.assertEqual(pool.size, 3)
+
+        time.sleep(0.1)
+        self.assertEqual(pool.reap_idle(), 2)
+        self.assertEqual(pool.size, 1)
+
+    def test_threads_never_share_connection(self):
+        """Тест: одно соединение не выдается двум потокам одновременно"""
+        pool = ConnectionPool(FakeConnection, min_size=0, max_size=3)
+        errors = []
+
+        def worker():
+            for _ in range(50):
+                with pool.connection() as connection:
+                    if connection.in_use:
+                        errors.append("shared")
+                    connection.in_use = True
+                    time.sleep(0.0005)
+                    connection.in_use = False
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(pool.size, 3)
+
+    def test_close_all(self):
+        """Тест закрытия пула"""
+        pool = ConnectionPool(FakeConnection, min_size=2, max_size=2)
+        held = pool.acquire()
+        pool.close_all()
+
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+        pool.release(held)
+        self.assertEqual(held.closed, 1)
+        self.assertEqual(pool.size, 0)
+
+
+class TestPooledDatabaseManager(unittest.TestCase):
+    """Тесты DatabaseManager поверх пула соединений"""
+
+    def setUp(self):
+        """Подготовка менеджера с пулом соединений-заглушек"""
+        self.manager = DatabaseManager()
+        self.manager.pool = ConnectionPool(FakeConnection, min_size=1, max_size=2)
+
+    def test_not_connected(self):
+        """Тест работы без подключения"""
+        manager = DatabaseManager()
+        self.assertFalse(manager.save_game_result("white", 3, 0, 100.0, 50.0))
+        self.assertEqual(manager.get_game_statistics(), [])
+        self.assertEqual(manager.get_winner_stats(), {})
+
+    def test_save_game_result_commits(self):
+        """Тест сохранения результата через соединение из пула"""
+        self.assertTrue(self.manager.save_game_result("white", 3, 0, 100.0, 50.0, 40,
+                                                      "5:00", {"total_captures": 12}))
+        with self.manager.pool.connection() as connection:
+            self.assertEqual(connection.queries, ["game_results", "winner_stats",
+                                                  "player_stats", "player_stats"])
+            self.assertEqual(connection.params[1], ("white", 1, 3, 0, 100.0, 50.0))
+            self.assertEqual(connection.params[2:], [("white", 1, 1, 0, 12), ("black", 1, 0, 1, 9)])
+            self.assertEqual(connection.commits, 1)
+
+    def test_pieces_taken_from_capture_counts(self):
+        """Тест: взятые шашки берутся из счетчиков партии, а не из 12 минус оставшиеся"""
+        info = {"white_captures": 1, "black_captures": 0, "start_position": "B:W21,22:BK5,10"}
+        self.assertTrue(self.manager.save_game_result("white", 2, 1, 100.0, 50.0, 1, "0:05", info))
+        self.assertTrue(self.manager.save_game_result("black", 2, 0, 1.0, 5.0, 1, "0:05",
+                                                      {"start_position": "B:W21,22:BK5,10"}))
+        with self.manager.pool.connection() as connection:
+            self.assertEqual(connection.params[2:4], [("white", 1, 1, 0, 1), ("black", 1, 0, 1, 0)])
+            self.assertEqual(connection.params[6:8], [("white", 1, 0, 1, 0), ("black", 1, 1, 0, 0)])
+
+    def test_failed_save_rolls_back(self):
+        """Тест отката при ошибке сохранения"""
+        with self.manager.pool.connection() as connection:
+            connection.fail_queries = True
+
+        self.assertFalse(self.manager.save_game_result("black", 0, 2, 0.0, 10.0))
+        self.assertEqual(connection.rollbacks, 1)
+        self.assertEqual(self.manager.pool.idle, 1)
+
+    @patch('psycopg2.extras.execute_values')
+    def test_save_game_results_in_one_transaction(self, mock_execute_values):
+        """Тест пакетного сохранения одной транзакцией"""
+        results = [dict(winner="white", white_pieces=2, black_pieces=0, white_time=10.0,
+                        black_time=5.0, total_moves=30, game_duration="3:00",
+                        additional_info={"total_captures": i}) for i in range(4)]
+        results.append(dict(winner="black", white_pieces=0, black_pieces=5,
+                            white_time=1.0, black_time=2.0))
+
+        self.assertEqual(self.manager.save_game_results(results), 5)
+
+        mock_execute_values.assert_called_once()
+        rows = mock_execute_values.call_args[0][2]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0][:7], ("white", 2, 0, 10.0, 5.0, 30, "3:00"))
+        with self.manager.pool.connection() as connection:
+            # итоги пачки суммируются и обновляются по одному разу на ключ
+            self.assertEqual(connection.params, [("white", 4, 8, 0, 40.0, 20.0),
+                                                 ("black", 1, 0, 5, 1.0, 2.0),
+                                                 ("white", 5, 4, 1, 55),
+                                                 ("black", 5, 1, 4, 52)])
+            self.assertEqual(connection.commits, 1)
+
+    @patch('psycopg2.extras.execute_values', side_effect=RuntimeError("copy failed"))
+    def test_failed_bulk_save_rolls_back(self, mock_execute_values):
+        """Тест отката всей пачки при ошибке"""
+        results = [dict(winner="black", white_pieces=0, black_pieces=1, white_time=0.0, black_time=1.0)]
+
+        self.assertEqual(self.manager.save_game_results(results), 0)
+        with self.manager.pool.connection() as connection:
+            self.assertEqual((connection.commits, connection.rollbacks), (0, 1))
+        self.assertEqual(self.manager.save_game_results([]), 0)
+
+    def test_statistics(self):
+        """Тест получения статистики"""
+        self.assertEqual(self.manager.get_winner_stats(), {'white': {'winner': 'white', 'total_games': 3}})
+        self.assertEqual(len(self.manager.get_game_statistics(5)), 1)
+
+    def test_player_stats(self):
+        """Тест чтения итогов по игрокам"""
+        manager = DatabaseManager()
+        self.assertEqual(manager.get_player_stats(), {})
+        with patch.object(FakeCursor, 'fetchall', return_value=[
+                {'player_name': 'white', 'total_games': 2, 'wins': 1, 'losses': 1,
+                 'total_pieces_taken': 14}]):
+            self.assertEqual(self.manager.get_player_stats()['white']['wins'], 1)
+
+    def history_rows(self, count):
+        """Строки истории от новых к старым"""
+        start = datetime(2025, 3, 1, 12, 0)
+        return [{'id': 100 - i, 'game_date': start - timedelta(minutes=i), 'winner': 'white'}
+                for i in range(count)]
+
+    def test_history_keyset_pagination(self):
+        """Тест постраничной истории с курсором"""
+        with patch.object(FakeCursor, 'fetchall', return_value=self.history_rows(4)):
+            games, cursor = self.manager.get_game_history(limit=3)
+
+        self.assertEqual([game['id'] for game in games], [100, 99, 98])
+        self.assertEqual(cursor, (games[-1]['game_date'], 98))
+
+        with patch.object(FakeCursor, 'fetchall', return_value=self.history_rows(2)):
+            games, next_cursor = self.manager.get_game_history(limit=3, after=cursor, winner='black',
+                                                               date_from=datetime(2025, 1, 1))
+        self.assertIsNone(next_cursor)
+
+        with self.manager.pool.connection() as connection:
+            sql, params = connection.sql[-1], connection.params[-1]
+        self.assertIn("winner = %s AND game_date >= %s AND (game_date, id) < (%s, %s)", sql)
+        self.assertIn("ORDER BY game_date DESC, id DESC", sql)
+        self.assertEqual(params, ['black', datetime(2025, 1, 1), cursor[0], 98, 4])
+
+    def test_game_statistics_uses_history(self):
+        """Тест последних игр через первую страницу истории"""
+        with patch.object(FakeCursor, 'fetchall', return_value=self.history_rows(3)):
+            self.assertEqual(len(self.manager.get_game_statistics(limit=2)), 2)
+        self.assertEqual(DatabaseManager().get_game_history(), ([], None))
+
+    def test_create_tables_adds_indexes(self):
+        """Тест создания индексов истории игр"""
+        self.manager.create_tables()
+        with self.manager.pool.connection() as connection:
+            sql = connection.sql[-1]
+        self.assertIn("ON game_results (game_date DESC, id DESC)", sql)
+        self.assertIn("ON game_results (winner, game_date DESC, id DESC)", sql)
+        self.assertIn("USING GIN (additional_info)", sql)
+
+    def test_concurrent_saves(self):
+        """Тест одновременного сохранения из нескольких потоков"""
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            self.manager.save_game_result("white", 1, 0, 1.0, 1.0))) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [True] * 10)
+        self.assertLessEqual(self.manager.pool.size, 2)
+
+    def test_close(self):
+        """Тест закрытия соединений менеджера"""
+        self.manager.close()
+        self.assertIsNone(self.manager.pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.frame_pacing import (idle_timeout, seconds_to_next_tick,
+                              IDLE_MAX_WAIT, TIMER_WAKE_MARGIN)
+
+
+class TestSecondsToNextTick(unittest.TestCase):
+    """Тесты вычисления времени до смены показания таймера"""
+
+    def test_fraction_of_second(self):
+        """Тест: показание меняется, когда время опускается ниже целого"""
+        self.assertAlmostEqual(seconds_to_next_tick(419.25), 0.25)
+        self.assertAlmostEqual(seconds_to_next_tick(0.5), 0.5)
+
+    def test_whole_second(self):
+        """Тест: на целом значении до смены показания ровно секунда"""
+        self.assertEqual(seconds_to_next_tick(420), 1.0)
+
+    def test_time_is_up(self):
+        """Тест: для истекшего времени ждать нечего"""
+        self.assertEqual(seconds_to_next_tick(0), 0.0)
+        self.assertEqual(seconds_to_next_tick(-1), 0.0)
+
+
+class TestIdleTimeout(unittest.TestCase):
+    """Тесты выбора таймаута ожидания событий"""
+
+    def test_animation_needs_full_rate(self):
+        """Тест: во время анимации кадр рисуется без ожидания"""
+        self.assertEqual(idle_timeout(True, [0.5]), 0)
+
+    def test_wakes_after_nearest_deadline(self):
+        """Тест: цикл просыпается сразу после ближайшего изменения картинки"""
+        self.assertEqual(idle_timeout(False, [0.3, None, 0.1204]), 121 + TIMER_WAKE_MARGIN)
+
+    def test_wait_is_limited(self):
+        """Тест: ожидание ограничено даже без сроков"""
+        self.assertEqual(idle_timeout(False, []), IDLE_MAX_WAIT)
+        self.assertEqual(idle_timeout(False, [None, 5.0]), IDLE_MAX_WAIT)
+        self.assertEqual(idle_timeout(False, [5.0], max_wait=250), 250)
+
+
+if __name__ == '__main__':
+    unittest.main()
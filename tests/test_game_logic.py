@@ -1,4 +1,5 @@
 import unittest
+import subprocess
 import time
 import sys
 import os
@@ -338,6 +339,26 @@ class TestCaptureLogic(unittest.TestCase):
         double_captures = [captured for _, _, captured in captures if len(captured) == 2]
         self.assertGreater(len(double_captures), 0)
 
+    def test_capture_search_restores_board(self):
+        """Тест восстановления доски после поиска взятий дамкой"""
+        self.game.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+
+        king = Piece(Player.WHITE, PieceType.KING)
+        self.game.board[7][0] = king
+        self.game.board[5][2] = Piece(Player.BLACK)
+        self.game.board[2][3] = Piece(Player.BLACK)
+        self.game.board[2][5] = Piece(Player.BLACK)
+
+        board = self.game.board
+        snapshot = [row[:] for row in board]
+
+        captures = self.game.get_captures_for_piece(7, 0, king)
+
+        self.assertGreater(max(len(captured) for _, _, captured in captures), 1)
+        # Поиск идет на месте: тот же объект доски и то же содержимое
+        self.assertIs(self.game.board, board)
+        self.assertEqual(board, snapshot)
+
 
 class TestGameMechanics(unittest.TestCase):
     """Тесты игровой механики"""
@@ -428,6 +449,49 @@ class TestGameMechanics(unittest.TestCase):
         self.assertEqual(self.game.board[2][2], white_piece)  # Белая шашка на новой позиции
 
 
+class TestMoveTableCache(unittest.TestCase):
+    """Тесты кэша допустимых ходов"""
+
+    def setUp(self):
+        """Подготовка тестовой среды"""
+        self.game = CheckersGame()
+
+    def test_table_reused_within_position(self):
+        """Тест повторного использования таблицы в одной позиции"""
+        table = self.game.get_move_table()
+
+        self.game.get_valid_moves(5, 0)
+        self.game.check_game_over()
+
+        self.assertIs(self.game.get_move_table(), table)
+        self.assertIs(self.game.get_all_possible_captures(Player.WHITE), table.captures)
+
+    def test_table_invalidated_after_move(self):
+        """Тест сброса таблицы после хода"""
+        table = self.game.get_move_table()
+        version = self.game.position_version
+
+        self.game.handle_click(5, 0)
+        self.game.handle_click(4, 1)
+
+        self.assertGreater(self.game.position_version, version)
+        self.assertIsNot(self.game.get_move_table(), table)
+        self.assertEqual(self.game.get_move_table().player, Player.BLACK)
+
+    def test_table_invalidated_on_board_change(self):
+        """Тест сброса таблицы при замене доски и ручном изменении"""
+        self.assertEqual(self.game.get_all_possible_captures(Player.WHITE), [])
+
+        self.game.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        self.game.board[4][4] = Piece(Player.WHITE)
+        self.game.board[3][3] = Piece(Player.BLACK)
+        self.assertEqual(len(self.game.get_all_possible_captures(Player.WHITE)), 1)
+
+        self.game.board[3][3] = None
+        self.game.invalidate_moves_cache()
+        self.assertEqual(self.game.get_all_possible_captures(Player.WHITE), [])
+
+
 class TestGameOverConditions(unittest.TestCase):
     """Тесты условий окончания игры"""
 
@@ -557,13 +621,13 @@ class TestDatabaseIntegration(unittest.TestCase):
 
     def setUp(self):
         """Подготовка тестовой среды"""
-        self.game = CheckersGame()
+        self.mock_db_manager = Mock()
+        self.game = CheckersGame(result_sink=self.mock_db_manager)
 
-    @patch('src.game_logic.db_manager')
-    def test_save_game_result_success(self, mock_db_manager):
+    def test_save_game_result_success(self):
         """Тест успешного сохранения результата игры"""
         # Настраиваем мок
-        mock_db_manager.save_game_result.return_value = True
+        self.mock_db_manager.save_game_result.return_value = True
 
         # Завершаем игру
         self.game.game_over = True
@@ -574,13 +638,12 @@ class TestDatabaseIntegration(unittest.TestCase):
 
         self.assertTrue(result)
         self.assertTrue(self.game.game_saved)
-        mock_db_manager.save_game_result.assert_called_once()
+        self.mock_db_manager.save_game_result.assert_called_once()
 
-    @patch('src.game_logic.db_manager')
-    def test_save_game_result_already_saved(self, mock_db_manager):
+    def test_save_game_result_already_saved(self):
         """Тест предотвращения повторного сохранения"""
         # Настраиваем мок
-        mock_db_manager.save_game_result.return_value = True
+        self.mock_db_manager.save_game_result.return_value = True
 
         # Первое сохранение
         self.game.game_over = True
@@ -588,11 +651,32 @@ class TestDatabaseIntegration(unittest.TestCase):
         self.game.save_game_result()
 
         # Второе сохранение (не должно вызывать db_manager)
-        mock_db_manager.save_game_result.reset_mock()
+        self.mock_db_manager.save_game_result.reset_mock()
         result = self.game.save_game_result()
 
         self.assertFalse(result)  # Возвращает False при повторном сохранении
-        mock_db_manager.save_game_result.assert_not_called()
+        self.mock_db_manager.save_game_result.assert_not_called()
+
+    def test_no_result_sink_by_default(self):
+        """Тест игры без приемника результатов"""
+        game = CheckersGame()
+        game.game_over = True
+        game.winner = Player.BLACK
+
+        self.assertIsNone(game.result_sink)
+        self.assertFalse(game.save_game_result())
+        self.assertTrue(game.game_saved)
+
+    def test_rules_do_not_import_database_driver(self):
+        """Тест: логика игры не загружает psycopg2 и dotenv"""
+        code = ("import sys\n"
+                "import src.game_logic, src.database\n"
+                "assert 'psycopg2' not in sys.modules, 'psycopg2 imported'\n"
+                "assert 'dotenv' not in sys.modules, 'dotenv imported'\n")
+        result = subprocess.run([sys.executable, "-c", code],
+                                cwd=os.path.join(os.path.dirname(__file__), '..'),
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
 
 
 class TestEdgeCases(unittest.TestCase):
@@ -675,5 +759,55 @@ class TestPerformance(unittest.TestCase):
         self.assertLess(end_time - start_time, 0.5)
 
 
+class TestLegalMoves(unittest.TestCase):
+    """Тесты списка допустимых ходов и хода без кликов"""
+
+    def test_initial_legal_moves(self):
+        """Тест допустимых ходов в начальной позиции"""
+        moves = CheckersGame().get_legal_moves()
+        self.assertEqual(len(moves), 7)
+        self.assertIn((5, 0, 4, 1, []), moves)
+
+    def test_play_move(self):
+        """Тест хода через play_move"""
+        game = CheckersGame()
+
+        self.assertFalse(game.play_move(5, 0, 3, 2))  # нет такого хода
+        self.assertEqual(game.current_player, Player.WHITE)
+
+        self.assertTrue(game.play_move(5, 0, 4, 1))
+        self.assertEqual(game.current_player, Player.BLACK)
+        self.assertEqual(game.move_history[-1]['to'], (4, 1))
+
+    def test_play_move_checks_captured(self):
+        """Тест выбора взятия по набору взятых шашек"""
+        game = CheckersGame()
+        game.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        game.board[5][2] = Piece(Player.WHITE)
+        game.board[4][3] = Piece(Player.BLACK)
+        game.board[0][1] = Piece(Player.BLACK)
+        game.invalidate_moves_cache()
+
+        self.assertFalse(game.play_move(5, 2, 3, 4, [(4, 1)]))
+        self.assertTrue(game.play_move(5, 2, 3, 4, [(4, 3)]))
+        self.assertIsNone(game.board[4][3])
+
+    def test_snapshot_restore(self):
+        """Тест отката хода с превращением в дамку через snapshot/restore"""
+        game = CheckersGame.from_position("W:W5:B12")
+        key = game.zobrist_key
+        snapshot = game.snapshot()
+
+        self.assertTrue(game.play_move(1, 0, 0, 1))
+        self.assertEqual(game.board[0][1].type, PieceType.KING)
+
+        game.restore(snapshot)
+        self.assertEqual(game.get_position(), "W:W5:B12")
+        self.assertEqual(game.board[1][0].type, PieceType.MAN)
+        self.assertEqual(game.move_history, [])
+        self.assertEqual(game.zobrist_key, key)
+        self.assertIn((1, 0, 0, 1, []), game.get_legal_moves())
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,379 @@
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # окно без дисплея
+
+import pygame
+from src.constants import SQUARE_SIZE, LIGHT_WOOD, DARK_WOOD, WIDTH, HEIGHT
+from src.graphics import CheckersGUI
+from src.surface_cache import SurfaceCache
+from src.dirty_rects import DirtyRectTracker, merge_rects
+from src.text_cache import TextCache
+from src.profiler import FrameProfiler
+from src.frame_pacing import IDLE_MAX_WAIT
+
+
+def setUpModule():
+    pygame.init()
+
+
+def tearDownModule():
+    pygame.quit()
+
+
+class TestSurfaceCache(unittest.TestCase):
+    """Тесты кэша поверхностей"""
+
+    def test_builds_once(self):
+        """Тест: поверхность строится один раз для ключа"""
+        cache = SurfaceCache()
+        calls = []
+        build = lambda: calls.append(1) or object()
+
+        first = cache.get("a", build)
+        self.assertIs(cache.get("a", build), first)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованной записи"""
+        cache = SurfaceCache(max_entries=2)
+        cache.get("a", object)
+        cache.get("b", object)
+        cache.get("a", object)  # "a" использована последней
+        cache.get("c", object)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_invalid_size(self):
+        """Тест неверного размера кэша"""
+        with self.assertRaises(ValueError):
+            SurfaceCache(max_entries=0)
+
+
+class TestBoardBackground(unittest.TestCase):
+    """Тесты кэшированного фона доски"""
+
+    def setUp(self):
+        self.gui = CheckersGUI()
+
+    def test_background_built_once(self):
+        """Тест: фон доски рисуется один раз на несколько кадров"""
+        for _ in range(3):
+            self.gui.draw_board()
+        self.assertEqual(self.gui.surfaces.misses, 1)
+        self.assertEqual(self.gui.surfaces.hits, 2)
+
+    def test_background_matches_direct_drawing(self):
+        """Тест: кэшированный фон совпадает с рисованием клеток на экране"""
+        self.gui.draw_board()
+        cached = self.gui.screen.copy()
+
+        for rect, color1, color2 in (
+                (pygame.Rect(0, 0, SQUARE_SIZE, SQUARE_SIZE),
+                 tuple(c + 10 for c in LIGHT_WOOD), LIGHT_WOOD),
+                (pygame.Rect(SQUARE_SIZE, 0, SQUARE_SIZE, SQUARE_SIZE),
+                 DARK_WOOD, tuple(c - 10 for c in DARK_WOOD))):
+            self.gui.draw_gradient_rect(rect, color1, color2)
+            for y in (rect.top, rect.centery, rect.bottom - 1):
+                point = (rect.centerx, y)
+                self.assertEqual(cached.get_at(point), self.gui.screen.get_at(point))
+
+    def test_theme_change_rebuilds(self):
+        """Тест: смена цветов доски строит новый фон"""
+        self.gui.draw_board()
+        self.gui.set_board_theme((200, 200, 200), (20, 60, 20))
+        self.gui.draw_board()
+
+        self.assertEqual(self.gui.surfaces.misses, 2)
+        self.assertEqual(self.gui.screen.get_at((SQUARE_SIZE + 50, 0))[:3], (20, 60, 20))
+
+
+@patch("pygame.display.flip")
+class TestPanelLayers(unittest.TestCase):
+    """Тесты заранее отрисованных слоев панели и экрана окончания игры"""
+
+    def setUp(self):
+        self.gui = CheckersGUI(dirty_rendering=False)
+
+    def test_no_gradients_after_first_frame(self, flip):
+        """Тест: после первого кадра градиенты не рисуются"""
+        self.gui.draw()
+        with patch.object(self.gui, "draw_gradient_rect") as gradient:
+            self.gui.draw()
+        gradient.assert_not_called()
+
+    def test_layers_swapped_by_state(self, flip):
+        """Тест: состояние таймера и кнопки выбирает готовый слой"""
+        active = self.gui.get_timer_layer(self.gui.game.current_player, True)
+        self.assertIs(self.gui.get_timer_layer(self.gui.game.current_player, True), active)
+        self.assertIsNot(self.gui.get_timer_layer(self.gui.game.current_player, False), active)
+
+        normal = self.gui.get_button_layer("restart", False)
+        hover = self.gui.get_button_layer("restart", True)
+        center = normal.get_rect().center
+        self.assertNotEqual(normal.get_at((center[0], 5)), hover.get_at((center[0], 5)))
+
+    def test_game_over_layers_cached(self, flip):
+        """Тест: затемнение и окно окончания игры создаются один раз"""
+        self.gui.game.game_over = True
+        self.gui.game.winner = self.gui.game.current_player
+        self.gui.game_saved = True
+        self.gui.draw()
+        misses = self.gui.surfaces.misses
+
+        with patch("pygame.Surface") as surface:
+            self.gui.draw()
+        surface.assert_not_called()
+        self.assertEqual(self.gui.surfaces.misses, misses)
+        self.assertIn(("game_over_dim",), self.gui.surfaces)
+
+    def test_button_rects_published(self, flip):
+        """Тест: кнопки панели доступны для обработки нажатий"""
+        self.gui.draw()
+        layout = self.gui.get_panel_layout()
+        self.assertEqual(self.gui.check_button_click(layout["restart"].center), "RESTART")
+        self.assertEqual(self.gui.check_button_click(layout["exit"].center), "EXIT")
+
+
+class TestDirtyRectTracker(unittest.TestCase):
+    """Тесты трекера изменившихся областей"""
+
+    bounds = pygame.Rect(0, 0, 100, 100)
+
+    def test_first_frame_is_full(self):
+        """Тест: первый кадр и кадр после invalidate() перерисовываются целиком"""
+        tracker = DirtyRectTracker()
+        regions = {"a": (pygame.Rect(0, 0, 10, 10), 1)}
+        self.assertEqual(tracker.update(regions, self.bounds), [self.bounds])
+        self.assertEqual(tracker.update(regions, self.bounds), [])
+
+        tracker.invalidate()
+        self.assertEqual(tracker.update(regions, self.bounds), [self.bounds])
+
+    def test_changed_region_and_old_rect(self):
+        """Тест: перерисовываются старый и новый прямоугольники изменившейся области"""
+        tracker = DirtyRectTracker()
+        tracker.update({"a": (pygame.Rect(10, 10, 10, 10), 1),
+                        "b": (pygame.Rect(50, 50, 10, 10), 1)}, self.bounds)
+        rects = tracker.update({"a": (pygame.Rect(0, 0, 30, 30), 2),
+                                "b": (pygame.Rect(50, 50, 10, 10), 1)}, self.bounds)
+        self.assertEqual(rects, [pygame.Rect(0, 0, 30, 30)])
+
+    def test_removed_region_is_erased(self):
+        """Тест: исчезнувшая область перерисовывается"""
+        tracker = DirtyRectTracker()
+        tracker.update({"a": (pygame.Rect(10, 10, 10, 10), 1)}, self.bounds)
+        self.assertEqual(tracker.update({}, self.bounds), [pygame.Rect(10, 10, 10, 10)])
+
+    def test_rects_clipped_to_screen(self):
+        """Тест обрезки прямоугольников по экрану"""
+        tracker = DirtyRectTracker()
+        tracker.update({}, self.bounds)
+        rects = tracker.update({"a": (pygame.Rect(-10, -10, 20, 20), 1)}, self.bounds)
+        self.assertEqual(rects, [pygame.Rect(0, 0, 10, 10)])
+
+    def test_merge_rects(self):
+        """Тест объединения пересекающихся прямоугольников"""
+        merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(50, 50, 5, 5),
+                              pygame.Rect(5, 5, 10, 10)])
+        self.assertEqual(sorted(map(tuple, merged)), [(0, 0, 15, 15), (50, 50, 5, 5)])
+
+
+@patch("pygame.display.flip")
+@patch("pygame.display.update")
+class TestDirtyRendering(unittest.TestCase):
+    """Тесты перерисовки только изменившихся областей"""
+
+    def setUp(self):
+        self.gui = CheckersGUI()
+
+    def test_idle_frame_draws_nothing(self, update, flip):
+        """Тест: без изменений кадр не рисуется"""
+        self.gui.draw()
+        self.assertEqual(flip.call_count, 1)
+
+        with patch.object(self.gui, "draw_frame") as draw_frame:
+            self.gui.draw()
+        draw_frame.assert_not_called()
+        update.assert_not_called()
+
+    def test_move_updates_only_changed_squares(self, update, flip):
+        """Тест: после хода обновляются только клетки хода и статус"""
+        self.gui.draw()
+        self.gui.game.play_move(5, 2, 4, 3)  # c3-d4, меняется сторона хода
+        self.gui.draw()
+
+        rects = update.call_args[0][0]
+        area = sum(rect.width * rect.height for rect in rects)
+        self.assertLess(area, WIDTH * HEIGHT // 4)
+        self.assertTrue(any(rect.collidepoint(2 * SQUARE_SIZE + 1, 5 * SQUARE_SIZE + 1) for rect in rects))
+        self.assertTrue(any(rect.collidepoint(3 * SQUARE_SIZE + 1, 4 * SQUARE_SIZE + 1) for rect in rects))
+
+    def test_timer_tick_updates_timer_only(self, update, flip):
+        """Тест: смена секунды таймера обновляет только таймер"""
+        self.gui.draw()
+        self.gui.game.white_time -= 1
+        self.gui.draw()
+
+        self.assertEqual(update.call_args[0][0], [self.gui.get_panel_layout()["white_timer"]])
+
+    def test_dirty_frame_matches_full_frame(self, update, flip):
+        """Тест: частичная перерисовка дает ту же картинку, что и полная"""
+        self.gui.draw()
+        self.gui.game.play_move(5, 2, 4, 3)
+        self.gui.game.white_time -= 1
+        self.gui.draw()
+        partial = self.gui.screen.copy()
+
+        self.gui.draw_frame()
+        for x in range(0, WIDTH, 25):
+            for y in range(0, HEIGHT, 25):
+                self.assertEqual(partial.get_at((x, y)), self.gui.screen.get_at((x, y)), (x, y))
+
+    def test_game_over_redraws_everything(self, update, flip):
+        """Тест: окончание игры перерисовывает весь экран"""
+        self.gui.draw()
+        self.gui.game.game_over = True
+        self.gui.game.winner = self.gui.game.current_player
+        self.gui.game_saved = True
+        self.gui.draw()
+        self.assertEqual(flip.call_count, 2)
+
+    def test_full_redraw_mode(self, update, flip):
+        """Тест: без dirty_rendering каждый кадр выводится целиком"""
+        gui = CheckersGUI(dirty_rendering=False)
+        gui.draw()
+        gui.draw()
+        self.assertEqual(flip.call_count, 2)
+        update.assert_not_called()
+
+
+class TestTextCache(unittest.TestCase):
+    """Тесты кэша шрифтов и надписей"""
+
+    def test_font_created_once(self):
+        """Тест: шрифт каждого размера создается один раз"""
+        cache = TextCache()
+        self.assertIs(cache.font(24), cache.font(24))
+        self.assertIsNot(cache.font(24), cache.font(32))
+
+    def test_render_cached(self):
+        """Тест: одинаковая надпись отрисовывается один раз"""
+        cache = TextCache()
+        font = cache.font(24)
+        first = cache.render("ШАШКИ", font, (255, 215, 0))
+
+        self.assertIs(cache.render("ШАШКИ", font, (255, 215, 0)), first)
+        self.assertIsNot(cache.render("ШАШКИ", font, (0, 0, 0)), first)
+        self.assertEqual(first.get_size(), font.size("ШАШКИ"))
+
+    def test_dynamic_text_evicted(self):
+        """Тест: старые значения таймера вытесняются из кэша"""
+        cache = TextCache(max_entries=3)
+        font = cache.font(48)
+        for seconds in range(10):
+            cache.render(f"00:{seconds:02d}", font, (240, 240, 250))
+        self.assertEqual(len(cache.surfaces), 3)
+
+    @patch("pygame.display.flip")
+    def test_game_over_screen_creates_no_fonts(self, flip):
+        """Тест: экран окончания игры не создает шрифты и надписи каждый кадр"""
+        gui = CheckersGUI(dirty_rendering=False)
+        gui.game.game_over = True
+        gui.game.winner = gui.game.current_player
+        gui.game_saved = True
+        gui.draw()
+
+        misses = gui.text.surfaces.misses
+        with patch("pygame.font.Font") as font:
+            gui.draw()
+        font.assert_not_called()
+        self.assertEqual(gui.text.surfaces.misses, misses)
+
+
+@patch("pygame.display.flip")
+@patch("pygame.display.update")
+class TestProfilerOverlay(unittest.TestCase):
+    """Тесты замера этапов кадра и оверлея профилировщика"""
+
+    def setUp(self):
+        self.gui = CheckersGUI(profiler=FrameProfiler())
+
+    def test_stages_timed(self, update, flip):
+        """Тест: этапы отрисовки замеряются профилировщиком"""
+        self.gui.profiler.begin_frame()
+        self.gui.draw()
+        self.gui.profiler.end_frame()
+
+        summary = self.gui.profiler.summary()
+        for name in ("frame", "draw_board", "draw_pieces", "draw_status_bar", "draw_panel", "present"):
+            self.assertIn(name, summary)
+
+    def test_toggle_overlay(self, update, flip):
+        """Тест: F3 скрывает оверлей, и область под ним перерисовывается"""
+        self.gui.draw()
+        overlay = self.gui.get_profiler_overlay_rect()
+        self.assertIn("profiler", self.gui.collect_regions())
+
+        self.gui.toggle_profiler()
+        self.assertNotIn("profiler", self.gui.collect_regions())
+        self.gui.draw()
+        rects = update.call_args[0][0]
+        self.assertTrue(any(rect.contains(overlay) for rect in rects))
+
+    def test_without_profiler(self, update, flip):
+        """Тест: без профилировщика F3 ничего не делает"""
+        gui = CheckersGUI()
+        gui.toggle_profiler()
+        self.assertFalse(gui.show_profiler)
+        self.assertNotIn("profiler", gui.collect_regions())
+
+
+class TestAdaptivePacing(unittest.TestCase):
+    """Тесты адаптивного темпа кадров"""
+
+    def setUp(self):
+        self.gui = CheckersGUI()
+        self.gui.dirty_tracker.full_redraw = False
+
+    def test_static_board_sleeps_until_timer_tick(self):
+        """Тест: без анимаций цикл ждет смены секунды таймера"""
+        self.gui.game.white_time = 300.25
+        timeout = self.gui.get_idle_timeout()
+        self.assertGreaterEqual(timeout, 250)
+        self.assertLess(timeout, 300)
+
+    def test_highlight_needs_full_rate(self):
+        """Тест: пульсирующая подсветка выбранной шашки рисуется без ожидания"""
+        self.gui.game.handle_click(5, 2)
+        self.assertTrue(self.gui.is_animating())
+        self.assertEqual(self.gui.get_idle_timeout(), 0)
+
+    def test_game_over_waits_for_events(self):
+        """Тест: после окончания игры таймер не будит цикл"""
+        self.gui.game.game_over = True
+        self.gui.game.white_time = 10.5
+        self.assertEqual(self.gui.get_idle_timeout(), IDLE_MAX_WAIT)
+
+    def test_event_wakes_loop(self):
+        """Тест: событие прерывает ожидание"""
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+        events = self.gui.wait_for_events(IDLE_MAX_WAIT)
+        self.assertEqual([event.type for event in events], [pygame.KEYDOWN])
+
+    def test_wait_times_out(self):
+        """Тест: без событий ожидание заканчивается пустым списком"""
+        pygame.event.clear()
+        self.assertEqual(self.gui.wait_for_events(1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
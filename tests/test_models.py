@@ -0,0 +1,80 @@
+import unittest
+import subprocess
+import sys
+import os
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame
+from src.enums import PieceType, Player
+from src.models import Piece
+from src.renderer import PieceRenderer
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+class TestHeadlessImport(unittest.TestCase):
+    """Тесты импорта логики игры без PyGame"""
+
+    def test_rules_do_not_import_pygame(self):
+        """Тест: логика игры и классы данных не загружают PyGame"""
+        code = ("import sys\n"
+                "import src.models, src.game_logic, src.bitboard, src.ai, src.perft\n"
+                "game = src.game_logic.CheckersGame()\n"
+                "assert 'pygame' not in sys.modules, 'pygame imported'\n")
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_piece_has_no_drawing(self):
+        """Тест: класс данных шашки не содержит отрисовки"""
+        self.assertFalse(hasattr(Piece, "draw"))
+
+
+class TestPieceRenderer(unittest.TestCase):
+    """Тесты отрисовки шашек"""
+
+    def test_draws_pieces(self):
+        """Тест отрисовки простой шашки и дамки на поверхности"""
+        renderer = PieceRenderer()
+        for piece in (Piece(Player.WHITE), Piece(Player.BLACK, PieceType.KING)):
+            surface = pygame.Surface((100, 100))
+            renderer.draw(surface, piece, 50, 50, 100, selected=True)
+            self.assertNotEqual(surface.get_at((50, 50))[:3], (0, 0, 0))
+
+    def test_sprite_matches_direct_drawing(self):
+        """Тест: спрайт дает ту же картинку, что и рисование прямо на экране"""
+        renderer = PieceRenderer()
+        for player in Player:
+            for piece_type in PieceType:
+                for glow_size in (0, 5):
+                    direct = pygame.Surface((120, 120))
+                    direct.fill((89, 47, 27))
+                    PieceRenderer.render(direct, player, piece_type, 60, 60, 100, glow_size)
+
+                    blitted = pygame.Surface((120, 120))
+                    blitted.fill((89, 47, 27))
+                    sprite = renderer.get_sprite(player, piece_type, 100, glow_size)
+                    blitted.blit(sprite, (60 - sprite.get_width() // 2, 60 - sprite.get_height() // 2))
+
+                    for x in range(0, 120, 3):
+                        for y in range(0, 120, 3):
+                            expected, actual = direct.get_at((x, y)), blitted.get_at((x, y))
+                            self.assertTrue(all(abs(a - b) <= 2 for a, b in zip(expected, actual)),
+                                            (player, piece_type, glow_size, x, y, expected, actual))
+
+    def test_sprites_are_cached(self):
+        """Тест: спрайт каждого вида шашки строится один раз"""
+        renderer = PieceRenderer()
+        surface = pygame.Surface((800, 800))
+        for _ in range(3):
+            for col in range(8):
+                renderer.draw(surface, Piece(Player.WHITE), col * 100 + 50, 50, 100)
+                renderer.draw(surface, Piece(Player.BLACK, PieceType.KING), col * 100 + 50, 150, 100)
+        self.assertEqual(renderer.sprites.misses, 2)
+        self.assertEqual(renderer.sprites.hits, 46)
+
+
+if __name__ == '__main__':
+    unittest.main()
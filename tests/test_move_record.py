@@ -0,0 +1,141 @@
+import unittest
+import json
+import random
+import sys
+import os
+from unittest.mock import Mock
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.move_record import encode_moves, decode_moves, replay, MoveRecordError, FORMAT_VERSION
+from src.enums import Player
+
+
+def random_game(seed, max_moves=300):
+    """Играет случайную партию до конца"""
+    rng = random.Random(seed)
+    game = CheckersGame()
+    for _ in range(max_moves):
+        moves = game.get_legal_moves()
+        if not moves:
+            break
+        from_row, from_col, to_row, to_col, captured = rng.choice(moves)
+        game.play_move(from_row, from_col, to_row, to_col, captured)
+    return game
+
+
+def board_state(game):
+    """Снимок доски для сравнения"""
+    return [[(piece.player, piece.type) if piece else None for piece in row] for row in game.board]
+
+
+class TestMoveRecord(unittest.TestCase):
+    """Тесты двоичной записи партии"""
+
+    def test_round_trip(self):
+        """Тест упаковки и распаковки всех ходов"""
+        for seed in range(20):
+            game = random_game(seed)
+            decoded = decode_moves(encode_moves(game.move_history))
+            expected = [(move['from'], move['to'], [tuple(c) for c in move['captured']])
+                        for move in game.move_history]
+            self.assertEqual(decoded, expected)
+
+    def test_replay_restores_game(self):
+        """Тест восстановления партии по записи"""
+        for seed in range(20):
+            game = random_game(seed)
+            restored = replay(encode_moves(game.move_history))
+
+            self.assertEqual(board_state(restored), board_state(game))
+            self.assertEqual(restored.current_player, game.current_player)
+            self.assertEqual(restored.game_over, game.game_over)
+            self.assertEqual(restored.winner, game.winner)
+            self.assertEqual(restored.zobrist_key, game.zobrist_key)
+
+    def test_record_is_compact(self):
+        """Тест: запись в несколько раз меньше JSON с ходами"""
+        game = random_game(7)
+        record = encode_moves(game.move_history)
+        as_json = json.dumps([{"from": m['from'], "to": m['to'], "captured": m['captured']}
+                              for m in game.move_history])
+
+        self.assertLess(len(record) * 5, len(as_json))
+        self.assertLessEqual(len(record), 3 + (14 * len(game.move_history) + 5 * 24 + 7) // 8)
+
+    def test_empty_game(self):
+        """Тест записи партии без ходов"""
+        record = encode_moves([])
+        self.assertEqual(record, bytes([FORMAT_VERSION, 0, 0]))
+        self.assertEqual(board_state(replay(record)), board_state(CheckersGame()))
+
+    def test_corrupted_record(self):
+        """Тест отказа на поврежденных записях"""
+        record = encode_moves(random_game(3).move_history)
+
+        with self.assertRaises(MoveRecordError):
+            decode_moves(b"\x09" + record[1:])
+        with self.assertRaises(MoveRecordError):
+            decode_moves(record[:len(record) // 2])
+        with self.assertRaises(MoveRecordError):
+            decode_moves(record + b"\x00")
+
+    def test_illegal_move_rejected(self):
+        """Тест отказа воспроизводить недопустимый ход"""
+        record = encode_moves([((5, 0), (3, 2), [])])
+        with self.assertRaises(MoveRecordError):
+            replay(record)
+
+    def test_replay_from_position(self):
+        """Тест восстановления партии, начатой из позиции"""
+        game = CheckersGame.from_position("B:W21,22:BK5,10")
+        game.play_move(*game.get_legal_moves()[0])
+        record = encode_moves(game.move_history)
+
+        restored = replay(record, position=game.start_position)
+        self.assertEqual(board_state(restored), board_state(game))
+        with self.assertRaises(MoveRecordError):
+            replay(record)
+        with self.assertRaises(MoveRecordError):
+            replay(record, position="B:W21:B33")
+
+    def test_game_saves_full_record(self):
+        """Тест передачи всей партии приемнику результатов"""
+        sink = Mock()
+        sink.save_game_result.return_value = True
+        game = random_game(11)
+        game.result_sink = sink
+        game.game_saved = False
+        game.game_over, game.winner = True, Player.WHITE
+
+        game.save_game_result()
+
+        kwargs = sink.save_game_result.call_args.kwargs
+        self.assertNotIn("move_history_summary", kwargs["additional_info"])
+        self.assertEqual(len(decode_moves(kwargs["move_record"])), len(game.move_history))
+        self.assertNotIn("start_position", kwargs["additional_info"])
+        info = kwargs["additional_info"]
+        self.assertEqual(info["white_captures"] + info["black_captures"], info["total_captures"])
+
+    def test_game_from_position_saves_start_position(self):
+        """Тест: исходная позиция сохраняется вместе с записью ходов"""
+        sink = Mock()
+        sink.save_game_result.return_value = True
+        game = CheckersGame.from_position("B:W21,22:BK5,10", result_sink=sink)
+        game.play_move(*game.get_legal_moves()[0])
+        game.game_over, game.winner = True, Player.BLACK
+
+        game.save_game_result()
+
+        kwargs = sink.save_game_result.call_args.kwargs
+        position = kwargs["additional_info"]["start_position"]
+        self.assertEqual(position, "B:W21,22:BK5,10")
+        self.assertEqual(kwargs["additional_info"]["black_captures"], 0)
+        restored = replay(kwargs["move_record"], position=position)
+        self.assertEqual(board_state(restored), board_state(game))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+import unittest
+import io
+import random
+import sys
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.pdn import (PdnError, PdnGame, export_game, read_games, replay, validate_games,
+                     parse_square, square_name, main)
+from src.enums import Player
+
+
+def random_game(seed, max_moves=300):
+    """Играет случайную партию до конца"""
+    rng = random.Random(seed)
+    game = CheckersGame()
+    for _ in range(max_moves):
+        moves = game.get_legal_moves()
+        if not moves:
+            break
+        from_row, from_col, to_row, to_col, captured = rng.choice(moves)
+        game.play_move(from_row, from_col, to_row, to_col, captured)
+    return game
+
+
+def board_state(game):
+    """Снимок доски для сравнения"""
+    return [[(piece.player, piece.type) if piece else None for piece in row] for row in game.board]
+
+
+SAMPLE = """[Event "Тест"]
+[White "Иванов"]
+[Black "Петров"]
+[Result "*"]
+
+1. c3-d4 {белые занимают центр
+многострочный комментарий} f6-e5 2. d4xf6 (2. b2-c3? e5xc3) g7xe5! ; комментарий
+*
+
+[Event "Вторая"]
+
+1. c3-b4 *
+"""
+
+
+class TestPdn(unittest.TestCase):
+    """Тесты импорта и экспорта PDN"""
+
+    def test_square_names(self):
+        """Тест перевода клеток в алгебраическую запись и обратно"""
+        self.assertEqual(square_name(7, 0), "a1")
+        self.assertEqual(parse_square("c3"), (5, 2))
+        for row in range(8):
+            for col in range(8):
+                if (row + col) % 2 == 1:
+                    self.assertEqual(parse_square(square_name(row, col)), (row, col))
+        with self.assertRaises(PdnError):
+            parse_square("a2")  # светлая клетка
+        with self.assertRaises(PdnError):
+            parse_square("i1")
+
+    def test_export_header_and_moves(self):
+        """Тест тегов и нумерации ходов при экспорте"""
+        game = CheckersGame()
+        game.play_move(5, 2, 4, 3)
+        game.play_move(2, 5, 3, 4)
+        text = export_game(game, {"White": "Иванов"})
+
+        self.assertIn('[White "Иванов"]', text)
+        self.assertIn('[GameType "25"]', text)
+        self.assertIn('[Result "*"]', text)
+        self.assertIn("1. c3-d4 f6-e5 *", text)
+
+    def test_round_trip_random_games(self):
+        """Тест: экспортированная партия читается и воспроизводится без изменений"""
+        # с 143-й партии встречается превращение посреди взятия с продолжением дамкой
+        for seed in range(200):
+            game = random_game(seed)
+            games = list(read_games(io.StringIO(export_game(game))))
+            self.assertEqual(len(games), 1)
+
+            restored = replay(games[0])
+            self.assertEqual(board_state(restored), board_state(game))
+            self.assertEqual(restored.current_player, game.current_player)
+            self.assertEqual(restored.winner, game.winner)
+            self.assertEqual(games[0].result, "2-0" if game.winner == Player.WHITE else
+                             "0-2" if game.winner == Player.BLACK else "*")
+
+    def test_promotion_inside_capture(self):
+        """Тест: взятие через клетку превращения воспроизводится по записанному пути"""
+        game = random_game(143)
+        text = export_game(game)
+        self.assertIn("e5:e1:a5", text)
+        restored = replay(next(read_games(io.StringIO(text))))
+        self.assertEqual(board_state(restored), board_state(game))
+
+    def test_same_endpoints_different_captures(self):
+        """Тест: взятия с общими началом и концом различаются промежуточными клетками"""
+        position = "B:W13,23,24,25,26,28,32:B1,5,6,8,9,10,21,K29"
+        chains = [move for move in CheckersGame(position=position).get_legal_moves()
+                  if move[:4] == (7, 0, 4, 7)]
+        self.assertEqual(len(chains), 2)
+
+        for chain in chains:
+            game = CheckersGame(position=position)
+            self.assertTrue(game.play_move(*chain))
+            text = export_game(game)
+            restored = replay(next(read_games(io.StringIO(text))))
+            self.assertEqual(board_state(restored), board_state(game))
+            self.assertEqual(restored.move_history[0]['captured'], chain[4])
+
+    def test_lines_are_wrapped(self):
+        """Тест переноса длинного текста ходов"""
+        text = export_game(random_game(3))
+        self.assertTrue(all(len(line) <= 79 for line in text.splitlines()))
+
+    def test_comments_and_variations_skipped(self):
+        """Тест пропуска комментариев, вариантов и оценок"""
+        games = list(read_games(io.StringIO(SAMPLE)))
+
+        self.assertEqual(len(games), 2)
+        self.assertEqual(games[0].tags["White"], "Иванов")
+        self.assertEqual(games[0].moves, ["c3-d4", "f6-e5", "d4xf6", "g7xe5"])
+        self.assertEqual(games[1].tags, {"Event": "Вторая"})
+        self.assertEqual(games[1].moves, ["c3-b4"])
+
+        game = replay(games[0])
+        self.assertEqual(len(game.move_history), 4)
+
+    def test_streaming(self):
+        """Тест: партии выдаются по мере чтения строк"""
+        consumed = []
+
+        def lines():
+            for line in SAMPLE.splitlines():
+                consumed.append(line)
+                yield line
+
+        first = next(read_games(lines()))
+        self.assertEqual(first.tags["Event"], "Тест")
+        self.assertLess(len(consumed), len(SAMPLE.splitlines()))
+
+    def test_game_without_result(self):
+        """Тест партии без результата перед следующими тегами и в конце файла"""
+        text = '[Event "A"]\n1. c3-d4\n[Event "B"]\n1. c3-b4\n'
+        games = list(read_games(io.StringIO(text)))
+        self.assertEqual([g.moves for g in games], [["c3-d4"], ["c3-b4"]])
+
+    def test_invalid_move(self):
+        """Тест сообщения о недопустимом ходе"""
+        pdn_game = PdnGame(moves=["c3-d4", "f6-g5", "d4-f6"], line=5)
+        with self.assertRaises(PdnError) as context:
+            replay(pdn_game)
+        self.assertIn("полуход 3", str(context.exception))
+
+    def test_unfinished_capture_rejected(self):
+        """Тест: тихий ход вместо обязательного взятия недопустим"""
+        with self.assertRaises(PdnError):
+            replay(PdnGame(moves=["c3-d4", "f6-e5", "a3-b4"]))
+
+    def test_unknown_token(self):
+        """Тест ошибки разбора неизвестного токена"""
+        with self.assertRaises(PdnError):
+            list(read_games(io.StringIO("1. c3-d4 hello *")))
+
+    def test_validate_games(self):
+        """Тест проверки архива с допустимыми и недопустимыми партиями"""
+        text = export_game(random_game(1)) + '[Event "bad"]\n1. c3-c4 *\n'
+        results = list(validate_games(io.StringIO(text)))
+
+        self.assertEqual(len(results), 2)
+        self.assertIsNotNone(results[0][1])
+        self.assertIsNone(results[0][2])
+        self.assertIsNone(results[1][1])
+        self.assertIsInstance(results[1][2], PdnError)
+
+    def test_command_line(self):
+        """Тест проверки файла из командной строки"""
+        with tempfile.NamedTemporaryFile("w", suffix=".pdn", delete=False, encoding="utf-8") as f:
+            f.write(export_game(random_game(2)) + export_game(random_game(4)))
+            path = f.name
+        try:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                main([path])
+            self.assertIn("допустимых: 2", output.getvalue())
+        finally:
+            os.unlink(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.perft import (perft, divide, run_perft, reference_game, reference_position,
+                       move_name, REFERENCE_POSITIONS)
+
+
+class TestPerftReference(unittest.TestCase):
+    """Тесты генераторов ходов по эталонным числам perft"""
+
+    def check(self, target, name, max_depth):
+        """Сверяет perft с эталоном до указанной глубины"""
+        expected = REFERENCE_POSITIONS[name][1]
+        for depth in range(1, max_depth + 1):
+            with self.subTest(position=name, depth=depth):
+                self.assertEqual(perft(target, depth), expected[depth])
+
+    def test_bitboard_reference_counts(self):
+        """Тест битбордового генератора на всех эталонных позициях"""
+        for name in REFERENCE_POSITIONS:
+            self.check(reference_position(name), name, 5)
+        self.check(reference_position("initial"), "initial", 6)
+
+    def test_game_reference_counts(self):
+        """Тест генератора CheckersGame на всех эталонных позициях"""
+        for name in REFERENCE_POSITIONS:
+            self.check(reference_game(name), name, 4)
+
+    def test_divide_matches_between_backends(self):
+        """Тест совпадения разбивки по ходам у обоих генераторов"""
+        for name in REFERENCE_POSITIONS:
+            with self.subTest(position=name):
+                game_divide = divide(reference_game(name), 3)
+                self.assertEqual(game_divide, divide(reference_position(name), 3))
+                self.assertEqual(sum(game_divide.values()), REFERENCE_POSITIONS[name][1][3])
+
+
+class TestPerftGame(unittest.TestCase):
+    """Тесты perft по CheckersGame"""
+
+    def test_game_state_restored(self):
+        """Тест восстановления игры после перебора"""
+        game = reference_game("crowning_capture")
+        board = [[(piece.player, piece.type) if piece else None for piece in row] for row in game.board]
+        key = game.zobrist_key
+
+        perft(game, 4)
+
+        self.assertEqual([[(piece.player, piece.type) if piece else None for piece in row]
+                          for row in game.board], board)
+        self.assertEqual(game.zobrist_key, key)
+        self.assertEqual(game.move_history, [])
+        self.assertFalse(game.game_over)
+        self.assertFalse(game.game_saved)
+
+    def test_depth_zero(self):
+        """Тест нулевой глубины"""
+        self.assertEqual(perft(CheckersGame(), 0), 1)
+
+    def test_run_perft_reports_speed(self):
+        """Тест замера скорости"""
+        result = run_perft(reference_position("initial"), 4)
+
+        self.assertEqual(result.nodes, 1469)
+        self.assertGreater(result.nodes_per_second, 0)
+
+    def test_move_name(self):
+        """Тест записи ходов"""
+        self.assertEqual(move_name((5, 2, 4, 3, [])), "c3-d4")
+        self.assertEqual(move_name((7, 0, 0, 7, [(5, 2), (3, 4)])), "a1:h8")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+import io
+import pickle
+import sys
+import os
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.position import (Position, PositionError, INITIAL_POSITION, parse_position,
+                          format_position)
+from src.pdn import PdnError, PdnGame, export_game, read_games, replay
+from src.enums import PieceType, Player
+
+
+def board_state(game):
+    """Снимок доски для сравнения"""
+    return [[(piece.player, piece.type) if piece else None for piece in row] for row in game.board]
+
+
+class TestPosition(unittest.TestCase):
+    """Тесты строковой записи позиции"""
+
+    def test_initial_position(self):
+        """Тест записи начальной расстановки"""
+        game = CheckersGame()
+        self.assertEqual(game.get_position(), INITIAL_POSITION)
+        self.assertIsNone(game.start_position)
+
+        loaded = CheckersGame.from_position(INITIAL_POSITION)
+        self.assertEqual(board_state(loaded), board_state(game))
+        self.assertEqual(loaded.zobrist_key, game.zobrist_key)
+
+    def test_parse_kings_and_side(self):
+        """Тест разбора дамок и стороны хода"""
+        game = CheckersGame.from_position("B:WK1,30:B5,K32")
+
+        self.assertEqual(game.current_player, Player.BLACK)
+        self.assertEqual(game.board[0][1].type, PieceType.KING)  # клетка 1 - b8
+        self.assertEqual(game.board[0][1].player, Player.WHITE)
+        self.assertEqual(game.board[7][6].type, PieceType.KING)  # клетка 32 - g1
+        self.assertEqual(game.board[7][2].type, PieceType.MAN)  # клетка 30 - c1
+        self.assertEqual(sum(piece is not None for row in game.board for piece in row), 4)
+        self.assertEqual(game.get_position(), "B:WK1,30:B5,K32")
+
+    def test_ranges_and_spaces(self):
+        """Тест диапазонов клеток и пробелов"""
+        position = parse_position(" w: W21-32 : B1-12 ")
+        self.assertEqual(str(position), INITIAL_POSITION)
+
+    def test_algebraic_squares(self):
+        """Тест алгебраических названий клеток"""
+        position = parse_position("W:Wa1,c1,Ke1:Bb8,d8")
+        self.assertEqual(str(position), "W:W29,30,K31:B1,2")
+        for text in ("W:Wa2:B1", "W:Wi1:B1", "W:Wa1,29:B1"):
+            with self.subTest(text=text):
+                with self.assertRaises(PositionError):
+                    parse_position(text)
+
+    def test_empty_side(self):
+        """Тест позиции без шашек одного игрока"""
+        position = parse_position("W:W21:B")
+        self.assertEqual(position.black_men, [])
+        self.assertEqual(str(position), "W:W21:B")
+
+    def test_invalid_positions(self):
+        """Тест ошибок разбора"""
+        for text in ("", "X:W1:B2", "W:W1", "W:W33:B1", "W:W0:B1", "W:Wa:B1",
+                     "W:W21,21:B1", "W:W21:B21", "W:W1:B2", "W:W21:B29", "W:W21:W22"):
+            with self.subTest(text=text):
+                with self.assertRaises(PositionError):
+                    parse_position(text)
+
+    def test_round_trip_after_moves(self):
+        """Тест: позиция после ходов восстанавливается из строки"""
+        game = CheckersGame()
+        for move in ((5, 2, 4, 3), (2, 5, 3, 4), (4, 3, 2, 5)):
+            game.play_move(*move)
+        loaded = CheckersGame.from_position(game.get_position())
+
+        self.assertEqual(board_state(loaded), board_state(game))
+        self.assertEqual(loaded.current_player, game.current_player)
+        self.assertEqual(loaded.zobrist_key, game.zobrist_key)
+        self.assertEqual(loaded.get_legal_moves(), game.get_legal_moves())
+
+    def test_format_matches_dataclass(self):
+        """Тест format_position и Position.from_board"""
+        game = CheckersGame()
+        self.assertEqual(format_position(game.board, Player.BLACK),
+                         str(Position.from_board(game.board, Player.BLACK)))
+
+    def test_string_is_picklable_and_small(self):
+        """Тест: строка позиции компактнее сериализованной игры"""
+        game = CheckersGame()
+        self.assertLess(len(pickle.dumps(game.get_position())), len(pickle.dumps(game.board)) // 4)
+
+    def test_set_position_resets_history(self):
+        """Тест загрузки позиции в уже начатую игру"""
+        game = CheckersGame()
+        game.play_move(5, 2, 4, 3)
+        game.set_position("W:W22:B1")
+
+        self.assertEqual(game.move_history, [])
+        self.assertEqual(game.start_position, "W:W22:B1")
+        self.assertEqual(len(game.get_legal_moves()), 2)
+
+    def test_pdn_fen_round_trip(self):
+        """Тест экспорта и воспроизведения партии с исходной позицией"""
+        game = CheckersGame.from_position("W:W22,K29:B6,11")
+        game.play_move(5, 2, 4, 3)
+        text = export_game(game)
+        self.assertIn('[FEN "W:W22,K29:B6,11"]', text)
+
+        restored = replay(next(read_games(io.StringIO(text))))
+        self.assertEqual(board_state(restored), board_state(game))
+
+    def test_pdn_algebraic_fen(self):
+        """Тест импорта партии GameType 25 с алгебраическим тегом FEN"""
+        text = ('[GameType "25"]\n[SetUp "1"]\n[FEN "W:Wa1,c1,e1:Bb8,d8"]\n\n'
+                '1. c1-d2 b8-a7 *\n')
+        game = replay(next(read_games(io.StringIO(text))))
+        self.assertEqual(game.start_position, "W:W29,30,31:B1,2")
+        self.assertEqual(game.get_position(), "W:W26,29,31:B2,5")
+
+    def test_pdn_invalid_fen(self):
+        """Тест ошибки неверного тега FEN"""
+        with self.assertRaises(PdnError):
+            replay(PdnGame(tags={"FEN": "W:W99:B1"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import sys
+import os
+import csv
+import json
+import tempfile
+from unittest.mock import patch
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.profiler import FrameProfiler, percentile
+
+
+def fake_clock(*moments):
+    """Подменяет time.perf_counter последовательностью отметок времени"""
+    return patch("src.profiler.time.perf_counter", side_effect=list(moments))
+
+
+class TestPercentile(unittest.TestCase):
+    """Тесты вычисления процентилей"""
+
+    def test_nearest_rank(self):
+        """Тест процентиля по ближайшему рангу"""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 1.0), 100)
+        self.assertEqual(percentile([7], 0.5), 7)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Тесты профилировщика кадров"""
+
+    def run_frame(self, profiler, board, panel):
+        """Кадр из двух этапов с заданной длительностью в секундах"""
+        with fake_clock(0.0, 0.0, board, board, board + panel, board + panel + 0.001):
+            profiler.begin_frame()
+            with profiler.stage("draw_board"):
+                pass
+            with profiler.stage("draw_panel"):
+                pass
+            profiler.end_frame()
+
+    def test_stage_durations(self):
+        """Тест: время этапов и кадра в миллисекундах"""
+        profiler = FrameProfiler()
+        self.run_frame(profiler, 0.004, 0.002)
+
+        summary = profiler.summary()
+        self.assertEqual(list(summary), ["frame", "draw_board", "draw_panel"])
+        self.assertAlmostEqual(summary["draw_board"]["p50"], 4.0)
+        self.assertAlmostEqual(summary["draw_panel"]["max"], 2.0)
+        self.assertAlmostEqual(summary["frame"]["mean"], 7.0)
+
+    def test_repeated_stage_accumulates(self):
+        """Тест: повторные замеры этапа за кадр складываются"""
+        profiler = FrameProfiler()
+        with fake_clock(0.0, 0.0, 0.001, 0.002, 0.004, 0.005):
+            profiler.begin_frame()
+            for _ in range(2):
+                with profiler.stage("draw_board"):
+                    pass
+            profiler.end_frame()
+        self.assertAlmostEqual(profiler.summary()["draw_board"]["p50"], 3.0)
+
+    def test_rolling_window(self):
+        """Тест: процентили считаются по последним window кадрам, трасса ограничена"""
+        profiler = FrameProfiler(window=3, max_frames=4)
+        for board in (0.050, 0.001, 0.002, 0.003, 0.004):
+            self.run_frame(profiler, board, 0.001)
+
+        self.assertAlmostEqual(profiler.summary()["draw_board"]["max"], 4.0)
+        frames = profiler.frames()
+        self.assertEqual([frame["frame_number"] for frame in frames], [2, 3, 4, 5])
+
+    def test_end_frame_without_begin(self):
+        """Тест: end_frame без begin_frame ничего не записывает"""
+        profiler = FrameProfiler()
+        profiler.end_frame()
+        self.assertEqual(profiler.summary(), {})
+        self.assertEqual(profiler.frames(), [])
+
+    def test_dump_csv(self):
+        """Тест сохранения трассы в CSV"""
+        profiler = FrameProfiler()
+        self.run_frame(profiler, 0.004, 0.002)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.csv")
+            profiler.dump(path)
+            with open(path, encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["frame_number"], "1")
+        self.assertAlmostEqual(float(rows[0]["draw_board"]), 4.0)
+
+    def test_dump_json(self):
+        """Тест сохранения трассы и статистики в JSON"""
+        profiler = FrameProfiler(trace_path=None)
+        self.run_frame(profiler, 0.004, 0.002)
+        with tempfile.TemporaryDirectory() as directory:
+            profiler.trace_path = os.path.join(directory, "trace.json")
+            self.assertTrue(profiler.save())
+            with open(profiler.trace_path, encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertAlmostEqual(data["summary"]["draw_panel"]["p99"], 2.0)
+        self.assertAlmostEqual(data["frames"][0]["frame"], 7.0)
+
+    def test_save_without_path(self):
+        """Тест: без trace_path трасса не сохраняется"""
+        self.assertFalse(FrameProfiler().save())
+
+
+if __name__ == '__main__':
+    unittest.main()
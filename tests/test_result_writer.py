@@ -0,0 +1,191 @@
+import unittest
+import time
+import sys
+import os
+from unittest.mock import Mock
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.enums import Player
+from src.result_writer import AsyncResultWriter, BatchResultWriter
+
+
+class SlowSink:
+    """Приемник, имитирующий медленную базу данных"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.results = []
+
+    def save_game_result(self, **result):
+        time.sleep(self.delay)
+        self.results.append(result)
+        return True
+
+
+class TestAsyncResultWriter(unittest.TestCase):
+    """Тесты фонового сохранения результатов"""
+
+    def test_saves_and_reports_completion(self):
+        """Тест сохранения результата и вызова обработчика завершения"""
+        sink = Mock()
+        sink.save_game_result.return_value = True
+        completed = []
+        writer = AsyncResultWriter(sink, on_complete=lambda ok, result: completed.append((ok, result)))
+
+        self.assertTrue(writer.save_game_result(winner="white", total_moves=12))
+        self.assertTrue(writer.close(timeout=2))
+
+        sink.save_game_result.assert_called_once_with(winner="white", total_moves=12)
+        self.assertEqual(completed, [(True, {"winner": "white", "total_moves": 12})])
+        self.assertEqual(writer.saved, 1)
+
+    def test_retries_with_backoff(self):
+        """Тест повторных попыток после ошибки и отказа приемника"""
+        sink = Mock()
+        sink.save_game_result.side_effect = [Exception("нет соединения"), False, True]
+        writer = AsyncResultWriter(sink, max_attempts=3, backoff=0.01)
+
+        writer.save_game_result(winner="black")
+        writer.close(timeout=2)
+
+        self.assertEqual(sink.save_game_result.call_count, 3)
+        self.assertEqual((writer.saved, writer.failed), (1, 0))
+
+    def test_gives_up_after_max_attempts(self):
+        """Тест отказа от сохранения после всех попыток"""
+        sink = Mock()
+        sink.save_game_result.return_value = False
+        completed = []
+        writer = AsyncResultWriter(sink, max_attempts=2, backoff=0.01,
+                                   on_complete=lambda ok, result: completed.append(ok))
+
+        writer.save_game_result(winner="white")
+        writer.close(timeout=2)
+
+        self.assertEqual(sink.save_game_result.call_count, 2)
+        self.assertEqual(writer.failed, 1)
+        self.assertEqual(completed, [False])
+
+    def test_does_not_block_caller(self):
+        """Тест: постановка в очередь не ждет медленную базу данных"""
+        sink = SlowSink(0.2)
+        writer = AsyncResultWriter(sink)
+
+        start = time.perf_counter()
+        writer.save_game_result(winner="white")
+        writer.save_game_result(winner="black")
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+        self.assertFalse(writer.flush(timeout=0.05))
+        self.assertTrue(writer.flush(timeout=2))
+        self.assertEqual([r["winner"] for r in sink.results], ["white", "black"])
+        writer.close()
+
+    def test_closed_writer_rejects_results(self):
+        """Тест: после закрытия результаты не принимаются"""
+        writer = AsyncResultWriter(Mock())
+        self.assertTrue(writer.close())
+        self.assertFalse(writer.save_game_result(winner="white"))
+
+    def test_game_hands_result_to_writer(self):
+        """Тест сохранения результата партии через фоновый писатель"""
+        sink = SlowSink(0.2)
+        writer = AsyncResultWriter(sink)
+        game = CheckersGame(result_sink=writer)
+        game.game_over = True
+        game.winner = Player.BLACK
+
+        start = time.perf_counter()
+        self.assertTrue(game.save_game_result())
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+        writer.close(timeout=2)
+        self.assertEqual(sink.results[0]["winner"], "black")
+
+
+class BulkSink:
+    """Приемник пачек, запоминающий размеры пачек"""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def save_game_results(self, results):
+        self.batches.append(list(results))
+        return 0 if self.fail else len(results)
+
+
+class TestBatchResultWriter(unittest.TestCase):
+    """Тесты пакетного сохранения результатов"""
+
+    def test_flushes_full_batches(self):
+        """Тест сохранения пачки при достижении ее размера"""
+        sink = BulkSink()
+        writer = BatchResultWriter(sink, batch_size=3, flush_interval=60)
+
+        for i in range(7):
+            self.assertTrue(writer.save_game_result(winner="white", total_moves=i))
+
+        self.assertEqual([len(batch) for batch in sink.batches], [3, 3])
+        self.assertEqual(writer.pending(), 1)
+        self.assertEqual(writer.close(), 1)
+        self.assertEqual(writer.saved, 7)
+        self.assertEqual([r["total_moves"] for batch in sink.batches for r in batch], list(range(7)))
+
+    def test_flush_interval(self):
+        """Тест сохранения неполной пачки по истечении интервала"""
+        sink = BulkSink()
+        writer = BatchResultWriter(sink, batch_size=100, flush_interval=0.05)
+
+        writer.save_game_result(winner="white")
+        self.assertEqual(sink.batches, [])
+        time.sleep(0.2)  # новых результатов нет - пачку сохраняет таймер
+
+        self.assertEqual(len(sink.batches), 1)
+        self.assertEqual(writer.pending(), 0)
+        self.assertEqual(writer.saved, 1)
+
+    def test_full_batch_cancels_timer(self):
+        """Тест: полная пачка и close() отменяют таймер неполной пачки"""
+        sink = BulkSink()
+        writer = BatchResultWriter(sink, batch_size=2, flush_interval=0.05)
+
+        writer.save_game_result(winner="white")
+        writer.save_game_result(winner="black")
+        writer.save_game_result(winner="white")
+        self.assertEqual(writer.close(), 1)
+        time.sleep(0.1)
+
+        self.assertEqual([len(batch) for batch in sink.batches], [2, 1])
+
+    def test_save_after_close(self):
+        """Тест: после close() результат сохраняется сразу, без таймера"""
+        sink = BulkSink()
+        writer = BatchResultWriter(sink, batch_size=100, flush_interval=0.05)
+        writer.close()
+
+        self.assertTrue(writer.save_game_result(winner="white"))
+        self.assertEqual([len(batch) for batch in sink.batches], [1])
+        self.assertEqual(writer.pending(), 0)
+        self.assertIsNone(writer._timer)
+        self.assertEqual(writer.saved, 1)
+
+    def test_failed_batch(self):
+        """Тест учета пачки, которую не удалось сохранить"""
+        writer = BatchResultWriter(BulkSink(fail=True), batch_size=2)
+
+        writer.save_game_result(winner="white")
+        self.assertFalse(writer.save_game_result(winner="black"))
+        self.assertEqual((writer.saved, writer.failed), (0, 2))
+
+    def test_invalid_batch_size(self):
+        """Тест проверки размера пачки"""
+        with self.assertRaises(ValueError):
+            BatchResultWriter(BulkSink(), batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import sys
+import os
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai import AIPlayer, MATE_SCORE, score_to_tt, score_from_tt
+from src.bitboard import BitboardPosition
+from src.enums import Player
+from src.transposition import (TranspositionTable, pack_move, ENTRY_BYTES, SLOTS_PER_BUCKET,
+                               NO_MOVE, EXACT, LOWER, UPPER)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Тесты таблицы транспозиций"""
+
+    def setUp(self):
+        """Подготовка маленькой таблицы"""
+        self.table = TranspositionTable(0.001)
+
+    def test_memory_bound(self):
+        """Тест соответствия числа записей заданному объему памяти"""
+        table = TranspositionTable(1)
+        self.assertEqual(table.buckets, 1024 * 1024 // (ENTRY_BYTES * SLOTS_PER_BUCKET))
+        self.assertEqual(len(table._keys), table.buckets * SLOTS_PER_BUCKET)
+
+    def test_invalid_size(self):
+        """Тест отказа при неположительном объеме"""
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+    def test_store_and_probe(self):
+        """Тест сохранения и поиска записи"""
+        self.assertIsNone(self.table.probe(12345))
+        self.table.store(12345, 4, EXACT, -70, 99)
+
+        self.assertEqual(self.table.probe(12345), (4, EXACT, -70, 99))
+        self.assertEqual(self.table.hits, 1)
+        self.assertEqual(self.table.probes, 2)
+
+    def test_replacement_keeps_deeper_entry(self):
+        """Тест замены: глубокая запись остается, мелкая уходит во вторую ячейку"""
+        buckets = self.table.buckets
+        deep, shallow, newer = 7, 7 + buckets, 7 + 2 * buckets  # одна корзина
+
+        self.table.store(deep, 8, LOWER, 10)
+        self.table.store(shallow, 2, UPPER, 20)
+        self.assertIsNotNone(self.table.probe(deep))
+        self.assertIsNotNone(self.table.probe(shallow))
+
+        self.table.store(newer, 1, EXACT, 30)
+        self.assertIsNotNone(self.table.probe(deep))
+        self.assertIsNone(self.table.probe(shallow))
+        self.assertEqual(self.table.probe(newer), (1, EXACT, 30, NO_MOVE))
+
+    def test_old_generation_is_replaced(self):
+        """Тест вытеснения записей прошлого поиска"""
+        buckets = self.table.buckets
+        self.table.store(3, 10, EXACT, 0)
+        self.table.new_search()
+        self.table.store(3 + buckets, 1, EXACT, 5)
+
+        self.assertEqual(self.table.probe(3 + buckets)[0], 1)
+        self.assertEqual(self.table._keys[3 * SLOTS_PER_BUCKET], 3 + buckets)
+
+    def test_same_key_keeps_move(self):
+        """Тест сохранения известного хода при обновлении записи без хода"""
+        self.table.store(42, 3, LOWER, 1, 77)
+        self.table.store(42, 5, UPPER, 2)
+
+        self.assertEqual(self.table.probe(42), (5, UPPER, 2, 77))
+
+    def test_clear(self):
+        """Тест очистки таблицы"""
+        self.table.store(42, 3, EXACT, 1)
+        self.table.clear()
+
+        self.assertIsNone(self.table.probe(42))
+        self.assertEqual(self.table.usage(), 0)
+
+    def test_pack_move_is_unique(self):
+        """Тест различимости упакованных ходов"""
+        moves = BitboardPosition.initial().generate_moves()
+        packed = {pack_move(move) for move in moves}
+
+        self.assertEqual(len(packed), len(moves))
+        self.assertNotIn(NO_MOVE, packed)
+
+
+class TestSearchWithTable(unittest.TestCase):
+    """Тесты поиска с таблицей транспозиций"""
+
+    def test_mate_score_round_trip(self):
+        """Тест пересчета оценок выигрыша относительно глубины"""
+        for score in (MATE_SCORE - 10, -MATE_SCORE + 12, 150, -40):
+            self.assertEqual(score_from_tt(score_to_tt(score, 6), 6), score)
+        self.assertEqual(score_to_tt(MATE_SCORE - 10, 6), MATE_SCORE - 4)
+
+    def test_table_reduces_nodes(self):
+        """Тест сокращения перебора за счет таблицы"""
+        position = BitboardPosition.initial()
+        ai = AIPlayer(Player.WHITE, max_depth=6, max_time=100, tt_size_mb=0.05)
+
+        first = ai.search(position, 100)
+        second = ai.search(position, 100)
+
+        self.assertEqual(first.depth, 6)
+        self.assertEqual(second.depth, 6)
+        self.assertLess(second.nodes, first.nodes)
+        self.assertIn(second.move, position.generate_moves())
+        self.assertGreater(ai.tt.usage(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame
+from src.utils import create_gradient_surface, gradient_ramp
+
+
+def reference_gradient(width, height, color1, color2, vertical):
+    """Градиент, нарисованный построчно линиями (прежний способ)"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    length = height if vertical else width
+    for i in range(length):
+        ratio = i / length
+        color = tuple(int(color1[c] + (color2[c] - color1[c]) * ratio) for c in range(3))
+        if vertical:
+            pygame.draw.line(surface, color, (0, i), (width, i))
+        else:
+            pygame.draw.line(surface, color, (i, 0), (i, height))
+    return surface
+
+
+class TestGradient(unittest.TestCase):
+    """Тесты построения градиентов"""
+
+    cases = [
+        (100, 100, (220, 190, 150), (210, 180, 140), True),
+        (300, 850, (40, 40, 55), (30, 30, 45), True),
+        (240, 45, (70, 130, 200), (50, 110, 180), False),
+        (7, 3, (0, 0, 0), (255, 255, 255), False),
+    ]
+
+    def test_matches_line_drawing(self):
+        """Тест: градиент совпадает с построчным рисованием"""
+        for width, height, color1, color2, vertical in self.cases:
+            with self.subTest(size=(width, height), vertical=vertical):
+                surface = create_gradient_surface(width, height, color1, color2, vertical)
+                expected = reference_gradient(width, height, color1, color2, vertical)
+                self.assertEqual(surface.get_size(), (width, height))
+                for x in range(0, width, max(1, width // 17)):
+                    for y in range(0, height, max(1, height // 23)):
+                        self.assertEqual(surface.get_at((x, y)), expected.get_at((x, y)), (x, y))
+
+    def test_ramp_without_numpy(self):
+        """Тест: шкала цветов без NumPy совпадает с векторной"""
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("NumPy не установлен")
+        vectorized = gradient_ramp((89, 47, 27), (79, 37, 17), 850)
+        with patch("src.utils.np", None):
+            self.assertEqual(gradient_ramp((89, 47, 27), (79, 37, 17), 850), vectorized)
+
+    def test_memoized(self):
+        """Тест: одинаковый градиент строится один раз"""
+        first = create_gradient_surface(50, 60, (1, 2, 3), (4, 5, 6))
+        self.assertIs(create_gradient_surface(50, 60, (1, 2, 3), (4, 5, 6)), first)
+        self.assertIsNot(create_gradient_surface(50, 60, (1, 2, 3), (4, 5, 6), vertical=False), first)
+
+    def test_empty_size(self):
+        """Тест градиента нулевого размера"""
+        self.assertEqual(create_gradient_surface(0, 10, (0, 0, 0), (1, 1, 1)).get_size(), (0, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+
+# Добавляем путь к родительской директории для импорта модулей
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game_logic import CheckersGame
+from src.bitboard import BitboardPosition
+from src.zobrist import board_key, position_key
+from src.constants import BOARD_SIZE
+from src.enums import PieceType, Player
+from src.models import Piece
+
+
+def play(game, moves):
+    """Выполняет последовательность ходов кликами"""
+    for (fr, fc), (tr, tc) in moves:
+        game.handle_click(fr, fc)
+        game.handle_click(tr, tc)
+
+
+class TestZobristKeys(unittest.TestCase):
+    """Тесты ключей Зобриста"""
+
+    def test_initial_key_matches_bitboard(self):
+        """Тест совпадения ключа игры и битборда в начальной позиции"""
+        game = CheckersGame()
+        self.assertEqual(game.zobrist_key, position_key(BitboardPosition.initial()))
+
+    def test_side_to_move_changes_key(self):
+        """Тест зависимости ключа от стороны хода"""
+        game = CheckersGame()
+        white_key = game.zobrist_key
+        game.current_player = Player.BLACK
+        self.assertNotEqual(game.zobrist_key, white_key)
+
+    def test_transposition_gives_same_key(self):
+        """Тест одинакового ключа при разном порядке ходов"""
+        first = CheckersGame()
+        play(first, [((5, 0), (4, 1)), ((2, 1), (3, 0)), ((5, 6), (4, 7)), ((2, 7), (3, 6))])
+
+        second = CheckersGame()
+        play(second, [((5, 6), (4, 7)), ((2, 7), (3, 6)), ((5, 0), (4, 1)), ((2, 1), (3, 0))])
+
+        self.assertEqual(first.board, second.board)
+        self.assertEqual(first.zobrist_key, second.zobrist_key)
+        self.assertNotEqual(first.zobrist_key, CheckersGame().zobrist_key)
+
+    def test_incremental_key_after_capture_and_promotion(self):
+        """Тест инкрементального обновления ключа при взятии и превращении"""
+        game = CheckersGame()
+        game.board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        game.board[2][3] = Piece(Player.WHITE)
+        game.board[1][2] = Piece(Player.BLACK)
+        game.board[6][1] = Piece(Player.BLACK, PieceType.KING)
+        game.invalidate_moves_cache()
+
+        play(game, [((2, 3), (0, 1))])
+
+        self.assertEqual(game.board[0][1].type, PieceType.KING)
+        self.assertEqual(game._placement_key, board_key(game.board))
+        self.assertEqual(game.zobrist_key, position_key(BitboardPosition.from_game(game)))
+
+
+if __name__ == '__main__':
+    unittest.main()
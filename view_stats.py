@@ -34,6 +34,8 @@ def view_statistics():
         - Количество побед каждого игрока
         - Средние показатели игры
 
+    3. Статистику игроков (победы, поражения, взятые шашки)
+
     Raises:
         Exception: Если не удалось подключиться к базе данных
     """
@@ -70,6 +72,18 @@ def view_statistics():
         print(f"  Среднее оставшееся время белых: {data['avg_white_time']:.1f} сек")
         print(f"  Среднее оставшееся время черных: {data['avg_black_time']:.1f} сек")
 
+    print("\n" + "=" * 100 + "\n")
+
+    players = db_manager.get_player_stats()
+
+    print("Статистика игроков:")
+    print("-" * 50)
+    for name, data in players.items():
+        print(f"\nИгрок: {name}")
+        print(f"  Всего игр: {data['total_games']}")
+        print(f"  Побед: {data['wins']}, поражений: {data['losses']}")
+        print(f"  Взято шашек соперника: {data['total_pieces_taken']}")
+
     db_manager.close()
 
 